@@ -1,18 +1,96 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest, multiprocess
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
+from typing import Dict, Optional
+import asyncio
+import importlib
+import logging
 import os
+import secrets
+import time
 
-from app.routes import predict
+from app.routes import live, predict
+from app.services.availability import get_availability
+from app.services.elo import get_elo_ratings
+from app.services.jobs import register_default_jobs
+from app.services.live_games import get_live_game_service
+from app.services.model_loder import ModelLoader
+from app.services.player_search import get_player_search_index
+from app.services.schedule import get_schedule_table
+from app.services.scheduler import get_scheduler
+from app.services.team_ratings import get_team_ratings
+from app.services.profiler import ProfilerBusyError, sample_stacks, to_collapsed, top_functions
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Heavy dependencies the app imports on first use; warm_up() loads them up front
+WARM_UP_MODULES = ("pandas", "scipy.special", "xgboost")
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    Import heavy dependencies, load models and build the player search index
+
+    Importing app.main stays cheap; this is the explicit phase that pays
+    for everything else. Under gunicorn with preload_app it runs once in the
+    master process, so every forked worker shares the loaded models instead
+    of loading its own. Steps that already ran are free.
+
+    Returns:
+        Seconds spent on each step
+    """
+    loader = ModelLoader()
+    steps = [(f"import {module}", lambda module=module: importlib.import_module(module))
+             for module in WARM_UP_MODULES]
+    steps += [
+        ("game model", loader.get_game_prediction_model),
+        ("player model", loader.get_player_stats_model),
+        ("player projection model", loader.get_player_projection_model),
+        ("player search index", get_player_search_index),
+        ("elo ratings", get_elo_ratings),
+        ("schedule table", get_schedule_table),
+        ("team ratings", get_team_ratings),
+        ("player availability", get_availability),
+    ]
+
+    timings = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - start
+    logger.info("Warm-up finished in %.2fs", sum(timings.values()))
+    return timings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up (unless WARM_UP=false) and start background services"""
+    if os.getenv("WARM_UP", "true").lower() != "false":
+        warm_up()
+    get_live_game_service().prior_provider = live.pregame_prior
+    # Each worker runs its own jobs: the ratings and memos they refresh are per process
+    scheduler = get_scheduler()
+    if os.getenv("SCHEDULER_ENABLED", "true").lower() != "false":
+        if not scheduler.jobs:
+            register_default_jobs(scheduler)
+        scheduler.start()
+    yield
+    await scheduler.stop()
+    await get_live_game_service().stop()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="NBA Prediction API",
     description="Machine Learning API for NBA game predictions and player statistics",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -27,6 +105,7 @@ app.add_middleware(
 
 # Include routers
 app.include_router(predict.router, prefix="/api/v1", tags=["predictions"])
+app.include_router(live.router, prefix="/api/v1", tags=["live"])
 
 
 @app.get("/")
@@ -48,7 +127,89 @@ async def health_check():
         "model_loaded": True  # Update this based on actual model status
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics: per-stage latency, upstream errors, cache lookups, model versions"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # Aggregate the samples written by every gunicorn worker
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+def require_admin(admin_token: Optional[str]):
+    """Reject the request unless it carries the ADMIN_TOKEN from the environment"""
+    expected = os.getenv("ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Admin endpoints are disabled (ADMIN_TOKEN not set)"
+        )
+    if not admin_token or not secrets.compare_digest(admin_token, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin token"
+        )
+
+
+@app.post("/admin/profile", include_in_schema=False)
+async def profile_worker(
+    seconds: float = Query(10.0, gt=0, le=120),
+    interval_ms: float = Query(5.0, ge=1, le=100),
+    format: str = Query("json", pattern="^(json|collapsed)$"),
+    include_idle: bool = False,
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Sample the stacks of this worker for N seconds (admin only)
+
+    format=collapsed returns a collapsed-stack file for flamegraph.pl or
+    speedscope; format=json returns a top-functions summary together with
+    the collapsed stacks.
+    """
+    require_admin(x_admin_token)
+    try:
+        stacks = await asyncio.to_thread(
+            sample_stacks, seconds, interval_ms / 1000, include_idle)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+
+    if format == "collapsed":
+        return PlainTextResponse(
+            to_collapsed(stacks),
+            headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'}
+        )
+    return {
+        "pid": os.getpid(),
+        "seconds": seconds,
+        "samples": sum(stacks.values()),
+        "top_functions": top_functions(stacks),
+        "collapsed": to_collapsed(stacks)
+    }
+
+
+@app.get("/admin/jobs", include_in_schema=False)
+async def job_status(x_admin_token: Optional[str] = Header(None)):
+    """Background jobs of this worker: schedule, last run time, duration and outcome (admin only)"""
+    require_admin(x_admin_token)
+    return {"pid": os.getpid(), "jobs": get_scheduler().status()}
+
+
+@app.post("/admin/jobs/{name}/run", include_in_schema=False)
+async def run_job(name: str, x_admin_token: Optional[str] = Header(None)):
+    """Start a background job now on this worker (admin only)"""
+    require_admin(x_admin_token)
+    scheduler = get_scheduler()
+    if name not in scheduler.jobs:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job {name}")
+    if not scheduler.trigger(name):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Job {name} is already running")
+    return {"pid": os.getpid(), "job": name, "started": True}
+
+
 if __name__ == "__main__":
+    # Development server; use gunicorn.conf.py for multi-worker deployments
     import uvicorn
     port_str = os.getenv("PORT", "8000")
     uvicorn.run(
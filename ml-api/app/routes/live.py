@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Dict, Any, Optional
+import asyncio
+import json
+
+from app.services.data_fetcher import current_game_date, fetch_live_game_data, season_for_date
+from app.services.live_games import get_live_game_service
+from app.services.prediction_store import (
+    compute_home_win_probability,
+    feature_inputs,
+    feature_snapshot_version,
+    get_prediction_store,
+)
+from app.services.serialization import encode_response, negotiate_media_type
+
+router = APIRouter()
+
+KEEPALIVE_SECONDS = 15
+
+
+async def pregame_prior(game: Dict[str, Any]) -> float:
+    """
+    Pre-game home win probability for a live game, as /predict/game gives it
+
+    The materialized prediction when it is current, otherwise computed from
+    the same feature inputs, model and calibration. Used as the prior of
+    the in-game win probability model.
+    """
+    home, away = game["home_team_id"], game["away_team_id"]
+    game_date = datetime.combine(current_game_date(), datetime.min.time())
+    ratings, team_ratings, schedule, availability = await feature_inputs(season_for_date(game_date))
+    version = feature_snapshot_version(ratings, team_ratings, schedule, availability)
+    probability = get_prediction_store().get(home, away, game_date, version)
+    if probability is None:
+        probability = await compute_home_win_probability(
+            home, away, game_date, ratings, team_ratings, schedule, availability)
+    return probability
+
+
+@router.get("/games/live")
+async def get_live_games(accept: Optional[str] = Header(None)):
+    """Get the current state of every game on today's live scoreboard"""
+    media_type = negotiate_media_type(accept)
+    service = get_live_game_service()
+    try:
+        # Without a running poller the cached state may be stale
+        if service.subscriber_count == 0:
+            await service.poll_once()
+        games = list(service.state.values())
+        return encode_response({"games": games, "count": len(games)}, media_type, rows=games)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch live games: {str(e)}"
+        ) from e
+
+
+@router.get("/games/live/stream")
+async def stream_live_games(request: Request):
+    """
+    Stream live scoreboard changes as Server-Sent Events
+
+    The first event is a full "snapshot"; every following "update" event
+    carries only the games and fields that changed since the last poll.
+    """
+    service = get_live_game_service()
+    queue = await service.subscribe()
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+        finally:
+            service.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/games/live/{game_id}")
+async def get_live_game(game_id: str):
+    """Get the live box score state for a single game"""
+    game = await fetch_live_game_data(game_id)
+    if not game:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No live data for game {game_id}"
+        )
+    return game
@@ -1,52 +1,73 @@
-from fastapi import APIRouter, HTTPException, status
-from datetime import datetime
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from datetime import date, datetime
+from typing import Optional
+import asyncio
 
 from app.schemas.predict_request import GamePredictionRequest, PlayerStatsRequest
 from app.schemas.predict_response import GamePredictionResponse, PlayerStatsResponse
-from app.services.data_fetcher import fetch_game_data, fetch_player_stats, get_all_nba_teams, find_player_by_name, get_recent_games
-from app.services.feature_engineering import prepare_game_features, prepare_player_features
+from app.services.availability import get_availability
+from app.services.data_fetcher import MAX_GAME_RANGE_DAYS, current_game_date, season_for_date, fetch_player_stats, get_all_nba_teams, find_player_by_name, get_recent_games, get_games_between, get_current_standings
+from app.services.feature_engineering import prepare_player_features
+from app.services.metrics import observe_stage
 from app.services.model_loder import ModelLoader
+from app.services.player_projection import PROJECTED_STATS, projection_confidence
+from app.services.prediction_store import compute_home_win_probability, feature_inputs, feature_snapshot_version, get_prediction_store, historical_feature_inputs, shared_instance
+from app.services.serialization import encode_response, negotiate_media_type
+from app.services.standings import compute_standings
 
 router = APIRouter()
 model_loader = ModelLoader()
 
 
 @router.post("/predict/game", response_model=GamePredictionResponse)
-async def predict_game(request: GamePredictionRequest):
+async def predict_game(request: GamePredictionRequest, accept: Optional[str] = Header(None)):
     """
     Predict the outcome of an NBA game using current season data and year-ago comparison
 
     Args:
         request: Game prediction request containing team IDs
+        accept: Response format (JSON by default, or MessagePack/Arrow)
 
     Returns:
         GamePredictionResponse with win probability and predicted score
     """
+    media_type = negotiate_media_type(accept)
     try:
-        # Use current date if not provided
-        game_date = request.game_date or datetime.utcnow()
-
-        # Fetch historical game data for both teams (current season + year ago)
-        home_data = await fetch_game_data(request.home_team_id, game_date)
-        away_data = await fetch_game_data(request.away_team_id, game_date)
-
-        # Prepare features for the model
-        features = prepare_game_features(home_data, away_data)
-
-        # Load model and make prediction
-        model = model_loader.get_game_prediction_model()
-        prediction = model.predict_proba(features)
-
-        return GamePredictionResponse(
-            home_team_id=request.home_team_id,
-            away_team_id=request.away_team_id,
-            home_win_probability=float(prediction[0][1]),
-            away_win_probability=float(prediction[0][0]),
-            predicted_home_score=None,  # Implement if you have a regression model
-            predicted_away_score=None,
-            confidence=float(max(prediction[0])),
-            timestamp=datetime.utcnow()
-        )
+        # Today's slate if not provided, as materialize_predictions keys it
+        game_date = request.game_date or datetime.combine(current_game_date(), datetime.min.time())
+
+        if game_date.date() < current_game_date():
+            # A past game is predicted from the ratings as they stood that day
+            with observe_stage("historical_inputs"):
+                ratings, team_ratings, schedule, availability = await asyncio.to_thread(
+                    historical_feature_inputs, game_date.date())
+            home_win_probability = None
+        else:
+            # Scheduled games are usually materialized for the current inputs
+            with observe_stage("prediction_store"):
+                ratings, team_ratings, schedule, availability = await feature_inputs(season_for_date(game_date))
+                version = feature_snapshot_version(ratings, team_ratings, schedule, availability)
+                home_win_probability = get_prediction_store().get(
+                    request.home_team_id, request.away_team_id, game_date, version)
+
+        if home_win_probability is None:
+            home_win_probability = await compute_home_win_probability(
+                request.home_team_id, request.away_team_id, game_date,
+                ratings, team_ratings, schedule, availability)
+
+        with observe_stage("serialization"):
+            response = GamePredictionResponse(
+                home_team_id=request.home_team_id,
+                away_team_id=request.away_team_id,
+                home_win_probability=home_win_probability,
+                away_win_probability=1.0 - home_win_probability,
+                predicted_home_score=None,  # Implement if you have a regression model
+                predicted_away_score=None,
+                # Probability of the predicted winner; calibrated when a table is trained
+                confidence=max(home_win_probability, 1.0 - home_win_probability),
+                timestamp=datetime.utcnow()
+            )
+            return encode_response(response, media_type)
 
     except Exception as e:
         raise HTTPException(
@@ -56,36 +77,72 @@ async def predict_game(request: GamePredictionRequest):
 
 
 @router.post("/predict/player", response_model=PlayerStatsResponse)
-async def predict_player_stats(request: PlayerStatsRequest):
+async def predict_player_stats(request: PlayerStatsRequest, accept: Optional[str] = Header(None)):
     """
     Predict player statistics for upcoming games
 
     Args:
         request: Player stats request containing player ID and game info
+        accept: Response format (JSON by default, or MessagePack/Arrow)
 
     Returns:
-        PlayerStatsResponse with predicted statistics
+        PlayerStatsResponse with predicted statistics, plus P10/P90
+        projections when the projection model is trained
     """
+    media_type = negotiate_media_type(accept)
+    stats_model = model_loader.get_player_stats_model()
+    projection_model = model_loader.get_player_projection_model()
+    if stats_model is None and projection_model is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="No player model has been trained"
+        )
+
     try:
         # Fetch player historical data
-        player_data = await fetch_player_stats(request.player_id, request.game_date)
+        with observe_stage("upstream_fetch"):
+            player_data = await fetch_player_stats(request.player_id, request.game_date)
 
         # Prepare features
-        features = prepare_player_features(
-            player_data, request.opponent_team_id)
-
-        # Load model and make predictions
-        model = model_loader.get_player_stats_model()
-        predictions = model.predict(features)
-
-        return PlayerStatsResponse(
-            player_id=request.player_id,
-            predicted_points=float(predictions[0][0]),
-            predicted_rebounds=float(predictions[0][1]),
-            predicted_assists=float(predictions[0][2]),
-            confidence=0.85,  # Calculate actual confidence
-            timestamp=datetime.utcnow()
-        )
+        with observe_stage("feature_engineering"):
+            # Expected minutes and usage given tonight's injury reports (which
+            # say nothing about past games)
+            if request.game_date.date() >= current_game_date():
+                availability = await shared_instance(get_availability)
+                player_data = availability.adjust_player_form(player_data, request.player_id)
+            features = prepare_player_features(
+                player_data, request.opponent_team_id)
+
+        # The stats model gives the point predictions and the quantile heads
+        # the P10/P90 range; either one alone is enough to answer
+        with observe_stage("model_inference"):
+            # Training uses prepare_player_features column order, so the plain
+            # array is equivalent and skips xgboost's DataFrame conversion
+            point = stats_model.predict(features.to_numpy(dtype=float)) \
+                if stats_model is not None else None
+            projection = projection_model.project(features, point)[0] \
+                if projection_model is not None else None
+
+        with observe_stage("serialization"):
+            if projection is not None:
+                predicted = {stat: values["point"] for stat, values in projection.items()}
+                confidence = projection_confidence(projection)
+            else:
+                predicted = {stat: max(float(value), 0.0)
+                             for stat, value in zip(PROJECTED_STATS, point[0])}
+                confidence = 0.85  # No interval to derive a confidence from
+            response = PlayerStatsResponse(
+                player_id=request.player_id,
+                predicted_points=predicted["points"],
+                predicted_rebounds=predicted["rebounds"],
+                predicted_assists=predicted["assists"],
+                predicted_steals=predicted.get("steals"),
+                predicted_blocks=predicted.get("blocks"),
+                confidence=confidence,
+                projections=projection,
+                timestamp=datetime.utcnow()
+            )
+            return encode_response(response, media_type)
 
     except Exception as e:
         raise HTTPException(
@@ -95,11 +152,12 @@ async def predict_player_stats(request: PlayerStatsRequest):
 
 
 @router.get("/teams")
-async def get_teams():
+async def get_teams(accept: Optional[str] = Header(None)):
     """Get list of all NBA teams from nba_api"""
+    media_type = negotiate_media_type(accept)
     try:
         all_teams = get_all_nba_teams()
-        return {"teams": all_teams}
+        return encode_response({"teams": all_teams}, media_type, rows=all_teams)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -108,11 +166,18 @@ async def get_teams():
 
 
 @router.get("/players/search/{player_name}")
-async def search_players(player_name: str):
-    """Search for players by name"""
+async def search_players(
+    player_name: str,
+    limit: int = Query(25, ge=1, le=100),
+    active_only: bool = False,
+    accept: Optional[str] = Header(None)
+):
+    """Search for players by name (prefix and typo-tolerant matching)"""
+    media_type = negotiate_media_type(accept)
     try:
-        matching_players = find_player_by_name(player_name)
-        return {"players": matching_players}
+        matching_players = find_player_by_name(
+            player_name, limit=limit, active_only=active_only)
+        return encode_response({"players": matching_players}, media_type, rows=matching_players)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -121,11 +186,39 @@ async def search_players(player_name: str):
 
 
 @router.get("/games/recent")
-async def get_recent_nba_games(days_back: int = 3):
-    """Get recent NBA game results from the last N days"""
+async def get_recent_nba_games(
+    days_back: int = Query(3, ge=1, le=MAX_GAME_RANGE_DAYS),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    accept: Optional[str] = Header(None)
+):
+    """
+    Get NBA game results from the last N days, or from an explicit date range
+
+    If start_date is given the range runs from start_date to end_date
+    (defaulting to today) and days_back is ignored. Ranges are limited to
+    MAX_GAME_RANGE_DAYS days.
+    """
+    media_type = negotiate_media_type(accept)
+    if start_date is not None:
+        end_date = end_date or current_game_date()
+        if end_date < start_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="end_date must not be before start_date"
+            )
+        if (end_date - start_date).days + 1 > MAX_GAME_RANGE_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Date range must not exceed {MAX_GAME_RANGE_DAYS} days"
+            )
+
     try:
-        games = await get_recent_games(days_back)
-        return {"games": games, "count": len(games)}
+        if start_date is not None:
+            games = await get_games_between(start_date, end_date)
+        else:
+            games = await get_recent_games(days_back)
+        return encode_response({"games": games, "count": len(games)}, media_type, rows=games)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -134,54 +227,14 @@ async def get_recent_nba_games(days_back: int = 3):
 
 
 @router.get("/standings")
-async def get_standings(season: str = "2025-26"):
+async def get_standings(season: str = "2025-26", accept: Optional[str] = Header(None)):
     """Get current NBA standings by conference"""
+    media_type = negotiate_media_type(accept)
     try:
-        from app.services.data_fetcher import get_current_standings
-
         standings_data = await get_current_standings(season)
-
-        # Separate by conference
-        east_teams = []
-        west_teams = []
-
-        for team in standings_data:
-            team_info = {
-                "team": team.get("TEAM_NAME", ""),
-                "team_id": str(team.get("TEAM_ID", "")),
-                "wins": team.get("W", 0),
-                "losses": team.get("L", 0),
-                "win_pct": round(team.get("W_PCT", 0), 3),
-                "record": f"{team.get('W', 0)}-{team.get('L', 0)}",
-                "logo": f"https://cdn.nba.com/logos/nba/{team.get('TEAM_ID', '')}/global/L/logo.svg"
-            }
-
-            # Determine conference (simple logic based on team name/ID)
-            # Eastern Conference team IDs
-            east_ids = [1610612737, 1610612738, 1610612751, 1610612766, 1610612741,
-                        1610612739, 1610612765, 1610612754, 1610612748, 1610612749,
-                        1610612752, 1610612753, 1610612755, 1610612761, 1610612764]
-
-            if team.get("TEAM_ID") in east_ids:
-                east_teams.append(team_info)
-            else:
-                west_teams.append(team_info)
-
-        # Sort by win percentage
-        east_teams.sort(key=lambda x: x["win_pct"], reverse=True)
-        west_teams.sort(key=lambda x: x["win_pct"], reverse=True)
-
-        # Add rank
-        for i, team in enumerate(east_teams):
-            team["rank"] = i + 1
-        for i, team in enumerate(west_teams):
-            team["rank"] = i + 1
-
-        return {
-            "eastern": east_teams,
-            "western": west_teams,
-            "season": season
-        }
+        standings = compute_standings(standings_data, season)
+        return encode_response(
+            standings, media_type, rows=standings["eastern"] + standings["western"])
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -10,7 +10,8 @@ class GamePredictionRequest(BaseModel):
     away_team_id: int = Field(...,
                               description="NBA team ID for away team", ge=1, le=30)
     game_date: Optional[datetime] = Field(
-        None, description="Date and time of the game (defaults to now)")
+        None, description="Date and time of the game (defaults to today's slate); for a past "
+                          "date every feature uses only games played before it")
 
     class Config:
         json_schema_extra = {
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 
 class GamePredictionResponse(BaseModel):
@@ -34,6 +34,13 @@ class GamePredictionResponse(BaseModel):
         }
 
 
+class StatProjection(BaseModel):
+    """Projected distribution of one stat"""
+    p10: float = Field(..., ge=0.0, description="10th percentile")
+    point: float = Field(..., ge=0.0, description="Point projection (median)")
+    p90: float = Field(..., ge=0.0, description="90th percentile")
+
+
 class PlayerStatsResponse(BaseModel):
     """Response schema for player statistics prediction"""
     player_id: int
@@ -49,6 +56,8 @@ class PlayerStatsResponse(BaseModel):
         None, ge=0.0, description="Predicted blocks")
     confidence: float = Field(..., ge=0.0, le=1.0,
                               description="Model confidence")
+    projections: Optional[Dict[str, StatProjection]] = Field(
+        None, description="P10 / point / P90 per stat (points, rebounds, assists, steals, blocks)")
     timestamp: datetime = Field(..., description="Timestamp of prediction")
 
     class Config:
@@ -61,6 +70,9 @@ class PlayerStatsResponse(BaseModel):
                 "predicted_steals": 1.4,
                 "predicted_blocks": 0.6,
                 "confidence": 0.82,
+                "projections": {
+                    "points": {"p10": 18.0, "point": 27.5, "p90": 36.5}
+                },
                 "timestamp": "2024-12-15T18:30:00Z"
             }
         }
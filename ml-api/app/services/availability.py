@@ -0,0 +1,366 @@
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from datetime import datetime
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+from app.services.data_fetcher import season_for_date
+from app.services.data_source import fetch_frames
+from app.services.elo import team_position
+from app.services.standings import TEAM_INDEX
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Expected share of a player's usual minutes for each reported status
+STATUS_AVAILABILITY = {
+    "available": 1.0,
+    "probable": 0.9,
+    "questionable": 0.5,
+    "doubtful": 0.1,
+    "out": 0.0,
+}
+
+# Points per minute of the bench player who absorbs a missing player's minutes
+REPLACEMENT_POINTS_PER_MINUTE = 0.38
+# Win percentage per point of per-game net rating (about 2.7 wins per point over 82 games)
+WIN_PCT_PER_POINT = 0.033
+# Games of regression to zero applied to a player's on-court plus-minus
+PLUS_MINUS_PRIOR_GAMES = 10.0
+# Cap on how much of a missing teammate's scoring a player can take over
+MAX_USAGE_BOOST = 1.25
+
+# Seconds between checks of the status source for new reports
+AVAILABILITY_POLL_INTERVAL = float(os.getenv("AVAILABILITY_POLL_INTERVAL", "10"))
+# Seconds before player impacts are rebuilt from season stats
+IMPACT_REFRESH_INTERVAL = float(os.getenv("IMPACT_REFRESH_INTERVAL", "21600"))
+# Seconds before a failed rebuild is retried while the previous impacts are kept
+IMPACT_RETRY_INTERVAL = float(os.getenv("IMPACT_RETRY_INTERVAL", "300"))
+
+# Columns of a player's impact vector
+IMPACT_COLUMNS = ("points", "net", "minutes")
+_POINTS, _NET, _MINUTES = range(len(IMPACT_COLUMNS))
+
+# PlayerForm fields that scale with a player's minutes, and those that also
+# grow when teammates' scoring is missing
+_MINUTES_FIELDS = ("avg_points", "avg_rebounds", "avg_assists", "avg_steals", "avg_blocks",
+                   "minutes_per_game", "avg_fga", "avg_fta", "avg_turnovers")
+_USAGE_FIELDS = ("avg_points", "avg_fga", "avg_fta")
+
+
+class NoStatusSource:
+    """Status source with no reports: every rostered player is available"""
+
+    def version(self) -> Any:
+        return None
+
+    def statuses(self) -> List[Dict[str, Any]]:
+        return []
+
+
+class LocalFileStatusSource:
+    """
+    Injury and roster status reports from a local JSON or CSV file
+
+    Stands in for a provider feed. Each report has player_id and status
+    (a STATUS_AVAILABILITY key), and optionally team_id for players who
+    moved since the season stats were fetched. A JSON file holds a list of
+    reports or {"players": [...]}. The file is re-read when it changes.
+
+    Args:
+        path: Report file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def version(self) -> Any:
+        """File modification time, or None when the file is missing"""
+        try:
+            return os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def statuses(self) -> List[Dict[str, Any]]:
+        if self.version() is None:
+            return []
+        if self.path.endswith(".csv"):
+            import pandas as pd
+            return pd.read_csv(self.path).to_dict("records")
+        with open(self.path) as f:
+            data = json.load(f)
+        return data.get("players", []) if isinstance(data, dict) else data
+
+
+_status_source: Optional[Any] = None
+
+
+def get_status_source() -> Any:
+    """Return the configured status source (AVAILABILITY_FILE, or no reports)"""
+    global _status_source
+    if _status_source is None:
+        path = os.getenv("AVAILABILITY_FILE")
+        _status_source = LocalFileStatusSource(path) if path else NoStatusSource()
+    return _status_source
+
+
+def set_status_source(source: Any):
+    """Replace the status source (a provider client, or fixtures in benchmarks)"""
+    global _status_source
+    _status_source = source
+
+
+def player_impacts(stats: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Per-game impact vector of every player from LeagueDashPlayerStats rows
+
+    Args:
+        stats: PerGame rows with PLAYER_ID, TEAM_ID, GP, MIN, PTS and PLUS_MINUS
+
+    Returns:
+        DataFrame with player_id, team_id and IMPACT_COLUMNS: points over a
+        replacement player in the same minutes, on-court net rating shrunk
+        by games played, and minutes (players without a team are dropped)
+    """
+    import pandas as pd
+
+    stats = stats[stats["TEAM_ID"].isin(list(TEAM_INDEX))]
+    games = stats["GP"].to_numpy(dtype=float)
+    minutes = stats["MIN"].to_numpy(dtype=float)
+    return pd.DataFrame({
+        "player_id": stats["PLAYER_ID"].to_numpy(dtype=np.int64),
+        "team_id": stats["TEAM_ID"].to_numpy(dtype=np.int64),
+        "points": stats["PTS"].to_numpy(dtype=float) - minutes * REPLACEMENT_POINTS_PER_MINUTE,
+        "net": stats["PLUS_MINUS"].to_numpy(dtype=float) * games / (games + PLUS_MINUS_PRIOR_GAMES),
+        "minutes": minutes,
+    })
+
+
+class AvailabilityIndex:
+    """
+    Which players each team has tonight, and what their absences cost
+
+    Players are rows of an impact matrix with a team position and an
+    availability (expected share of usual minutes). Team totals are one
+    weighted bincount per impact column over all players, so applying a
+    batch of status reports recomputes every team in well under a
+    millisecond. A team's adjustment is the difference between its
+    available and full-strength totals.
+
+    Args:
+        impacts: player_impacts output
+    """
+
+    def __init__(self, impacts: "pd.DataFrame"):
+        order = np.argsort(impacts["player_id"].to_numpy(), kind="mergesort")
+        self.player_ids = impacts["player_id"].to_numpy(dtype=np.int64)[order]
+        self.season_teams = np.array([team_position(t) for t in impacts["team_id"].to_numpy()[order]],
+                                     dtype=np.int64)
+        self.teams = self.season_teams.copy()
+        self.impacts = impacts[list(IMPACT_COLUMNS)].to_numpy(dtype=float)[order]
+        self.availability = np.ones(len(self.player_ids))
+        self.version: Any = None
+        self._recompute()
+
+    def _rows(self, player_ids: np.ndarray) -> np.ndarray:
+        """Row of each player ID, -1 for players without an impact row"""
+        if not len(self.player_ids):
+            return np.full(len(player_ids), -1)
+        rows = np.minimum(np.searchsorted(self.player_ids, player_ids), len(self.player_ids) - 1)
+        return np.where(self.player_ids[rows] == player_ids, rows, -1)
+
+    def _recompute(self):
+        """Full-strength and available totals of every team, one pass per column"""
+        n_teams = len(TEAM_INDEX)
+        weighted = self.impacts * self.availability[:, None]
+        self.full_totals = np.column_stack([
+            np.bincount(self.teams, weights=self.impacts[:, i], minlength=n_teams)
+            for i in range(len(IMPACT_COLUMNS))])
+        self.available_totals = np.column_stack([
+            np.bincount(self.teams, weights=weighted[:, i], minlength=n_teams)
+            for i in range(len(IMPACT_COLUMNS))])
+
+    def apply_statuses(self, reports: List[Dict[str, Any]]) -> int:
+        """
+        Replace the current reports and recompute every team
+
+        Players without a report are available; unknown statuses count as
+        available and unknown players are ignored.
+
+        Args:
+            reports: Dicts with player_id, status and optional team_id
+
+        Returns:
+            Number of reports matched to a player
+        """
+        self.availability[:] = 1.0
+        self.teams[:] = self.season_teams
+        if not reports:
+            self._recompute()
+            return 0
+        player_ids = np.array([int(r["player_id"]) for r in reports], dtype=np.int64)
+        shares = np.array([STATUS_AVAILABILITY.get(str(r.get("status", "")).lower(), 1.0)
+                           for r in reports])
+        rows = self._rows(player_ids)
+        matched = rows >= 0
+        self.availability[rows[matched]] = shares[matched]
+        for row, report in zip(rows, reports):
+            try:
+                team_id = int(report.get("team_id"))
+            except (TypeError, ValueError):
+                # No team in the report (None, or NaN from a CSV)
+                continue
+            if row >= 0:
+                self.teams[row] = team_position(team_id)
+        self._recompute()
+        return int(matched.sum())
+
+    def available_players(self, team_id: int) -> List[int]:
+        """IDs of a team's players expected to play"""
+        rows = (self.teams == team_position(team_id)) & (self.availability > 0)
+        return self.player_ids[rows].tolist()
+
+    def team_adjustment(self, team_id: int) -> Dict[str, float]:
+        """
+        Change in a team's per-game impact totals from missing players
+
+        Returns:
+            IMPACT_COLUMNS keyed deltas (zero or negative when players are out)
+        """
+        position = team_position(team_id)
+        delta = self.available_totals[position] - self.full_totals[position]
+        return dict(zip(IMPACT_COLUMNS, delta.tolist()))
+
+    def adjust_team_form(self, form: Any, team_id: int) -> Any:
+        """
+        Team form with missing players' impact removed
+
+        Scoring drops by the missing players' points over replacement and
+        the win percentages by their net rating. Full-strength teams are
+        returned unchanged.
+
+        Args:
+            form: TeamForm (or a dict of its fields)
+            team_id: Team the form belongs to
+
+        Returns:
+            The form itself, or an adjusted dict
+        """
+        delta = self.team_adjustment(team_id)
+        if not any(delta.values()):
+            return form
+        adjusted = form.to_dict() if hasattr(form, "to_dict") else dict(form)
+        adjusted["avg_points"] = float(adjusted.get("avg_points", 0) + delta["points"])
+        for name in ("win_percentage", "home_win_percentage", "away_win_percentage"):
+            adjusted[name] = float(np.clip(adjusted.get(name, 0) + delta["net"] * WIN_PCT_PER_POINT, 0, 1))
+        return adjusted
+
+    def adjust_player_form(self, form: Any, player_id: int) -> Any:
+        """
+        Player averages scaled by expected minutes and teammates' absences
+
+        Counting stats scale with the player's own availability; scoring
+        volume also grows by the teammates' missing points over replacement
+        as a share of the team's available scoring, up to MAX_USAGE_BOOST.
+
+        Args:
+            form: PlayerForm (or a dict of its fields)
+            player_id: Player the form belongs to
+
+        Returns:
+            The form itself, or an adjusted dict
+        """
+        row = self._rows(np.array([player_id], dtype=np.int64))[0]
+        if row < 0:
+            return form
+        position, share = self.teams[row], self.availability[row]
+        full, available = self.full_totals[position], self.available_totals[position]
+        # The player's own absence is not a teammate's to absorb
+        missing = full[_POINTS] - available[_POINTS] - self.impacts[row, _POINTS] * (1 - share)
+        team_points = available[_POINTS] + available[_MINUTES] * REPLACEMENT_POINTS_PER_MINUTE
+        usage = min(1.0 + max(missing, 0.0) / max(team_points, 1.0), MAX_USAGE_BOOST)
+        if share == 1.0 and usage == 1.0:
+            return form
+        adjusted = form.to_dict() if hasattr(form, "to_dict") else dict(form)
+        for name in _MINUTES_FIELDS:
+            if name in adjusted:
+                adjusted[name] = float(adjusted[name] * share * (usage if name in _USAGE_FIELDS else 1.0))
+        return adjusted
+
+
+def _no_impacts() -> "pd.DataFrame":
+    """Impact table with no players (every team at full strength)"""
+    import pandas as pd
+    return pd.DataFrame({"player_id": [], "team_id": [], **{name: [] for name in IMPACT_COLUMNS}})
+
+
+def full_strength_availability() -> AvailabilityIndex:
+    """Index with no players out, for past games (status reports only describe today)"""
+    return AvailabilityIndex(_no_impacts())
+
+
+# Index shared by every request in this process, the time (time.monotonic)
+# its impacts are due to be rebuilt and the last status source check
+_index: Optional[AvailabilityIndex] = None
+_impacts_due = 0.0
+_last_poll = 0.0
+
+
+def build_player_impacts(season: Optional[str] = None) -> "pd.DataFrame":
+    """Impact vectors of every player from the season's per-game stats"""
+    season = season or season_for_date(datetime.now().date())
+    stats = fetch_frames("LeagueDashPlayerStats", season=season, per_mode_detailed="PerGame")[0]
+    return player_impacts(stats)
+
+
+def get_availability(refresh: bool = True) -> Optional[AvailabilityIndex]:
+    """
+    Current availability index for this process
+
+    Player impacts are built from season stats on first use and rebuilt
+    every IMPACT_REFRESH_INTERVAL seconds; the status source is checked at
+    most every AVAILABILITY_POLL_INTERVAL seconds and its reports applied
+    when its version changes. A failed rebuild keeps the previous index
+    (and its status reports) and is retried after IMPACT_RETRY_INTERVAL
+    seconds; without stats ever built every team is at full strength.
+
+    Args:
+        refresh: False to return the index as it is without rebuilding or
+            polling anything (None when never built), as the request path does
+    """
+    global _index, _impacts_due, _last_poll
+    if not refresh:
+        return _index
+    now = time.monotonic()
+    if _index is None or now >= _impacts_due:
+        try:
+            impacts = build_player_impacts()
+        except Exception as e:
+            _impacts_due = now + IMPACT_RETRY_INTERVAL
+            if _index is not None:
+                logger.warning(f"Could not rebuild player impacts, keeping the previous ones: {e}")
+            else:
+                logger.warning(f"Could not build player impacts: {e}")
+                _index, _last_poll = AvailabilityIndex(_no_impacts()), 0.0
+        else:
+            _index, _impacts_due, _last_poll = AvailabilityIndex(impacts), now + IMPACT_REFRESH_INTERVAL, 0.0
+
+    if now - _last_poll >= AVAILABILITY_POLL_INTERVAL:
+        _last_poll = now
+        source = get_status_source()
+        version = source.version()
+        if version != _index.version:
+            start = time.perf_counter()
+            try:
+                matched = _index.apply_statuses(source.statuses())
+                _index.version = version
+                logger.info(f"Applied {matched} player status reports in "
+                            f"{(time.perf_counter() - start) * 1000:.2f} ms")
+            except Exception as e:
+                logger.warning(f"Could not read player status reports: {e}")
+    return _index
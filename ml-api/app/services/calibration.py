@@ -0,0 +1,165 @@
+from typing import Any, Dict, List, Optional, Sequence
+import json
+import os
+
+import numpy as np
+
+# Probabilities are clipped away from 0 and 1 before taking logits
+_EPS = 1e-6
+
+
+class ProbabilityCalibrator:
+    """
+    Monotone map from raw model probabilities to calibrated ones
+
+    The map is stored as a small lookup table of (raw, calibrated) knots and
+    applied with np.interp, so calibrating a batch is one vectorized pass
+    and a single prediction costs about a microsecond. Isotonic and Platt
+    fits both reduce to such a table.
+
+    Args:
+        knots: Raw probabilities, increasing
+        values: Calibrated probability at each knot
+        method: How the table was fitted ("isotonic" or "platt")
+        model_version: model_file_version of the game model the table was
+            fitted against; the table only applies to that model
+    """
+
+    def __init__(self, knots: Sequence[float], values: Sequence[float], method: str = "isotonic",
+                 model_version: Optional[str] = None):
+        self.knots = np.asarray(knots, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        self.method = method
+        self.model_version = model_version
+
+    def transform(self, probabilities: Any) -> np.ndarray:
+        """
+        Calibrate raw probabilities
+
+        Args:
+            probabilities: Scalar or array of raw probabilities
+
+        Returns:
+            Calibrated probabilities, same shape
+        """
+        return np.interp(probabilities, self.knots, self.values)
+
+    @classmethod
+    def fit_isotonic(cls, probabilities: np.ndarray, outcomes: np.ndarray) -> "ProbabilityCalibrator":
+        """
+        Fit a non-decreasing step map (needs a few hundred games to be stable)
+
+        Args:
+            probabilities: Raw model probabilities on holdout games
+            outcomes: 1 where the predicted event happened
+
+        Returns:
+            Fitted calibrator
+        """
+        from sklearn.isotonic import IsotonicRegression
+
+        isotonic = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip")
+        isotonic.fit(np.asarray(probabilities, dtype=float), np.asarray(outcomes, dtype=float))
+        return cls(isotonic.X_thresholds_, isotonic.y_thresholds_, "isotonic")
+
+    @classmethod
+    def fit_platt(
+        cls,
+        probabilities: np.ndarray,
+        outcomes: np.ndarray,
+        n_knots: int = 201
+    ) -> "ProbabilityCalibrator":
+        """
+        Fit a logistic curve on the logit of the raw probability, tabulated
+
+        Two parameters, so it is the better choice for small holdout sets.
+
+        Args:
+            probabilities: Raw model probabilities on holdout games
+            outcomes: 1 where the predicted event happened
+            n_knots: Table size; interpolation error is well below 1e-3 at 201
+
+        Returns:
+            Fitted calibrator
+        """
+        from sklearn.linear_model import LogisticRegression
+
+        def logit(p):
+            p = np.clip(p, _EPS, 1 - _EPS)
+            return np.log(p / (1 - p))
+
+        platt = LogisticRegression(C=1e6)
+        platt.fit(logit(np.asarray(probabilities, dtype=float))[:, None], np.asarray(outcomes, dtype=int))
+        knots = np.linspace(0.0, 1.0, n_knots)
+        values = platt.predict_proba(logit(knots)[:, None])[:, 1]
+        return cls(knots, values, "platt")
+
+    def save(self, path: str):
+        """Write the table as JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"method": self.method, "model_version": self.model_version,
+                       "knots": self.knots.tolist(), "values": self.values.tolist()}, f)
+
+    @classmethod
+    def load(cls, path: str) -> "ProbabilityCalibrator":
+        """Read a table written by save()"""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data["knots"], data["values"], data.get("method", "isotonic"),
+                   data.get("model_version"))
+
+
+def brier_score(probabilities: np.ndarray, outcomes: np.ndarray) -> float:
+    """Mean squared error of probabilities against 0/1 outcomes (lower is better)"""
+    probabilities = np.asarray(probabilities, dtype=float)
+    return float(np.mean((probabilities - np.asarray(outcomes, dtype=float)) ** 2))
+
+
+def reliability_curve(
+    probabilities: np.ndarray,
+    outcomes: np.ndarray,
+    n_bins: int = 10
+) -> List[Dict[str, float]]:
+    """
+    Observed outcome rate per predicted-probability bin
+
+    A calibrated model has observed_rate close to mean_predicted in every bin.
+
+    Args:
+        probabilities: Predicted probabilities
+        outcomes: 0/1 outcomes
+        n_bins: Equal-width bins over [0, 1]
+
+    Returns:
+        One dict per non-empty bin: lower, upper, count, mean_predicted,
+        observed_rate
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    outcomes = np.asarray(outcomes, dtype=float)
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    bins = np.clip(np.searchsorted(edges, probabilities, side="right") - 1, 0, n_bins - 1)
+
+    counts = np.bincount(bins, minlength=n_bins)
+    predicted = np.bincount(bins, weights=probabilities, minlength=n_bins)
+    observed = np.bincount(bins, weights=outcomes, minlength=n_bins)
+    return [
+        {
+            "lower": float(edges[b]),
+            "upper": float(edges[b + 1]),
+            "count": int(counts[b]),
+            "mean_predicted": float(predicted[b] / counts[b]),
+            "observed_rate": float(observed[b] / counts[b]),
+        }
+        for b in np.flatnonzero(counts)
+    ]
+
+
+def expected_calibration_error(probabilities: np.ndarray, outcomes: np.ndarray, n_bins: int = 10) -> float:
+    """Count-weighted mean gap between predicted and observed rates over reliability bins"""
+    curve = reliability_curve(probabilities, outcomes, n_bins)
+    total = sum(row["count"] for row in curve)
+    return float(sum(row["count"] * abs(row["mean_predicted"] - row["observed_rate"])
+                     for row in curve) / max(total, 1))
@@ -1,8 +1,161 @@
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
-from nba_api.stats.endpoints import TeamGameLog, PlayerGameLog, CommonTeamRoster, leaguedashteamstats, leaguedashplayerstats, scoreboardv2
-from nba_api.stats.static import teams, players
-import pandas as pd
+from typing import Dict, Any, List, TYPE_CHECKING
+from datetime import date, datetime, timedelta
+import os
+from nba_api.stats.static import teams
+
+from app.services.data_source import fetch_dict, fetch_frames
+from app.services.game_log_index import get_game_log_index
+from app.services.live_games import summarize_game
+from app.services.metrics import record_cache_lookup
+from app.services.player_search import get_player_search_index
+from app.services.records import PlayerForm, TeamForm
+from app.services.scheduler import scheduler_timezone
+from app.services.standings import nba_team_id
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """Raised when data a prediction needs cannot be fetched from nba_api"""
+
+
+# Scoreboard results for days whose games are all final never change
+_final_scoreboard_cache: Dict[date, List[Dict[str, Any]]] = {}
+
+GAME_STATUS_FINAL = 3
+
+
+def _scoreboard_to_games(games_df: "pd.DataFrame", line_score_df: "pd.DataFrame", game_date: date) -> List[Dict[str, Any]]:
+    """
+    Combine a ScoreboardV2 game header and line score into game results
+
+    Line scores are merged onto the game header once and pivoted into
+    home/away columns, instead of filtering the line score per game.
+
+    Args:
+        games_df: GameHeader frame (one row per game)
+        line_score_df: LineScore frame (one row per team per game)
+        game_date: Date the scoreboard was fetched for
+
+    Returns:
+        List of game results with scores and team information
+    """
+    if games_df.empty or line_score_df.empty:
+        return []
+
+    import numpy as np
+
+    header = games_df[['GAME_ID', 'GAME_STATUS_ID', 'GAME_STATUS_TEXT',
+                       'HOME_TEAM_ID', 'VISITOR_TEAM_ID']].drop_duplicates('GAME_ID')
+    lines = line_score_df[['GAME_ID', 'TEAM_ID', 'TEAM_NAME', 'PTS']].merge(
+        header, on='GAME_ID')
+    lines['SIDE'] = np.where(
+        lines['TEAM_ID'] == lines['HOME_TEAM_ID'], 'HOME', 'AWAY')
+
+    games = lines.pivot(index='GAME_ID', columns='SIDE',
+                        values=['TEAM_ID', 'TEAM_NAME', 'PTS'])
+    games.columns = [f"{side}_{field}" for field, side in games.columns]
+    games = games.join(header.set_index('GAME_ID')[['GAME_STATUS_ID', 'GAME_STATUS_TEXT']])
+    games = games.dropna(subset=['HOME_PTS', 'AWAY_PTS'])
+
+    date_label = game_date.strftime('%b %d, %Y')
+    return [
+        {
+            'date': date_label,
+            'home_team': {
+                'name': game.HOME_TEAM_NAME,
+                'id': str(game.HOME_TEAM_ID),
+                'score': int(game.HOME_PTS)
+            },
+            'away_team': {
+                'name': game.AWAY_TEAM_NAME,
+                'id': str(game.AWAY_TEAM_ID),
+                'score': int(game.AWAY_PTS)
+            },
+            'status': 'Final' if game.GAME_STATUS_ID == GAME_STATUS_FINAL else str(game.GAME_STATUS_TEXT).strip()
+        }
+        for game in games.itertuples()
+    ]
+
+
+async def get_games_for_date(game_date: date) -> List[Dict[str, Any]]:
+    """
+    Fetch NBA game results for a single day
+
+    Days in the past whose games are all final are cached permanently.
+
+    Args:
+        game_date: Day to fetch
+
+    Returns:
+        List of game results with scores and team information
+    """
+    cached = _final_scoreboard_cache.get(game_date)
+    record_cache_lookup("scoreboard", cached is not None)
+    if cached is not None:
+        return cached
+
+    frames = fetch_frames(
+        "ScoreboardV2", game_date=game_date.strftime('%m/%d/%Y'))
+    games_df, line_score_df = frames[0], frames[1]
+
+    games = _scoreboard_to_games(games_df, line_score_df, game_date)
+
+    all_final = games_df.empty or bool(
+        (games_df['GAME_STATUS_ID'] == GAME_STATUS_FINAL).all())
+    if all_final and game_date < current_game_date():
+        _final_scoreboard_cache[game_date] = games
+
+    return games
+
+
+# Longest date range served by get_games_between (one scoreboard fetch per day)
+MAX_GAME_RANGE_DAYS = 31
+
+
+def current_game_date() -> date:
+    """
+    Today's slate date, in the scheduler time zone (US Eastern by default)
+
+    Schedule days are Eastern dates and the UTC date rolls over during
+    evening games, so routes, the prediction store and the scheduled jobs
+    all take "today" from here. SLATE_DATE (YYYY-MM-DD) pins it, so replayed
+    or fixture data from another season is served as upcoming games.
+    """
+    pinned = os.getenv("SLATE_DATE")
+    if pinned:
+        return date.fromisoformat(pinned)
+    return datetime.now(scheduler_timezone()).date()
+
+
+async def get_games_between(start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    """
+    Fetch NBA game results for every day in a date range, newest day first
+
+    Args:
+        start_date: First day of the range (inclusive)
+        end_date: Last day of the range (inclusive)
+
+    Returns:
+        List of game results with scores and team information
+
+    Raises:
+        ValueError: If the range spans more than MAX_GAME_RANGE_DAYS days
+    """
+    if (end_date - start_date).days + 1 > MAX_GAME_RANGE_DAYS:
+        raise ValueError(f"Date range longer than {MAX_GAME_RANGE_DAYS} days")
+    games_list = []
+
+    for offset in range((end_date - start_date).days + 1):
+        game_date = end_date - timedelta(days=offset)
+        try:
+            games_list.extend(await get_games_for_date(game_date))
+        except Exception as e:
+            print(f"Error fetching games for {game_date:%m/%d/%Y}: {e}")
+            continue
+
+    return games_list
 
 
 async def get_recent_games(days_back: int = 3) -> List[Dict[str, Any]]:
@@ -15,50 +168,9 @@ async def get_recent_games(days_back: int = 3) -> List[Dict[str, Any]]:
     Returns:
         List of game results with scores and team information
     """
-    games_list = []
-
     try:
-        # Get games from the last few days
-        for i in range(days_back):
-            game_date = datetime.now() - timedelta(days=i)
-            date_str = game_date.strftime('%m/%d/%Y')
-
-            try:
-                scoreboard = scoreboardv2.ScoreboardV2(game_date=date_str)
-                games_df = scoreboard.get_data_frames()[0]
-                line_score_df = scoreboard.get_data_frames()[1]
-
-                if not games_df.empty:
-                    # Process each game
-                    for _, game in games_df.iterrows():
-                        game_id = game['GAME_ID']
-
-                        # Get team scores from line_score
-                        game_scores = line_score_df[line_score_df['GAME_ID'] == game_id]
-
-                        if len(game_scores) == 2:
-                            home_team = game_scores.iloc[1]
-                            away_team = game_scores.iloc[0]
-
-                            games_list.append({
-                                'date': game_date.strftime('%b %d, %Y'),
-                                'home_team': {
-                                    'name': home_team['TEAM_NAME'],
-                                    'id': str(home_team['TEAM_ID']),
-                                    'score': int(home_team['PTS'])
-                                },
-                                'away_team': {
-                                    'name': away_team['TEAM_NAME'],
-                                    'id': str(away_team['TEAM_ID']),
-                                    'score': int(away_team['PTS'])
-                                },
-                                'status': 'Final'
-                            })
-            except Exception as e:
-                print(f"Error fetching games for {date_str}: {e}")
-                continue
-
-        return games_list
+        today = current_game_date()
+        return await get_games_between(today - timedelta(days=days_back - 1), today)
     except Exception as e:
         print(f"Error in get_recent_games: {e}")
         return []
@@ -67,12 +179,13 @@ async def get_recent_games(days_back: int = 3) -> List[Dict[str, Any]]:
 async def get_current_standings(season: str = "2025-26") -> List[Dict[str, Any]]:
     """
     Fetch current season standings
+
+    Rows are returned unordered; ranking and tiebreakers are applied by
+    app.services.standings.compute_standings.
     """
     try:
-        team_stats = leaguedashteamstats.LeagueDashTeamStats(season=season)
-        df_teams = team_stats.get_data_frames()[0]
-        top_teams = df_teams.sort_values(by='W_PCT', ascending=False)
-        return top_teams.to_dict('records')
+        df_teams = fetch_frames("LeagueDashTeamStats", season=season)[0]
+        return df_teams.to_dict('records')
     except Exception as e:
         print(f"Error fetching standings: {e}")
         return []
@@ -83,9 +196,8 @@ async def get_top_players(season: str = "2025-26") -> List[Dict[str, Any]]:
     Fetch top players for the current season
     """
     try:
-        player_stats = leaguedashplayerstats.LeagueDashPlayerStats(
-            season=season, per_mode_detailed='PerGame')
-        df_players = player_stats.get_data_frames()[0]
+        df_players = fetch_frames(
+            "LeagueDashPlayerStats", season=season, per_mode_detailed='PerGame')[0]
         top_players = df_players.sort_values(
             by='PTS', ascending=False).head(50)
         return top_players.to_dict('records')
@@ -94,114 +206,137 @@ async def get_top_players(season: str = "2025-26") -> List[Dict[str, Any]]:
         return []
 
 
-async def fetch_game_data(team_id: int, game_date: datetime, games_back: int = 10) -> Dict[str, Any]:
+def _parse_game_date(value: Any) -> datetime:
+    """Parse a game log GAME_DATE ("JAN 15, 2026"), falling back to pandas for other formats"""
+    try:
+        return datetime.strptime(value.title(), '%b %d, %Y')
+    except (AttributeError, ValueError):
+        import pandas as pd
+        return pd.to_datetime(value).to_pydatetime()
+
+
+def season_for_date(game_date: date) -> str:
+    """Season string ("2025-26") a date falls in; seasons start in October"""
+    year = game_date.year
+    return f"{year}-{str(year + 1)[-2:]}" if game_date.month >= 10 else f"{year - 1}-{str(year)[-2:]}"
+
+
+def team_form_from_log(team_id: int, df: "pd.DataFrame", game_date: datetime, games_back: int = 10) -> TeamForm:
     """
-    Fetch historical game data for a team using nba_api
+    Aggregate a team's TeamGameLog rows into recent-form features
 
     Args:
         team_id: NBA team ID
+        df: TeamGameLog rows, newest game first
+        game_date: Date of the upcoming game (rest days are counted to it)
+        games_back: Number of previous games to aggregate
+
+    Returns:
+        TeamForm over the first `games_back` rows
+    """
+    if df.empty:
+        # Return default values if no data
+        return TeamForm(team_id)
+
+    # Get recent games (last N games)
+    recent_games = df.head(games_back)
+
+    # Calculate statistics
+    avg_points = recent_games['PTS'].mean()
+    avg_points_allowed = recent_games['OPP_PTS'].mean(
+    ) if 'OPP_PTS' in recent_games.columns else 0
+
+    # Win/loss and home/away flags as plain arrays (one pass each)
+    import numpy as np
+    won = recent_games['WL'].to_numpy() == 'W'
+    home = np.fromiter(('vs.' in matchup for matchup in recent_games['MATCHUP']),
+                       dtype=bool, count=len(recent_games))
+
+    win_percentage = won.mean()
+    home_win_pct = won[home].mean() if home.any() else 0
+    away_win_pct = won[~home].mean() if (~home).any() else 0
+
+    # Last 5 games record
+    last_5_wins = int(won[:5].sum())
+    last_5_record = f"{last_5_wins}-{min(len(won), 5) - last_5_wins}"
+
+    # Calculate rest days (days since last game)
+    last_game_date = _parse_game_date(recent_games['GAME_DATE'].iat[0])
+    rest_days = (game_date - last_game_date).days
+
+    return TeamForm(
+        team_id=team_id,
+        avg_points=float(avg_points),
+        avg_points_allowed=float(avg_points_allowed),
+        win_percentage=float(win_percentage),
+        home_win_percentage=float(home_win_pct),
+        away_win_percentage=float(away_win_pct),
+        last_5_record=last_5_record,
+        rest_days=int(rest_days),
+        game_log=recent_games
+    )
+
+
+async def fetch_game_data(team_id: int, game_date: datetime, games_back: int = 10) -> TeamForm:
+    """
+    Fetch historical game data for a team using nba_api
+
+    See load_game_data; code off the event loop calls that directly.
+    """
+    return load_game_data(team_id, game_date, games_back)
+
+
+def load_game_data(team_id: int, game_date: datetime, games_back: int = 10) -> TeamForm:
+    """
+    Recent form of a team before a date, from its (blocking) TeamGameLog fetch
+
+    Only games played before game_date count, so a past date gets the form
+    the team had going into that game.
+
+    Args:
+        team_id: NBA team ID, or the API's 1-30 team number
         game_date: Date of the upcoming game
         games_back: Number of previous games to fetch
 
     Returns:
-        Dictionary containing team statistics and recent performance
+        TeamForm with the team's recent-form aggregates over the last
+        `games_back` games before game_date; the underlying game log rows
+        are available through its lazy `games` attribute
+
+    Raises:
+        UpstreamUnavailableError: If the game log cannot be fetched
     """
     try:
-        # Get current season
-        current_year = game_date.year
-        season = f"{current_year}-{str(current_year + 1)[-2:]}" if game_date.month >= 10 else f"{current_year - 1}-{str(current_year)[-2:]}"
-
+        # TeamGameLog (and the cache keys prewarm_caches fills) take NBA team IDs
+        team_id = nba_team_id(team_id)
         # Fetch team game log
-        gamelog = TeamGameLog(
+        season = season_for_date(game_date)
+        df = fetch_frames(
+            "TeamGameLog",
             team_id=team_id,
             season=season,
             season_type_all_star="Regular Season"
-        )
-
-        df = gamelog.get_data_frames()[0]
+        )[0]
 
-        if df.empty:
-            # Return default values if no data
-            return {
-                "team_id": team_id,
-                "games": [],
-                "avg_points": 0,
-                "avg_points_allowed": 0,
-                "win_percentage": 0,
-                "home_win_percentage": 0,
-                "away_win_percentage": 0,
-                "last_5_record": "0-0",
-                "rest_days": 0
-            }
-
-        # Get recent games (last N games)
-        recent_games = df.head(games_back)
-
-        # Calculate statistics
-        avg_points = recent_games['PTS'].mean()
-        avg_points_allowed = recent_games['OPP_PTS'].mean(
-        ) if 'OPP_PTS' in recent_games.columns else 0
-
-        # Calculate win percentage
-        wins = (recent_games['WL'] == 'W').sum()
-        win_percentage = wins / \
-            len(recent_games) if len(recent_games) > 0 else 0
-
-        # Home/Away splits
-        home_games = recent_games[recent_games['MATCHUP'].str.contains('vs.')]
-        away_games = recent_games[recent_games['MATCHUP'].str.contains('@')]
-
-        home_wins = (home_games['WL'] == 'W').sum() if len(
-            home_games) > 0 else 0
-        away_wins = (away_games['WL'] == 'W').sum() if len(
-            away_games) > 0 else 0
-
-        home_win_pct = home_wins / \
-            len(home_games) if len(home_games) > 0 else 0
-        away_win_pct = away_wins / \
-            len(away_games) if len(away_games) > 0 else 0
-
-        # Last 5 games record
-        last_5 = recent_games.head(5)
-        last_5_wins = (last_5['WL'] == 'W').sum()
-        last_5_record = f"{last_5_wins}-{len(last_5) - last_5_wins}"
-
-        # Calculate rest days (days since last game)
-        if len(recent_games) > 0:
-            last_game_date = pd.to_datetime(recent_games.iloc[0]['GAME_DATE'])
-            rest_days = (game_date - last_game_date).days
-        else:
-            rest_days = 0
-
-        return {
-            "team_id": team_id,
-            "games": recent_games.to_dict('records'),
-            "avg_points": float(avg_points),
-            "avg_points_allowed": float(avg_points_allowed),
-            "win_percentage": float(win_percentage),
-            "home_win_percentage": float(home_win_pct),
-            "away_win_percentage": float(away_win_pct),
-            "last_5_record": last_5_record,
-            "rest_days": int(rest_days)
-        }
+        recent_games = get_game_log_index("TeamGameLog", team_id, season, df).before(game_date, games_back)
+        return team_form_from_log(team_id, recent_games, game_date, games_back)
 
     except Exception as e:
         print(f"Error fetching game data: {e}")
-        # Return default values on error
-        return {
-            "team_id": team_id,
-            "games": [],
-            "avg_points": 110.0,
-            "avg_points_allowed": 108.0,
-            "win_percentage": 0.500,
-            "home_win_percentage": 0.550,
-            "away_win_percentage": 0.450,
-            "last_5_record": "3-2",
-            "rest_days": 2
-        }
+        # Callers fall back to Elo ratings rather than made-up averages
+        raise UpstreamUnavailableError(f"Game log for team {team_id} unavailable: {e}") from e
 
 
-async def fetch_player_stats(player_id: int, game_date: datetime, games_back: int = 10) -> Dict[str, Any]:
+# Game log columns averaged by fetch_player_stats, mapped to PlayerForm fields
+_PLAYER_AVERAGE_COLUMNS = {
+    'PTS': 'avg_points', 'REB': 'avg_rebounds', 'AST': 'avg_assists',
+    'STL': 'avg_steals', 'BLK': 'avg_blocks', 'FG_PCT': 'fg_percentage',
+    'FG3_PCT': 'three_pt_percentage', 'FT_PCT': 'ft_percentage',
+    'MIN': 'minutes_per_game', 'FGA': 'avg_fga', 'FTA': 'avg_fta', 'TOV': 'avg_turnovers',
+}
+
+
+async def fetch_player_stats(player_id: int, game_date: datetime, games_back: int = 10) -> PlayerForm:
     """
     Fetch historical player statistics using nba_api
 
@@ -211,100 +346,60 @@ async def fetch_player_stats(player_id: int, game_date: datetime, games_back: in
         games_back: Number of previous games to fetch
 
     Returns:
-        Dictionary containing player statistics and trends
+        PlayerForm with the player's averages over the last `games_back`
+        games before game_date; the underlying game log rows are available
+        through its lazy `games` attribute
     """
     try:
-        # Get current season
-        current_year = game_date.year
-        season = f"{current_year}-{str(current_year + 1)[-2:]}" if game_date.month >= 10 else f"{current_year - 1}-{str(current_year)[-2:]}"
+        season = season_for_date(game_date)
 
         # Fetch player game log
-        gamelog = PlayerGameLog(
+        df = fetch_frames(
+            "PlayerGameLog",
             player_id=player_id,
             season=season,
             season_type_all_star="Regular Season"
+        )[0]
+
+        # Only games played before the date, so past dates see no later games
+        index = get_game_log_index("PlayerGameLog", player_id, season, df)
+        recent_games = index.before(game_date, games_back)
+        if recent_games.empty:
+            return PlayerForm(player_id)
+
+        # Average every needed column in one pass over a float matrix,
+        # skipping missing values like DataFrame.mean
+        import numpy as np
+        values = recent_games[list(_PLAYER_AVERAGE_COLUMNS)].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        averages = np.where(present, values, 0).sum(axis=0) / np.maximum(present.sum(axis=0), 1)
+
+        return PlayerForm(
+            player_id=player_id,
+            games_played=index.count_before(game_date),
+            game_log=recent_games,
+            **{name: float(value) for name, value in zip(_PLAYER_AVERAGE_COLUMNS.values(), averages)}
         )
 
-        df = gamelog.get_data_frames()[0]
-
-        if df.empty:
-            return {
-                "player_id": player_id,
-                "games": [],
-                "avg_points": 0,
-                "avg_rebounds": 0,
-                "avg_assists": 0,
-                "avg_steals": 0,
-                "avg_blocks": 0,
-                "fg_percentage": 0,
-                "three_pt_percentage": 0,
-                "ft_percentage": 0,
-                "minutes_per_game": 0,
-                "games_played": 0,
-                "avg_fga": 0,
-                "avg_fta": 0,
-                "avg_turnovers": 0
-            }
-
-        # Get recent games
-        recent_games = df.head(games_back)
-
-        # Calculate averages
-        avg_points = recent_games['PTS'].mean()
-        avg_rebounds = recent_games['REB'].mean()
-        avg_assists = recent_games['AST'].mean()
-        avg_steals = recent_games['STL'].mean()
-        avg_blocks = recent_games['BLK'].mean()
-        avg_minutes = recent_games['MIN'].mean()
-
-        # Calculate shooting percentages
-        fg_pct = recent_games['FG_PCT'].mean()
-        fg3_pct = recent_games['FG3_PCT'].mean()
-        ft_pct = recent_games['FT_PCT'].mean()
-
-        # Additional stats for calculations
-        avg_fga = recent_games['FGA'].mean()
-        avg_fta = recent_games['FTA'].mean()
-        avg_tov = recent_games['TOV'].mean()
-
-        return {
-            "player_id": player_id,
-            "games": recent_games.to_dict('records'),
-            "avg_points": float(avg_points),
-            "avg_rebounds": float(avg_rebounds),
-            "avg_assists": float(avg_assists),
-            "avg_steals": float(avg_steals),
-            "avg_blocks": float(avg_blocks),
-            "fg_percentage": float(fg_pct),
-            "three_pt_percentage": float(fg3_pct),
-            "ft_percentage": float(ft_pct),
-            "minutes_per_game": float(avg_minutes),
-            "games_played": len(df),
-            "avg_fga": float(avg_fga),
-            "avg_fta": float(avg_fta),
-            "avg_turnovers": float(avg_tov)
-        }
-
     except Exception as e:
         print(f"Error fetching player stats: {e}")
         # Return default values
-        return {
-            "player_id": player_id,
-            "games": [],
-            "avg_points": 20.0,
-            "avg_rebounds": 5.0,
-            "avg_assists": 4.0,
-            "avg_steals": 1.0,
-            "avg_blocks": 0.5,
-            "fg_percentage": 0.450,
-            "three_pt_percentage": 0.350,
-            "ft_percentage": 0.800,
-            "minutes_per_game": 30.0,
-            "games_played": 0,
-            "avg_fga": 15.0,
-            "avg_fta": 4.0,
-            "avg_turnovers": 2.0
-        }
+        return PlayerForm(
+            player_id=player_id,
+            avg_points=20.0,
+            avg_rebounds=5.0,
+            avg_assists=4.0,
+            avg_steals=1.0,
+            avg_blocks=0.5,
+            fg_percentage=0.450,
+            three_pt_percentage=0.350,
+            ft_percentage=0.800,
+            minutes_per_game=30.0,
+            games_played=0,
+            avg_fga=15.0,
+            avg_fta=4.0,
+            avg_turnovers=2.0
+        )
 
 
 async def fetch_team_roster(team_id: int) -> List[Dict[str, Any]]:
@@ -318,8 +413,7 @@ async def fetch_team_roster(team_id: int) -> List[Dict[str, Any]]:
         List of players on the team
     """
     try:
-        roster = CommonTeamRoster(team_id=team_id, season="2025-26")
-        df = roster.get_data_frames()[0]
+        df = fetch_frames("CommonTeamRoster", team_id=team_id, season="2025-26")[0]
 
         if df.empty:
             return []
@@ -338,17 +432,14 @@ async def fetch_live_game_data(game_id: str) -> Dict[str, Any]:
         game_id: NBA game ID
 
     Returns:
-        Current game state and statistics
+        Current game state (score, period, clock) and team box score totals
     """
     try:
-        # Note: Live data requires different endpoints
-        # This is a placeholder for future implementation
-        # You can use BoxScoreTraditionalV2 or ScoreboardV2
-        return {
-            "game_id": game_id,
-            "status": "placeholder",
-            "message": "Live game data endpoint to be implemented"
-        }
+        box = fetch_dict("BoxScore", game_id=game_id)["game"]
+        state = summarize_game(box)
+        state["home_statistics"] = box.get("homeTeam", {}).get("statistics", {})
+        state["away_statistics"] = box.get("awayTeam", {}).get("statistics", {})
+        return state
     except Exception as e:
         print(f"Error fetching live game data: {e}")
         return {}
@@ -369,19 +460,21 @@ def get_all_nba_teams() -> List[Dict[str, Any]]:
         return []
 
 
-def find_player_by_name(player_name: str) -> List[Dict[str, Any]]:
+def find_player_by_name(player_name: str, limit: int = 25, active_only: bool = False) -> List[Dict[str, Any]]:
     """
     Search for players by name
 
     Args:
         player_name: Player's full or partial name
+        limit: Maximum number of players to return
+        active_only: Only return currently active players
 
     Returns:
-        List of matching players
+        List of matching players, best matches first
     """
     try:
-        all_players = players.find_players_by_full_name(player_name)
-        return all_players
+        return get_player_search_index().search(
+            player_name, limit=limit, active_only=active_only)
     except Exception as e:
         print(f"Error finding player: {e}")
         return []
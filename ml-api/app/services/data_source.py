@@ -0,0 +1,219 @@
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+import hashlib
+import importlib
+import json
+import logging
+import os
+import random
+import time
+
+from app.services.metrics import observe_upstream, record_cache_lookup
+from app.services.shared_cache import SharedCache, get_shared_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# nba_api endpoint classes by name; imported on first use
+STATS_ENDPOINTS = {
+    "TeamGameLog": "nba_api.stats.endpoints.teamgamelog",
+    "PlayerGameLog": "nba_api.stats.endpoints.playergamelog",
+    "LeagueGameLog": "nba_api.stats.endpoints.leaguegamelog",
+    "CommonTeamRoster": "nba_api.stats.endpoints.commonteamroster",
+    "LeagueDashTeamStats": "nba_api.stats.endpoints.leaguedashteamstats",
+    "LeagueDashPlayerStats": "nba_api.stats.endpoints.leaguedashplayerstats",
+    "ScoreboardV2": "nba_api.stats.endpoints.scoreboardv2",
+    "ScheduleLeagueV2": "nba_api.stats.endpoints.scheduleleaguev2",
+}
+LIVE_ENDPOINTS = {
+    "BoxScore": "nba_api.live.nba.endpoints.boxscore",
+    "ScoreBoard": "nba_api.live.nba.endpoints.scoreboard",
+}
+
+
+class FixtureNotFoundError(KeyError):
+    """Raised in replay mode when no recording exists for a request"""
+
+
+def _endpoint_class(endpoint: str):
+    module_path = STATS_ENDPOINTS.get(endpoint) or LIVE_ENDPOINTS.get(endpoint)
+    if module_path is None:
+        raise ValueError(f"Unknown nba_api endpoint: {endpoint}")
+    return getattr(importlib.import_module(module_path), endpoint)
+
+
+def request_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Stable file name for an endpoint call"""
+    payload = json.dumps({"endpoint": endpoint, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+class NbaApiSource:
+    """Fetch data from stats.nba.com / cdn.nba.com through nba_api"""
+
+    def fetch(self, endpoint: str, **params) -> List["pd.DataFrame"]:
+        return _endpoint_class(endpoint)(**params).get_data_frames()
+
+    def fetch_dict(self, endpoint: str, **params) -> Dict[str, Any]:
+        return _endpoint_class(endpoint)(**params).get_dict()
+
+
+class RecordingSource:
+    """
+    Pass requests through to another source and save every response to disk
+
+    Responses are written to <directory>/<endpoint>/<request key>.json
+    together with the request parameters, in the format ReplaySource reads.
+    """
+
+    def __init__(self, source: Any, directory: str):
+        self.source = source
+        self.directory = directory
+
+    def _write(self, endpoint: str, params: Dict[str, Any], payload: Dict[str, Any]):
+        folder = os.path.join(self.directory, endpoint)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{request_key(endpoint, params)}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"endpoint": endpoint, "params": params, **payload}, f, default=str)
+        os.replace(tmp_path, path)
+
+    def fetch(self, endpoint: str, **params) -> List["pd.DataFrame"]:
+        frames = self.source.fetch(endpoint, **params)
+        self._write(endpoint, params, {"frames": [
+            json.loads(df.to_json(orient="split", index=False)) for df in frames
+        ]})
+        return frames
+
+    def fetch_dict(self, endpoint: str, **params) -> Dict[str, Any]:
+        data = self.source.fetch_dict(endpoint, **params)
+        self._write(endpoint, params, {"dict": data})
+        return data
+
+
+class ReplaySource:
+    """
+    Serve responses saved by RecordingSource, with optional artificial latency
+
+    Args:
+        directory: Recording directory
+        latency_ms: Delay added to every request, to mimic upstream latency
+        jitter_ms: Uniform random extra delay on top of latency_ms
+    """
+
+    def __init__(self, directory: str, latency_ms: float = 0.0, jitter_ms: float = 0.0):
+        self.directory = directory
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+
+    def _read(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        path = os.path.join(self.directory, endpoint, f"{request_key(endpoint, params)}.json")
+        if not os.path.exists(path):
+            raise FixtureNotFoundError(f"No recording for {endpoint} {params} in {self.directory}")
+        delay = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+        with open(path) as f:
+            return json.load(f)
+
+    def fetch(self, endpoint: str, **params) -> List["pd.DataFrame"]:
+        import pandas as pd
+        recording = self._read(endpoint, params)
+        return [pd.DataFrame(frame["data"], columns=frame["columns"]) for frame in recording["frames"]]
+
+    def fetch_dict(self, endpoint: str, **params) -> Dict[str, Any]:
+        return self._read(endpoint, params)["dict"]
+
+
+# Seconds a response stays in the shared cache. Game logs and standings only
+# change when a game goes final; live endpoints are never cached.
+SHARED_CACHE_TTL = {
+    "TeamGameLog": 900,
+    "PlayerGameLog": 900,
+    "LeagueGameLog": 900,
+    "CommonTeamRoster": 3600,
+    "LeagueDashTeamStats": 300,
+    "LeagueDashPlayerStats": 300,
+    "ScoreboardV2": 60,
+    "ScheduleLeagueV2": 21600,
+}
+
+
+class CachingSource:
+    """
+    Serve repeated requests from the cross-process SharedCache
+
+    A response fetched by any worker is reused by every worker until its
+    endpoint's TTL in SHARED_CACHE_TTL expires.
+    """
+
+    def __init__(self, source: Any, cache: SharedCache):
+        self.source = source
+        self.cache = cache
+
+    def fetch(self, endpoint: str, **params) -> List["pd.DataFrame"]:
+        ttl = SHARED_CACHE_TTL.get(endpoint)
+        if ttl is None:
+            return self.source.fetch(endpoint, **params)
+
+        key = f"{endpoint}:{request_key(endpoint, params)}"
+        frames = self.cache.get(key)
+        record_cache_lookup("shared", frames is not None)
+        if frames is None:
+            frames = self.source.fetch(endpoint, **params)
+            self.cache.set(key, frames, ttl)
+        return frames
+
+    def fetch_dict(self, endpoint: str, **params) -> Dict[str, Any]:
+        return self.source.fetch_dict(endpoint, **params)
+
+
+_data_source: Optional[Any] = None
+
+
+def get_data_source() -> Any:
+    """
+    Return the configured data source
+
+    NBA_DATA_MODE selects the mode: "live" (default) calls nba_api, "record"
+    calls nba_api and saves responses under NBA_FIXTURE_DIR, and "replay"
+    serves saved responses from NBA_FIXTURE_DIR with NBA_REPLAY_LATENCY_MS
+    of artificial latency. If SHARED_CACHE_PATH is set, the source is
+    fronted by the cross-process shared cache.
+    """
+    global _data_source
+    if _data_source is None:
+        mode = os.getenv("NBA_DATA_MODE", "live").lower()
+        directory = os.getenv("NBA_FIXTURE_DIR", "fixtures")
+        if mode == "record":
+            _data_source = RecordingSource(NbaApiSource(), directory)
+        elif mode == "replay":
+            _data_source = ReplaySource(
+                directory, latency_ms=float(os.getenv("NBA_REPLAY_LATENCY_MS", "0")))
+        else:
+            _data_source = NbaApiSource()
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            _data_source = CachingSource(_data_source, shared_cache)
+        logger.info(f"Using {type(_data_source).__name__} for NBA data")
+    return _data_source
+
+
+def set_data_source(source: Any):
+    """Replace the data source (used by benchmarks and offline tooling)"""
+    global _data_source
+    _data_source = source
+
+
+def fetch_frames(endpoint: str, **params) -> List["pd.DataFrame"]:
+    """Fetch an nba_api stats endpoint's result sets through the configured source"""
+    with observe_upstream(endpoint):
+        return get_data_source().fetch(endpoint, **params)
+
+
+def fetch_dict(endpoint: str, **params) -> Dict[str, Any]:
+    """Fetch an nba_api live endpoint's JSON through the configured source"""
+    with observe_upstream(endpoint):
+        return get_data_source().fetch_dict(endpoint, **params)
@@ -0,0 +1,271 @@
+from typing import Any, Dict, Iterable, Optional, Set, TYPE_CHECKING
+from datetime import date, datetime
+import logging
+import os
+import time
+
+import numpy as np
+
+from app.services.data_fetcher import season_for_date
+from app.services.data_source import fetch_frames
+from app.services.standings import TEAM_INDEX
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ELO_MEAN = 1505.0
+# Rating points per unit of (result - expectation), before the margin multiplier
+ELO_K = 20.0
+# Rating points added to the home team when computing expectations
+HOME_ADVANTAGE = 100.0
+# Share of a rating carried into the next season; the rest reverts to the mean
+SEASON_CARRYOVER = 0.75
+
+# Seconds between incremental refreshes of the shared ratings
+ELO_REFRESH_INTERVAL = float(os.getenv("ELO_REFRESH_INTERVAL", "3600"))
+
+_POSITIONS = {team_id: team["index"] for team_id, team in TEAM_INDEX.items()}
+
+# Rating features of two average teams
+NEUTRAL_ELO_FEATURES = {
+    "home_elo": ELO_MEAN,
+    "away_elo": ELO_MEAN,
+    "elo_home_win_prob": 1.0 / (1.0 + 10.0 ** (-HOME_ADVANTAGE / 400.0)),
+}
+
+
+def team_position(team_id: int) -> int:
+    """
+    Array slot (0-29) of a team
+
+    Accepts NBA team IDs (1610612737...) and the API's 1-30 team numbers.
+    """
+    position = _POSITIONS.get(int(team_id))
+    if position is not None:
+        return position
+    if 1 <= team_id <= len(_POSITIONS):
+        return int(team_id) - 1
+    raise KeyError(f"Unknown team {team_id}")
+
+
+class EloRatings:
+    """
+    Team Elo ratings, updated one game at a time
+
+    Ratings live in a 30-entry array indexed by team_position, so an update
+    touches two entries and a lookup is a single index. Updates use the
+    margin-of-victory multiplier ((margin + 3) ** 0.8 / (7.5 + 0.006 * d),
+    where d is the winner's rating edge) so blowouts count for more without
+    letting favourites inflate, and home teams get HOME_ADVANTAGE points in
+    every expectation. When a game from a new season arrives all ratings
+    move a quarter of the way back to the mean.
+
+    Args:
+        k: Update step size
+        home_advantage: Home-court edge in rating points
+    """
+
+    def __init__(self, k: float = ELO_K, home_advantage: float = HOME_ADVANTAGE):
+        self.k = k
+        self.home_advantage = home_advantage
+        self.ratings = np.full(len(_POSITIONS), ELO_MEAN)
+        self.season: Optional[str] = None
+        self.last_game_date: Optional[date] = None
+        self.games_applied = 0
+        self._applied: Set[str] = set()
+
+    def rating(self, team_id: int) -> float:
+        """Current rating of a team"""
+        return float(self.ratings[team_position(team_id)])
+
+    def win_probability(self, home_team_id: int, away_team_id: int) -> float:
+        """Probability that the home team wins, from current ratings"""
+        diff = self.ratings[team_position(home_team_id)] + self.home_advantage - \
+            self.ratings[team_position(away_team_id)]
+        return float(1.0 / (1.0 + 10.0 ** (-diff / 400.0)))
+
+    def features(self, home_team_id: int, away_team_id: int) -> Dict[str, float]:
+        """Rating features for prepare_game_features"""
+        home = self.rating(home_team_id)
+        away = self.rating(away_team_id)
+        return {
+            "home_elo": home,
+            "away_elo": away,
+            "elo_home_win_prob": float(1.0 / (1.0 + 10.0 ** (-(home + self.home_advantage - away) / 400.0))),
+        }
+
+    def update(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        home_points: float,
+        away_points: float,
+        game_date: Optional[date] = None,
+        game_id: Optional[str] = None
+    ) -> float:
+        """
+        Apply one finished game
+
+        Args:
+            home_team_id: Home team
+            away_team_id: Away team
+            home_points: Home final score
+            away_points: Away final score
+            game_date: Day of the game; starts a new season when it changes
+            game_id: Games already applied under this ID are skipped
+
+        Returns:
+            The home team's pre-game win probability
+        """
+        if game_id is not None:
+            if game_id in self._applied:
+                return self.win_probability(home_team_id, away_team_id)
+            self._applied.add(game_id)
+        if game_date is not None:
+            season = season_for_date(game_date)
+            if self.season is not None and season > self.season:
+                self.ratings += (1 - SEASON_CARRYOVER) * (ELO_MEAN - self.ratings)
+                self._applied = {game_id} if game_id is not None else set()
+            if self.season is None or season > self.season:
+                self.season = season
+            if self.last_game_date is None or game_date > self.last_game_date:
+                self.last_game_date = game_date
+
+        home, away = team_position(home_team_id), team_position(away_team_id)
+        diff = self.ratings[home] + self.home_advantage - self.ratings[away]
+        expected = 1.0 / (1.0 + 10.0 ** (-diff / 400.0))
+        margin = home_points - away_points
+        winner_edge = diff if margin > 0 else -diff
+        multiplier = (abs(margin) + 3) ** 0.8 / (7.5 + 0.006 * winner_edge)
+        shift = self.k * multiplier * ((1.0 if margin > 0 else 0.0) - expected)
+        self.ratings[home] += shift
+        self.ratings[away] -= shift
+        self.games_applied += 1
+        return float(expected)
+
+    def apply_games(self, games: Iterable[Any]) -> int:
+        """
+        Apply games in order, skipping ones already applied
+
+        Args:
+            games: Rows with game_id, game_date, home_team_id, away_team_id,
+                home_points and away_points, oldest first (see games_from_league_log)
+
+        Returns:
+            Number of new games applied
+        """
+        before = self.games_applied
+        for game in games:
+            self.update(game.home_team_id, game.away_team_id, game.home_points,
+                        game.away_points, game.game_date, game.game_id)
+        return self.games_applied - before
+
+
+def games_from_league_log(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    One row per finished game from LeagueGameLog team rows, oldest first
+
+    Args:
+        df: LeagueGameLog rows (two per game, one per team)
+
+    Returns:
+        DataFrame with game_id, game_date, home_team_id, away_team_id,
+        home_points and away_points
+    """
+    import pandas as pd
+
+    columns = ["game_id", "game_date", "home_team_id", "away_team_id", "home_points", "away_points"]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    home = df["MATCHUP"].str.contains("vs.", regex=False)
+    games = df[home][["GAME_ID", "GAME_DATE", "TEAM_ID", "PTS"]].merge(
+        df[~home][["GAME_ID", "TEAM_ID", "PTS"]], on="GAME_ID", suffixes=("_HOME", "_AWAY"))
+    games = games.dropna(subset=["PTS_HOME", "PTS_AWAY"])
+    games.columns = ["game_id", "game_date", "home_team_id", "home_points", "away_team_id", "away_points"]
+    games["game_date"] = pd.to_datetime(games["game_date"], format="mixed").dt.date
+    return games.sort_values(["game_date", "game_id"], kind="mergesort")[columns].reset_index(drop=True)
+
+
+def fetch_season_games(season: str) -> "pd.DataFrame":
+    """Finished regular-season games of a season, oldest first"""
+    frames = fetch_frames("LeagueGameLog", season=season, season_type_all_star="Regular Season")
+    return games_from_league_log(frames[0])
+
+
+# Ratings shared by every request in this process
+_ratings: Optional[EloRatings] = None
+_last_refresh = 0.0
+
+
+def refresh_elo_ratings(ratings: EloRatings, today: Optional[date] = None) -> int:
+    """
+    Apply games finished since the ratings were last updated
+
+    Fresh ratings are built from the previous and current season so the
+    between-season regression applies; afterwards only the current season
+    is fetched and already-applied games are skipped.
+
+    Args:
+        ratings: Ratings to update in place
+        today: Reference date (defaults to today)
+
+    Returns:
+        Number of games applied, 0 if the game log could not be fetched
+    """
+    today = today or datetime.now().date()
+    current = season_for_date(today)
+    seasons = [current]
+    if ratings.season is None:
+        start_year = int(current[:4]) - 1
+        seasons.insert(0, f"{start_year}-{str(start_year + 1)[-2:]}")
+
+    applied = 0
+    for season in seasons:
+        try:
+            games = fetch_season_games(season)
+        except Exception as e:
+            logger.warning(f"Could not fetch {season} games for Elo ratings: {e}")
+            continue
+        applied += ratings.apply_games(games[games["game_date"] < today].itertuples(index=False))
+    return applied
+
+
+def elo_ratings_as_of(day: date) -> EloRatings:
+    """
+    Elo ratings as they stood on the morning of a past day
+
+    Replayed as a fresh process builds them (previous season, then this
+    season's games before the day), so a past game sees no later games.
+    """
+    ratings = EloRatings()
+    refresh_elo_ratings(ratings, today=day)
+    return ratings
+
+
+def get_elo_ratings(refresh: bool = True) -> Optional[EloRatings]:
+    """
+    Current Elo ratings for this process
+
+    Built from the game log on first use and refreshed incrementally at most
+    every ELO_REFRESH_INTERVAL seconds. If the game log is unreachable the
+    ratings stay where they are (at the mean when never built).
+
+    Args:
+        refresh: False to return the ratings as they are without fetching
+            anything (None when never built), as the request path does
+    """
+    global _ratings, _last_refresh
+    if not refresh:
+        return _ratings
+    now = time.monotonic()
+    if _ratings is None or now - _last_refresh >= ELO_REFRESH_INTERVAL:
+        ratings = _ratings or EloRatings()
+        start = time.perf_counter()
+        applied = refresh_elo_ratings(ratings)
+        if applied:
+            logger.info(f"Applied {applied} games to Elo ratings in "
+                        f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        _ratings, _last_refresh = ratings, now
+    return _ratings
@@ -1,16 +1,30 @@
-import pandas as pd
-import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from datetime import datetime
 
+from app.services.elo import NEUTRAL_ELO_FEATURES
+from app.services.schedule import NEUTRAL_SCHEDULE_FEATURES
+from app.services.team_ratings import NEUTRAL_RATING_FEATURES
 
-def prepare_game_features(home_data: Dict[str, Any], away_data: Dict[str, Any]) -> pd.DataFrame:
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def prepare_game_features(
+    home_data: Dict[str, Any],
+    away_data: Dict[str, Any],
+    elo: Optional[Dict[str, float]] = None,
+    schedule: Optional[Dict[str, float]] = None,
+    ratings: Optional[Dict[str, float]] = None
+) -> "pd.DataFrame":
     """
     Prepare features for game prediction model
 
     Args:
         home_data: Historical data for home team
         away_data: Historical data for away team
+        elo: EloRatings.features for the matchup (equal ratings if omitted)
+        schedule: ScheduleTable.features for the game (rested teams if omitted)
+        ratings: TeamRatings.features for the matchup (average teams if omitted)
 
     Returns:
         DataFrame with engineered features ready for model input
@@ -39,12 +53,22 @@ def prepare_game_features(home_data: Dict[str, Any], away_data: Dict[str, Any])
         # Additional advanced metrics (add as needed)
         'home_offensive_rating': home_data.get('avg_points', 0) * 100 / max(home_data.get('avg_points_allowed', 1), 1),
         'away_offensive_rating': away_data.get('avg_points', 0) * 100 / max(away_data.get('avg_points_allowed', 1), 1),
+
+        # Team ratings
+        **(elo or NEUTRAL_ELO_FEATURES),
+
+        # Back-to-backs, schedule density and travel
+        **(schedule or NEUTRAL_SCHEDULE_FEATURES),
+
+        # Opponent-adjusted offense and defense
+        **(ratings or NEUTRAL_RATING_FEATURES),
     }
 
+    import pandas as pd
     return pd.DataFrame([features])
 
 
-def prepare_player_features(player_data: Dict[str, Any], opponent_team_id: int) -> pd.DataFrame:
+def prepare_player_features(player_data: Dict[str, Any], opponent_team_id: int) -> "pd.DataFrame":
     """
     Prepare features for player statistics prediction
 
@@ -80,6 +104,7 @@ def prepare_player_features(player_data: Dict[str, Any], opponent_team_id: int)
         'usage_rate': calculate_usage_rate(player_data),
     }
 
+    import pandas as pd
     return pd.DataFrame([features])
 
 
@@ -117,7 +142,7 @@ def calculate_team_pace(team_data: Dict[str, Any]) -> float:
     return (points + opponent_points) / 2
 
 
-def normalize_features(df: pd.DataFrame) -> pd.DataFrame:
+def normalize_features(df: "pd.DataFrame") -> "pd.DataFrame":
     """
     Normalize numerical features to 0-1 scale
 
@@ -127,6 +152,7 @@ def normalize_features(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Normalized DataFrame
     """
+    import numpy as np
     from sklearn.preprocessing import MinMaxScaler
 
     scaler = MinMaxScaler()
@@ -0,0 +1,107 @@
+from typing import Dict, Hashable, Tuple, TYPE_CHECKING
+from datetime import date, datetime
+import os
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Game logs indexed at once per process (teams and players together)
+GAME_LOG_INDEX_SIZE = int(os.getenv("GAME_LOG_INDEX_SIZE", "4096"))
+
+
+def _day_numbers(game_dates: "pd.Series") -> np.ndarray:
+    """Days since 1970-01-01 of GAME_DATE values ("JAN 15, 2026" or ISO dates)"""
+    import pandas as pd
+
+    try:
+        parsed = pd.to_datetime(game_dates, format="%b %d, %Y")
+    except ValueError:
+        parsed = pd.to_datetime(game_dates, format="mixed")
+    return parsed.to_numpy(dtype="datetime64[D]").astype(np.int64)
+
+
+class GameLogIndex:
+    """
+    Game log rows ordered newest first, searchable by date
+
+    Day numbers are kept negated so they ascend alongside the rows; the
+    games played strictly before a date are then a contiguous tail found
+    by one binary search, and the last N of them are a slice of it. This
+    is what makes a prediction for a past date see only the games played
+    before it.
+
+    Args:
+        df: TeamGameLog or PlayerGameLog rows, in any order
+    """
+
+    def __init__(self, df: "pd.DataFrame"):
+        days = _day_numbers(df["GAME_DATE"]) if len(df) else np.array([], dtype=np.int64)
+        order = np.argsort(-days, kind="mergesort")
+        self.frame = df.iloc[order] if (order != np.arange(len(order))).any() else df
+        self._keys = -days[order]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _start(self, game_date: date) -> int:
+        if isinstance(game_date, datetime):
+            game_date = game_date.date()
+        return int(np.searchsorted(self._keys, 719163 - game_date.toordinal(), side="right"))
+
+    def count_before(self, game_date: date) -> int:
+        """Games played before a date"""
+        return len(self._keys) - self._start(game_date)
+
+    def before(self, game_date: date, games_back: int) -> "pd.DataFrame":
+        """
+        Last games played before a date, newest first
+
+        Args:
+            game_date: Date (or datetime) of the game being predicted
+            games_back: Maximum number of games
+
+        Returns:
+            Up to `games_back` rows of the log
+        """
+        start = self._start(game_date)
+        return self.frame.iloc[start:start + games_back]
+
+
+# Indexes by (endpoint, team or player ID, season), with the log version they were built from
+_indexes: Dict[Tuple[str, int, str], Tuple[Hashable, GameLogIndex]] = {}
+
+
+def _log_version(df: "pd.DataFrame") -> Hashable:
+    """Changes when a game is added to (or removed from) a log"""
+    if not len(df):
+        return 0
+    return len(df), df["Game_ID"].iat[0] if "Game_ID" in df.columns else None
+
+
+def get_game_log_index(endpoint: str, entity_id: int, season: str, df: "pd.DataFrame") -> GameLogIndex:
+    """
+    Date index of a fetched game log, reused until the log changes
+
+    Args:
+        endpoint: "TeamGameLog" or "PlayerGameLog"
+        entity_id: Team or player ID the log belongs to
+        season: Season of the log
+        df: The log as just fetched
+
+    Returns:
+        GameLogIndex over df
+    """
+    key = (endpoint, int(entity_id), season)
+    version = _log_version(df)
+    cached = _indexes.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    index = GameLogIndex(df)
+    _indexes.pop(key, None)
+    if len(_indexes) >= GAME_LOG_INDEX_SIZE:
+        # Dicts keep insertion order; drop the least recently built index
+        del _indexes[next(iter(_indexes))]
+    _indexes[key] = (version, index)
+    return index
@@ -0,0 +1,170 @@
+from typing import Any, Dict, List, Set, Tuple
+from datetime import timedelta
+import asyncio
+import logging
+
+from app.services.data_fetcher import current_game_date, season_for_date
+from app.services.data_source import fetch_frames
+from app.services.prediction_store import materialize_predictions
+from app.services.scheduler import JobScheduler
+
+logger = logging.getLogger(__name__)
+
+# Cron expressions (scheduler time zone, US Eastern by default). The nightly
+# sync runs once the previous night's late games are final; the prewarm runs
+# more often than the team game log TTL so slate teams never miss the cache.
+GAME_LOG_SYNC_SCHEDULE = "30 4 * * *"
+CACHE_PREWARM_SCHEDULE = "*/10 * * * *"
+SNAPSHOT_REFRESH_SCHEDULE = "*/5 * * * *"
+# Only games whose inputs changed since the last run are recomputed
+PREDICTION_MATERIALIZE_SCHEDULE = "*/10 * * * *"
+# Expired shared-cache rows are only replaced on a miss for the same key
+CACHE_PURGE_SCHEDULE = "15 * * * *"
+
+
+def _refresh_ratings() -> Tuple[int, int]:
+    """
+    Apply finished games to the Elo and team ratings (fetches the game log)
+
+    Ratings never built are built by their getters, which also fetch the
+    previous season for Elo; built ones are refreshed once, in place.
+    Team ratings are solved here so the first request after doesn't.
+
+    Returns:
+        Games applied to the Elo ratings and to the team ratings
+    """
+    from app.services.elo import get_elo_ratings, refresh_elo_ratings
+    from app.services.team_ratings import get_team_ratings, refresh_team_ratings
+
+    ratings = get_elo_ratings(refresh=False)
+    if ratings is None:
+        elo_games = get_elo_ratings().games_applied
+    else:
+        elo_games = refresh_elo_ratings(ratings)
+    team_ratings = get_team_ratings(refresh=False)
+    if team_ratings is None:
+        team_ratings = get_team_ratings()
+        rating_games = team_ratings.games_applied
+    else:
+        rating_games = refresh_team_ratings(team_ratings)
+    team_ratings.solve()
+    return elo_games, rating_games
+
+
+def _standings_rows(season: str) -> List[Dict[str, Any]]:
+    """Unranked standings rows of a season, as get_current_standings returns them"""
+    try:
+        return fetch_frames("LeagueDashTeamStats", season=season)[0].to_dict("records")
+    except Exception as e:
+        logger.warning(f"Could not fetch {season} standings: {e}")
+        return []
+
+
+async def sync_game_logs() -> Dict[str, Any]:
+    """
+    Nightly game-log sync: fold finished games into the shared ratings
+
+    Fetching the game logs blocks (without a shared cache, every call goes
+    to stats.nba.com), so the rating updates run in a worker thread.
+    """
+    from app.services.schedule import refresh_schedule_table
+
+    season = season_for_date(current_game_date())
+    elo_games, rating_games = await asyncio.to_thread(_refresh_ratings)
+    # Postponed games move; the table is swapped in whole once built
+    table = await asyncio.to_thread(refresh_schedule_table, season)
+    return {
+        "season": season,
+        "elo_games": elo_games,
+        "team_rating_games": rating_games,
+        "schedule_team_games": len(table),
+    }
+
+
+def slate_team_ids(days: int = 2) -> Set[int]:
+    """Teams playing today or in the next days - 1 days, from the schedule table"""
+    from app.services.schedule import get_schedule_table
+
+    today = current_game_date()
+    team_ids = set()
+    for offset in range(days):
+        day = today + timedelta(days=offset)
+        games = get_schedule_table(season_for_date(day)).games_on(day)
+        team_ids.update(int(t) for t in games["home_team_id"])
+        team_ids.update(int(t) for t in games["away_team_id"])
+    return team_ids
+
+
+def prewarm_caches() -> Dict[str, Any]:
+    """
+    Fetch the game logs of today's and tomorrow's teams into the shared cache
+
+    Prediction requests for the slate then find their team logs cached
+    instead of waiting on stats.nba.com. Models are loaded too, so a
+    worker started with WARM_UP=false is ready before its first request.
+    """
+    from app.services.model_loder import ModelLoader
+
+    ModelLoader().get_game_prediction_model()
+    season = season_for_date(current_game_date())
+    warmed = failed = 0
+    for team_id in sorted(slate_team_ids()):
+        try:
+            # fetch_game_data's request, NBA team ID included, so predictions hit these entries
+            fetch_frames("TeamGameLog", team_id=team_id, season=season,
+                         season_type_all_star="Regular Season")
+            warmed += 1
+        except Exception as e:
+            logger.warning(f"Could not prewarm game log for team {team_id}: {e}")
+            failed += 1
+    return {"teams_warmed": warmed, "teams_failed": failed}
+
+
+async def refresh_snapshots() -> Dict[str, Any]:
+    """
+    Refresh standings, player availability, the schedule table and models replaced on disk
+
+    Standings are fetched (into the shared cache, when configured) from a
+    worker thread and ranked into the compute_standings memo, so the
+    standings route answers from memory. Prediction requests only read the availability index and
+    schedule table, so this is where they are rebuilt when due (or retried
+    after a failed fetch), in a worker thread.
+    """
+    from app.services.availability import get_availability
+    from app.services.model_loder import ModelLoader
+    from app.services.schedule import get_schedule_table
+    from app.services.standings import compute_standings
+
+    season = season_for_date(current_game_date())
+    rows = await asyncio.to_thread(_standings_rows, season)
+    standings = compute_standings(rows, season) if rows else None
+    index = await asyncio.to_thread(get_availability)
+    await asyncio.to_thread(get_schedule_table, season)
+    ModelLoader().check_for_updates()
+    return {
+        "season": season,
+        "standings_teams": len(standings["eastern"]) + len(standings["western"]) if standings else 0,
+        "availability_version": index.version,
+    }
+
+
+def purge_shared_cache() -> Dict[str, Any]:
+    """Delete expired rows so the shared cache file does not grow without bound"""
+    from app.services.shared_cache import get_shared_cache
+
+    cache = get_shared_cache()
+    return {"purged": cache.purge_expired() if cache is not None else 0}
+
+
+def register_default_jobs(scheduler: JobScheduler):
+    """Register the maintenance jobs every worker runs"""
+    scheduler.add_job("game_log_sync", GAME_LOG_SYNC_SCHEDULE, sync_game_logs,
+                      jitter=300, timeout=900)
+    scheduler.add_job("cache_prewarm", CACHE_PREWARM_SCHEDULE, prewarm_caches,
+                      jitter=60, timeout=300)
+    scheduler.add_job("snapshot_refresh", SNAPSHOT_REFRESH_SCHEDULE, refresh_snapshots,
+                      jitter=30, timeout=120)
+    scheduler.add_job("cache_purge", CACHE_PURGE_SCHEDULE, purge_shared_cache,
+                      jitter=600, timeout=120)
+    scheduler.add_job("prediction_materialize", PREDICTION_MATERIALIZE_SCHEDULE, materialize_predictions,
+                      jitter=60, timeout=300)
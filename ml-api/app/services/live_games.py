@@ -0,0 +1,281 @@
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Set
+import asyncio
+import json
+import logging
+import os
+import re
+
+from app.services.live_win_probability import LiveWinProbability
+from app.services.data_source import fetch_dict
+
+logger = logging.getLogger(__name__)
+
+# Live scoreboard gameStatus values
+GAME_SCHEDULED = 1
+GAME_LIVE = 2
+GAME_FINAL = 3
+
+_CLOCK_PATTERN = re.compile(r"PT(\d+)M([\d.]+)S")
+
+
+def parse_game_clock(clock: str) -> float:
+    """
+    Convert a live-feed game clock ("PT05M12.00S") to seconds left in the period
+
+    Returns 0.0 for empty or unrecognized clocks (between periods, final).
+    """
+    match = _CLOCK_PATTERN.match(clock or "")
+    if not match:
+        return 0.0
+    return int(match.group(1)) * 60 + float(match.group(2))
+
+
+def summarize_game(game: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a raw live scoreboard game to the fields pushed to clients
+
+    Args:
+        game: One entry of scoreboard["games"] from the live feed
+
+    Returns:
+        Flat game state dictionary
+    """
+    home = game.get("homeTeam", {})
+    away = game.get("awayTeam", {})
+    return {
+        "game_id": game.get("gameId"),
+        "status": game.get("gameStatus", GAME_SCHEDULED),
+        "status_text": (game.get("gameStatusText") or "").strip(),
+        "period": game.get("period", 0),
+        "clock_seconds": parse_game_clock(game.get("gameClock", "")),
+        "home_team_id": home.get("teamId"),
+        "home_team": home.get("teamTricode"),
+        "home_score": home.get("score", 0),
+        "away_team_id": away.get("teamId"),
+        "away_team": away.get("teamTricode"),
+        "away_score": away.get("score", 0),
+    }
+
+
+def diff_states(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Compute the changes between two scoreboard states
+
+    Args:
+        old: Previous state keyed by game ID
+        new: Current state keyed by game ID
+
+    Returns:
+        List of {"game_id", "changes"} entries holding only changed fields,
+        plus {"game_id", "removed": True} for games no longer on the board
+    """
+    changes = []
+    for game_id, game in new.items():
+        previous = old.get(game_id)
+        if previous is None:
+            changes.append({"game_id": game_id, "changes": game})
+            continue
+        changed = {k: v for k, v in game.items() if previous.get(k) != v}
+        if changed:
+            changes.append({"game_id": game_id, "changes": changed})
+    for game_id in old.keys() - new.keys():
+        changes.append({"game_id": game_id, "removed": True})
+    return changes
+
+
+class NbaLiveFeed:
+    """Live scoreboard feed backed by the configured data source (nba_api by default)"""
+
+    def fetch_scoreboard(self) -> Dict[str, Any]:
+        return fetch_dict("ScoreBoard")
+
+
+class RecordingLiveFeed:
+    """Wrap another feed and append every scoreboard snapshot to a JSON-lines file"""
+
+    def __init__(self, feed: Any, path: str):
+        self.feed = feed
+        self.path = path
+
+    def fetch_scoreboard(self) -> Dict[str, Any]:
+        snapshot = self.feed.fetch_scoreboard()
+        with open(self.path, "a") as f:
+            f.write(json.dumps(snapshot) + "\n")
+        return snapshot
+
+
+class ReplayLiveFeed:
+    """
+    Serve scoreboard snapshots recorded by RecordingLiveFeed, one per poll
+
+    Once the recording is exhausted the last snapshot is repeated.
+    """
+
+    def __init__(self, path: str):
+        with open(path) as f:
+            self.snapshots = [json.loads(line) for line in f if line.strip()]
+        if not self.snapshots:
+            raise ValueError(f"No scoreboard snapshots in {path}")
+        self.position = 0
+
+    def fetch_scoreboard(self) -> Dict[str, Any]:
+        snapshot = self.snapshots[min(self.position, len(self.snapshots) - 1)]
+        self.position += 1
+        return snapshot
+
+
+class LiveGameService:
+    """
+    Poll the live scoreboard once and fan changes out to every subscriber
+
+    Polling only runs while at least one client is subscribed. The interval
+    adapts to the slate: fast while a close game is in the fourth quarter
+    or overtime, normal while any game is live, slow when nothing is live.
+    """
+
+    def __init__(
+        self,
+        feed: Any,
+        live_interval: float = 5.0,
+        close_interval: float = 2.0,
+        idle_interval: float = 120.0,
+        close_margin: int = 6,
+        queue_size: int = 100
+    ):
+        self.feed = feed
+        self.live_interval = live_interval
+        self.close_interval = close_interval
+        self.idle_interval = idle_interval
+        self.close_margin = close_margin
+        self.queue_size = queue_size
+        self.state: Dict[str, Dict[str, Any]] = {}
+        self.win_probability = LiveWinProbability()
+        # Optional async callable(game_state) -> pre-game home win probability
+        self.prior_provider: Optional[Callable[[Dict[str, Any]], Awaitable[float]]] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def next_interval(self) -> float:
+        """Choose the delay before the next poll from the current state"""
+        live_games = [g for g in self.state.values() if g["status"] == GAME_LIVE]
+        if not live_games:
+            return self.idle_interval
+        for game in live_games:
+            if game["period"] >= 4 and abs(game["home_score"] - game["away_score"]) <= self.close_margin:
+                return self.close_interval
+        return self.live_interval
+
+    async def poll_once(self) -> List[Dict[str, Any]]:
+        """
+        Fetch one scoreboard snapshot, update state and publish the changes
+
+        Returns:
+            The list of changes published to subscribers
+        """
+        raw = await asyncio.to_thread(self.feed.fetch_scoreboard)
+        games = raw.get("scoreboard", {}).get("games", [])
+        new_state = {g["game_id"]: g for g in map(summarize_game, games)}
+        await self._update_win_probabilities(new_state)
+
+        changes = diff_states(self.state, new_state)
+        self.state = new_state
+        if changes:
+            self._publish({"event": "update", "data": changes})
+        return changes
+
+    async def _update_win_probabilities(self, new_state: Dict[str, Dict[str, Any]]):
+        """Attach an in-game home win probability to every game in the new state"""
+        for game_id, game in new_state.items():
+            if not self.win_probability.is_tracked(game_id):
+                prior = None
+                if self.prior_provider is not None:
+                    try:
+                        prior = await self.prior_provider(game)
+                    except Exception as e:
+                        logger.warning(f"Pre-game prior failed for {game_id}: {e}")
+                self.win_probability.register_game(game_id, prior)
+        for game_id in self.state.keys() - new_state.keys():
+            self.win_probability.remove_game(game_id)
+
+        started = [g for g in new_state.values() if g["status"] != GAME_SCHEDULED]
+        self.win_probability.update_games(started)
+        for game_id, game in new_state.items():
+            game["home_win_probability"] = round(
+                self.win_probability.get_probability(game_id), 4)
+
+    def _publish(self, message: Dict[str, Any]):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Slow client: drop its backlog and send a fresh snapshot instead
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._snapshot_message())
+
+    def _snapshot_message(self) -> Dict[str, Any]:
+        return {"event": "snapshot", "data": list(self.state.values())}
+
+    async def _run(self):
+        while self._subscribers:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Live scoreboard poll failed: {e}")
+            await asyncio.sleep(self.next_interval())
+
+    async def subscribe(self) -> asyncio.Queue:
+        """
+        Register a subscriber and start polling if it is the first one
+
+        The queue immediately receives a snapshot of the current state.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        queue.put_nowait(self._snapshot_message())
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a subscriber; polling stops after the last one leaves"""
+        self._subscribers.discard(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def stop(self):
+        """Drop all subscribers and cancel the polling task"""
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_live_game_service: Optional[LiveGameService] = None
+
+
+def get_live_game_service() -> LiveGameService:
+    """
+    Return the shared live game service
+
+    Set LIVE_FEED_REPLAY to a recorded JSON-lines file to serve a replay
+    instead of the live feed, or LIVE_FEED_RECORD to record the live feed.
+    """
+    global _live_game_service
+    if _live_game_service is None:
+        replay_path = os.getenv("LIVE_FEED_REPLAY")
+        record_path = os.getenv("LIVE_FEED_RECORD")
+        if replay_path:
+            feed = ReplayLiveFeed(replay_path)
+        elif record_path:
+            feed = RecordingLiveFeed(NbaLiveFeed(), record_path)
+        else:
+            feed = NbaLiveFeed()
+        _live_game_service = LiveGameService(feed)
+    return _live_game_service
@@ -0,0 +1,197 @@
+from typing import Dict, Any, List, Optional
+import numpy as np
+
+# Regulation is four 12-minute periods
+REGULATION_PERIODS = 4
+PERIOD_SECONDS = 720
+GAME_SECONDS = REGULATION_PERIODS * PERIOD_SECONDS
+
+# Standard deviation of the final margin over a full game, in points
+MARGIN_STDEV = 13.5
+# Expected points from holding the ball
+POSSESSION_VALUE = 0.8
+# Home win probability used when no pre-game prediction is available
+DEFAULT_PRIOR = 0.6
+
+_MIN_TAU = 1e-6
+
+
+def seconds_remaining(period: int, clock_seconds: float) -> float:
+    """
+    Convert period and clock to seconds left in the game
+
+    In overtime this is the time left in the current overtime period.
+    """
+    if period <= 0:
+        return float(GAME_SECONDS)
+    if period <= REGULATION_PERIODS:
+        return (REGULATION_PERIODS - period) * PERIOD_SECONDS + clock_seconds
+    return clock_seconds
+
+
+def _win_probability(margin, remaining, possession, prior_spread):
+    """
+    Home win probability from the game state (works on scalars and arrays)
+
+    The final margin is modeled as the current margin plus the remaining
+    share of the pre-game expected margin, with noise that shrinks with the
+    square root of time left (a Brownian-motion model of scoring).
+    """
+    from scipy.special import ndtr
+    tau = np.maximum(remaining / GAME_SECONDS, _MIN_TAU)
+    expected = margin + prior_spread * tau + possession * POSSESSION_VALUE
+    return ndtr(expected / (MARGIN_STDEV * np.sqrt(tau)))
+
+
+def prior_to_spread(prior: float) -> float:
+    """Convert a pre-game home win probability to an expected final margin"""
+    from scipy.special import ndtri
+    prior = min(max(prior, 1e-4), 1 - 1e-4)
+    return float(MARGIN_STDEV * ndtri(prior))
+
+
+class LiveWinProbability:
+    """
+    In-game home win probability for every live game, held as parallel arrays
+
+    Each game owns one slot in the state arrays (score margin, seconds
+    remaining, possession, pre-game prior spread). A single event updates
+    one slot and recomputes one probability; recompute_all() rescores every
+    live game in one vectorized pass.
+    """
+
+    def __init__(self, capacity: int = 32):
+        self._slots: Dict[str, int] = {}
+        self.margin = np.zeros(capacity)
+        self.remaining = np.full(capacity, float(GAME_SECONDS))
+        self.possession = np.zeros(capacity)
+        self.prior_spread = np.zeros(capacity)
+        self.probability = np.zeros(capacity)
+
+    def _grow(self):
+        capacity = len(self.margin) * 2
+        for name in ("margin", "remaining", "possession", "prior_spread", "probability"):
+            values = getattr(self, name)
+            grown = np.zeros(capacity)
+            if name == "remaining":
+                grown[:] = GAME_SECONDS
+            grown[:len(values)] = values
+            setattr(self, name, grown)
+
+    def register_game(self, game_id: str, prior: Optional[float] = None) -> int:
+        """
+        Start tracking a game with its pre-game home win probability
+
+        Args:
+            game_id: NBA game ID
+            prior: Pre-game home win probability from the game model
+
+        Returns:
+            The game's slot in the state arrays
+        """
+        slot = self._slots.get(game_id)
+        if slot is None:
+            slot = len(self._slots)
+            if slot >= len(self.margin):
+                self._grow()
+            self._slots[game_id] = slot
+        self.prior_spread[slot] = prior_to_spread(
+            DEFAULT_PRIOR if prior is None else prior)
+        self.probability[slot] = _win_probability(
+            self.margin[slot], self.remaining[slot],
+            self.possession[slot], self.prior_spread[slot])
+        return slot
+
+    def is_tracked(self, game_id: str) -> bool:
+        return game_id in self._slots
+
+    def apply_event(
+        self,
+        game_id: str,
+        home_score: int,
+        away_score: int,
+        period: int,
+        clock_seconds: float,
+        possession: int = 0
+    ) -> float:
+        """
+        Update one game's state from a play and return its new probability
+
+        Args:
+            game_id: NBA game ID (registered with the default prior if new)
+            home_score: Home team score after the play
+            away_score: Away team score after the play
+            period: Current period (5+ is overtime)
+            clock_seconds: Seconds left in the period
+            possession: 1 if the home team has the ball, -1 for away, 0 if unknown
+
+        Returns:
+            Updated home win probability
+        """
+        slot = self._slots.get(game_id)
+        if slot is None:
+            slot = self.register_game(game_id)
+        self.margin[slot] = home_score - away_score
+        self.remaining[slot] = seconds_remaining(period, clock_seconds)
+        self.possession[slot] = possession
+        probability = float(_win_probability(
+            self.margin[slot], self.remaining[slot],
+            self.possession[slot], self.prior_spread[slot]))
+        self.probability[slot] = probability
+        return probability
+
+    def update_games(self, games: List[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Load a batch of scoreboard states and rescore them together
+
+        Args:
+            games: Summarized live game states (see live_games.summarize_game)
+
+        Returns:
+            Home win probability for each game in the batch
+        """
+        slots = []
+        for game in games:
+            slot = self._slots.get(game["game_id"])
+            if slot is None:
+                slot = self.register_game(game["game_id"])
+            self.margin[slot] = game["home_score"] - game["away_score"]
+            self.remaining[slot] = seconds_remaining(game["period"], game["clock_seconds"])
+            self.possession[slot] = game.get("possession", 0)
+            slots.append(slot)
+        probabilities = self.recompute_all()
+        return {game["game_id"]: float(probabilities[slot]) for game, slot in zip(games, slots)}
+
+    def recompute_all(self) -> np.ndarray:
+        """Rescore every tracked game in one vectorized pass"""
+        n = len(self._slots)
+        self.probability[:n] = _win_probability(
+            self.margin[:n], self.remaining[:n],
+            self.possession[:n], self.prior_spread[:n])
+        return self.probability[:n]
+
+    def get_probability(self, game_id: str) -> Optional[float]:
+        slot = self._slots.get(game_id)
+        return None if slot is None else float(self.probability[slot])
+
+    def probabilities(self) -> Dict[str, float]:
+        """Current home win probability for every tracked game"""
+        return {game_id: float(self.probability[slot]) for game_id, slot in self._slots.items()}
+
+    def remove_game(self, game_id: str):
+        """Stop tracking a game, moving the last slot into its place"""
+        slot = self._slots.pop(game_id, None)
+        if slot is None:
+            return
+        last = len(self._slots)
+        if slot != last:
+            moved = next(g for g, s in self._slots.items() if s == last)
+            self._slots[moved] = slot
+            for values in (self.margin, self.remaining, self.possession,
+                           self.prior_spread, self.probability):
+                values[slot] = values[last]
+        self.margin[last] = 0
+        self.remaining[last] = GAME_SECONDS
+        self.possession[last] = 0
+        self.prior_spread[last] = 0
+        self.probability[last] = 0
@@ -0,0 +1,121 @@
+from typing import Iterator
+from contextlib import contextmanager
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Latency buckets from 100us to 30s; upstream calls to stats.nba.com dominate the tail
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+STAGE_LATENCY = Histogram(
+    "nba_api_stage_duration_seconds",
+    "Time spent in each prediction pipeline stage",
+    ["stage"],
+    buckets=LATENCY_BUCKETS
+)
+UPSTREAM_LATENCY = Histogram(
+    "nba_api_upstream_duration_seconds",
+    "Time spent in upstream nba_api calls, per endpoint",
+    ["endpoint"],
+    buckets=LATENCY_BUCKETS
+)
+UPSTREAM_ERRORS = Counter(
+    "nba_api_upstream_errors_total",
+    "Failed upstream nba_api calls, per endpoint and kind (error or throttle)",
+    ["endpoint", "kind"]
+)
+CACHE_REQUESTS = Counter(
+    "nba_api_cache_requests_total",
+    "Cache lookups by cache and result (hit or miss); hit ratio = hit / (hit + miss)",
+    ["cache", "result"]
+)
+PREDICTION_FALLBACKS = Counter(
+    "nba_api_prediction_fallbacks_total",
+    "Predictions answered by a fallback instead of the model, per fallback",
+    ["fallback"]
+)
+MODEL_INFO = Gauge(
+    "nba_api_model_info",
+    "Currently loaded model, labelled with its version",
+    ["model", "version"],
+    multiprocess_mode="liveall"
+)
+
+# Label children are resolved once so the hot path is a single observe()/inc()
+_stage_children = {}
+_cache_children = {}
+# Model name -> version currently published in MODEL_INFO
+_model_versions = {}
+
+_THROTTLE_MARKERS = ("429", "Too Many Requests", "timed out", "Timeout")
+
+
+class _StageTimer:
+    """Context manager recording elapsed time into a histogram child"""
+    __slots__ = ("child", "start")
+
+    def __init__(self, child):
+        self.child = child
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.child.observe(time.perf_counter() - self.start)
+        return False
+
+
+def observe_stage(stage: str) -> _StageTimer:
+    """Time a pipeline stage and record it in the stage latency histogram"""
+    child = _stage_children.get(stage)
+    if child is None:
+        child = _stage_children[stage] = STAGE_LATENCY.labels(stage=stage)
+    return _StageTimer(child)
+
+
+@contextmanager
+def observe_upstream(endpoint: str) -> Iterator[None]:
+    """
+    Time an upstream nba_api call and count its failures
+
+    stats.nba.com throttles by returning 429 or by letting requests time out,
+    so both are counted as "throttle"; anything else counts as "error".
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        message = f"{type(e).__name__}: {e}"
+        kind = "throttle" if any(m in message for m in _THROTTLE_MARKERS) else "error"
+        UPSTREAM_ERRORS.labels(endpoint=endpoint, kind=kind).inc()
+        raise
+    finally:
+        UPSTREAM_LATENCY.labels(endpoint=endpoint).observe(time.perf_counter() - start)
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    """Count one cache lookup"""
+    key = (cache, hit)
+    child = _cache_children.get(key)
+    if child is None:
+        child = _cache_children[key] = CACHE_REQUESTS.labels(
+            cache=cache, result="hit" if hit else "miss")
+    child.inc()
+
+
+def record_fallback(fallback: str):
+    """Count one prediction answered by a fallback (e.g. "elo")"""
+    PREDICTION_FALLBACKS.labels(fallback=fallback).inc()
+
+
+def set_model_version(model: str, version: str):
+    """Publish the version of a freshly loaded model, replacing the previous one"""
+    previous = _model_versions.get(model)
+    if previous is not None and previous != version:
+        MODEL_INFO.remove(model, previous)
+    MODEL_INFO.labels(model=model, version=version).set(1)
+    _model_versions[model] = version
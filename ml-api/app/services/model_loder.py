@@ -1,13 +1,34 @@
+import hashlib
 import os
+import time
 import pickle
 import json
-from typing import Any, Optional
-import xgboost as xgb
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
+from typing import Any, Dict, Optional, Tuple
 import logging
 
+from app.services.calibration import ProbabilityCalibrator
+from app.services.metrics import set_model_version
+from app.services.player_projection import PlayerProjectionModel
+
 logger = logging.getLogger(__name__)
 
+# Seconds between checks for model files replaced on disk (e.g. by
+# training/update_model.py); 0 checks on every request
+MODEL_RELOAD_INTERVAL = float(os.getenv("MODEL_RELOAD_INTERVAL", "30"))
+
+
+def model_file_version(model_path: str) -> str:
+    """Short content hash identifying a model file"""
+    digest = hashlib.sha256()
+    with open(model_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+# Cached in place of a calibration table fitted for another game model
+_UNMATCHED_CALIBRATOR = object()
+
 
 class ModelLoader:
     """
@@ -16,6 +37,11 @@ class ModelLoader:
     _instance = None
     _game_prediction_model = None
     _player_stats_model = None
+    _player_projection_model = None
+    _game_calibrator = None
+    # Loaded model file path -> modification time at load
+    _loaded_files: Dict[str, float] = {}
+    _last_update_check = 0.0
 
     def __new__(cls):
         if cls._instance is None:
@@ -33,44 +59,124 @@ class ModelLoader:
         Returns:
             Trained model for game outcome prediction
         """
+        self.check_for_updates()
         if self._game_prediction_model is None:
             self._game_prediction_model = self._load_xgboost_model(
                 "xgboost_model.json")
 
         return self._game_prediction_model
 
-    def get_player_stats_model(self) -> Any:
+    def get_player_stats_model(self) -> Optional[Any]:
         """
         Load or return cached player statistics prediction model
 
+        Prefers the native xgboost model written by
+        training/train_player_model.py (player_stats_model.json or .ubj) and
+        falls back to a legacy pickled sklearn model.
+
         Returns:
-            Trained model for player stats prediction
+            Trained multi-output model predicting points, rebounds, assists,
+            steals and blocks, or None if no model has been trained
         """
+        self.check_for_updates()
         if self._player_stats_model is None:
-            # Try to load from file, otherwise create a placeholder
+            for filename in ("player_stats_model.json", "player_stats_model.ubj"):
+                if os.path.exists(os.path.join(self.model_dir, filename)):
+                    self._player_stats_model = self._load_xgboost_regressor(filename)
+                    return self._player_stats_model
             try:
                 self._player_stats_model = self._load_sklearn_model(
                     "player_stats_model.pkl")
             except FileNotFoundError:
                 logger.warning(
-                    "Player stats model not found, using placeholder")
-                # Create a simple placeholder model for development
-                from sklearn.multioutput import MultiOutputRegressor
-                from sklearn.linear_model import LinearRegression
-                self._player_stats_model = MultiOutputRegressor(
-                    LinearRegression())
+                    "Player stats model not found; train one with training/train_player_model.py")
 
         return self._player_stats_model
 
-    def _load_xgboost_model(self, filename: str) -> xgb.Booster:
+    def _load_xgboost_regressor(self, filename: str) -> Any:
         """
-        Load XGBoost model from JSON file
+        Load a native-format XGBoost regressor (no pickle involved)
+
+        Args:
+            filename: Name of the .json or .ubj model file
+
+        Returns:
+            Loaded XGBRegressor
+        """
+        import xgboost as xgb
+
+        model_path = os.path.join(self.model_dir, filename)
+        start = time.perf_counter()
+        model = xgb.XGBRegressor()
+        model.load_model(model_path)
+        logger.info(f"Loaded XGBoost regressor from {model_path} in "
+                    f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        set_model_version("player_stats", model_file_version(model_path))
+        self._track(model_path)
+        return model
+
+    def get_player_projection_model(self) -> Optional[PlayerProjectionModel]:
+        """
+        Load or return the cached player projection (quantile) model
+
+        Returns:
+            PlayerProjectionModel, or None if no model has been trained
+        """
+        self.check_for_updates()
+        if self._player_projection_model is None:
+            model_path = os.path.join(self.model_dir, "player_projection_model.json")
+            if not os.path.exists(model_path):
+                return None
+            self._player_projection_model = PlayerProjectionModel.load(model_path)
+            logger.info(f"Loaded player projection model from {model_path}")
+            set_model_version("player_projection", model_file_version(model_path))
+            self._track(model_path)
+
+        return self._player_projection_model
+
+    def get_game_calibrator(self) -> Optional[ProbabilityCalibrator]:
+        """
+        Load or return the cached calibration table for game win probabilities
+
+        A table fitted against a different game model file (e.g. before
+        update_model.py published new trees) is not applied.
+
+        Returns:
+            ProbabilityCalibrator fitted by training/calibrate_model.py, or
+            None if the current game model has not been calibrated
+        """
+        self.check_for_updates()
+        if self._game_calibrator is None:
+            model_path = os.path.join(self.model_dir, "game_calibration.json")
+            if not os.path.exists(model_path):
+                return None
+            calibrator = ProbabilityCalibrator.load(model_path)
+            # Tracked either way, so a refitted table is picked up on reload
+            self._track(model_path)
+            game_model_path = os.path.join(self.model_dir, "xgboost_model.json")
+            game_version = model_file_version(game_model_path) if os.path.exists(game_model_path) else None
+            if calibrator.model_version != game_version:
+                logger.warning(f"Ignoring {model_path}: fitted for game model {calibrator.model_version}, "
+                               f"serving {game_version}; rerun training/calibrate_model.py")
+                self._game_calibrator = _UNMATCHED_CALIBRATOR
+                return None
+            self._game_calibrator = calibrator
+            logger.info(f"Loaded game calibration from {model_path}")
+            set_model_version("game_calibration", model_file_version(model_path))
+
+        if self._game_calibrator is _UNMATCHED_CALIBRATOR:
+            return None
+        return self._game_calibrator
+
+    def _load_xgboost_model(self, filename: str) -> Any:
+        """
+        Load the XGBoost game classifier from its native JSON file
 
         Args:
             filename: Name of the model file
 
         Returns:
-            Loaded XGBoost model
+            Loaded XGBClassifier
         """
         model_path = os.path.join(self.model_dir, filename)
 
@@ -82,10 +188,13 @@ class ModelLoader:
             return RandomForestClassifier(n_estimators=100, random_state=42)
 
         try:
-            booster = xgb.Booster()
-            booster.load_model(model_path)
+            import xgboost as xgb
+            model = xgb.XGBClassifier()
+            model.load_model(model_path)
             logger.info(f"Loaded XGBoost model from {model_path}")
-            return booster
+            set_model_version("game_prediction", model_file_version(model_path))
+            self._track(model_path)
+            return model
         except Exception as e:
             logger.error(f"Error loading XGBoost model: {e}")
             # Return placeholder
@@ -110,10 +219,51 @@ class ModelLoader:
         with open(model_path, 'rb') as f:
             model = pickle.load(f)
             logger.info(f"Loaded sklearn model from {model_path}")
+            set_model_version("player_stats", model_file_version(model_path))
+            self._track(model_path)
             return model
 
+    def _track(self, model_path: str):
+        """Remember a loaded file's modification time for check_for_updates"""
+        ModelLoader._loaded_files[model_path] = os.stat(model_path).st_mtime
+
+    def loaded_versions(self) -> Tuple[Tuple[str, float], ...]:
+        """Loaded model files and their modification times; changes whenever a model is reloaded"""
+        return tuple(sorted(self._loaded_files.items()))
+
+    def check_for_updates(self) -> bool:
+        """
+        Reload models whose files were replaced since they were loaded
+
+        Update jobs write the new file next to the old one and rename it into
+        place, so every worker picks up the new model on its next request
+        after the check interval, without a restart. Requests already running
+        keep the model object they started with.
+
+        Returns:
+            True if the model cache was cleared
+        """
+        now = time.monotonic()
+        if now - ModelLoader._last_update_check < MODEL_RELOAD_INTERVAL:
+            return False
+        ModelLoader._last_update_check = now
+
+        for model_path, mtime in list(self._loaded_files.items()):
+            try:
+                changed = os.stat(model_path).st_mtime != mtime
+            except FileNotFoundError:
+                continue
+            if changed:
+                logger.info(f"{model_path} changed on disk, reloading models")
+                self.reload_models()
+                return True
+        return False
+
     def reload_models(self):
         """Force reload of all models from disk"""
         self._game_prediction_model = None
         self._player_stats_model = None
+        self._player_projection_model = None
+        self._game_calibrator = None
+        ModelLoader._loaded_files = {}
         logger.info("Model cache cleared, will reload on next request")
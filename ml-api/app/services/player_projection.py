@@ -0,0 +1,209 @@
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+import json
+import os
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Projected box score stats, in output order
+PROJECTED_STATS = ("points", "rebounds", "assists", "steals", "blocks")
+# Quantile heads; the middle one is reported as the point projection
+QUANTILES = (0.1, 0.5, 0.9)
+
+# prepare_player_features columns used by the heads. opponent_team_id is an
+# identifier, not a quantity, so a linear head cannot use it.
+PROJECTION_FEATURES = (
+    "avg_points", "avg_rebounds", "avg_assists", "avg_steals", "avg_blocks",
+    "fg_percentage", "three_pt_percentage", "ft_percentage",
+    "minutes_per_game", "games_played", "true_shooting_pct", "usage_rate",
+)
+
+
+class PlayerProjectionModel:
+    """
+    Linear quantile heads for every projected stat, evaluated as one matmul
+
+    The model holds a (features x stats*quantiles) coefficient matrix, so
+    projecting any number of players for all five stats at P10/P50/P90 is a
+    single matrix product. Heads are sorted per stat afterwards so quantiles
+    never cross, and clipped at zero.
+
+    Args:
+        feature_names: Input columns, in coefficient row order
+        coef: Array of shape (n_features, n_stats * n_quantiles)
+        intercept: Array of shape (n_stats * n_quantiles,)
+        stats: Stat names, outer output axis
+        quantiles: Quantile levels, inner output axis
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        coef: np.ndarray,
+        intercept: np.ndarray,
+        stats: Sequence[str] = PROJECTED_STATS,
+        quantiles: Sequence[float] = QUANTILES
+    ):
+        self.feature_names = list(feature_names)
+        self.stats = list(stats)
+        self.quantiles = list(quantiles)
+        self.coef = np.asarray(coef, dtype=float)
+        self.intercept = np.asarray(intercept, dtype=float)
+        self.point_index = self.quantiles.index(0.5) if 0.5 in self.quantiles else len(self.quantiles) // 2
+
+    def predict(self, features: "pd.DataFrame") -> np.ndarray:
+        """
+        Project every row of a prepare_player_features frame
+
+        Args:
+            features: One row per player
+
+        Returns:
+            Array of shape (n_rows, n_stats, n_quantiles)
+        """
+        X = features[self.feature_names].to_numpy(dtype=float)
+        out = (X @ self.coef + self.intercept).reshape(
+            len(X), len(self.stats), len(self.quantiles))
+        out.sort(axis=2)
+        return np.maximum(out, 0.0, out=out)
+
+    def project(
+        self,
+        features: "pd.DataFrame",
+        point: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Dict[str, float]]]:
+        """
+        Project every row and label the results
+
+        Args:
+            features: One row per player
+            point: Optional (n_rows, n_stats) point predictions from a
+                separate model; they replace the median head, and the
+                interval is widened where needed so it still contains them
+
+        Returns:
+            One dict per row: stat -> {"p10", "point", "p90"}
+        """
+        low, high = 0, len(self.quantiles) - 1
+        projected = self.predict(features)
+        if point is not None:
+            point = np.maximum(np.asarray(point, dtype=float).reshape(len(projected), -1), 0.0)
+            projected[:, :, self.point_index] = point
+            projected[:, :, low] = np.minimum(projected[:, :, low], point)
+            projected[:, :, high] = np.maximum(projected[:, :, high], point)
+        return [
+            {
+                stat: {
+                    "p10": float(values[low]),
+                    "point": float(values[self.point_index]),
+                    "p90": float(values[high]),
+                }
+                for stat, values in zip(self.stats, row)
+            }
+            for row in projected
+        ]
+
+    @classmethod
+    def fit(
+        cls,
+        X: "pd.DataFrame",
+        Y: "pd.DataFrame",
+        quantiles: Sequence[float] = QUANTILES,
+        feature_names: Sequence[str] = PROJECTION_FEATURES,
+        l2: float = 1e-4,
+        smoothing: float = 0.05
+    ) -> "PlayerProjectionModel":
+        """
+        Fit every stat/quantile head jointly by linear quantile regression
+
+        The pinball loss is smoothed with a softplus of width `smoothing`
+        standard deviations of each target, which makes all heads one
+        differentiable problem for L-BFGS (seconds, where an exact linear
+        program per head takes minutes). Features are standardized for
+        fitting and the scaling is folded back into the coefficients, so
+        inference needs no preprocessing.
+
+        Args:
+            X: prepare_player_features rows
+            Y: Observed stats, one column per name in PROJECTED_STATS
+            quantiles: Quantile levels to fit
+            feature_names: Columns of X to use
+            l2: Ridge penalty on the coefficients
+            smoothing: Softplus width as a fraction of each target's std
+
+        Returns:
+            Fitted model
+        """
+        from scipy.optimize import minimize
+        from scipy.special import expit
+
+        features = X[list(feature_names)].to_numpy(dtype=float)
+        mean = features.mean(axis=0)
+        scale = features.std(axis=0)
+        scale[scale == 0] = 1.0
+        Z = np.hstack([(features - mean) / scale, np.ones((len(features), 1))])
+
+        # One column per head: stat-major, quantile-minor
+        n_heads = len(PROJECTED_STATS) * len(quantiles)
+        targets = Y[list(PROJECTED_STATS)].to_numpy(dtype=float)
+        y = np.repeat(targets, len(quantiles), axis=1)
+        tau = np.tile(np.asarray(quantiles, dtype=float), len(PROJECTED_STATS))
+        width = np.maximum(smoothing * y.std(axis=0), 1e-3)
+
+        def objective(flat):
+            W = flat.reshape(Z.shape[1], n_heads)
+            r = (y - Z @ W) / width
+            # Smoothed pinball: (tau - 1) * r + softplus(r), scaled back by width
+            loss = width * ((tau - 1) * r + np.logaddexp(0, r))
+            grad = -Z.T @ (tau - 1 + expit(r)) / len(Z)
+            penalty = W[:-1]
+            return loss.mean(axis=0).sum() + 0.5 * l2 * (penalty ** 2).sum(), \
+                (grad + l2 * np.vstack([penalty, np.zeros((1, n_heads))])).ravel()
+
+        start = np.zeros((Z.shape[1], n_heads))
+        start[-1] = np.quantile(targets, quantiles, axis=0).T.ravel()
+        W = minimize(objective, start.ravel(), jac=True, method="L-BFGS-B",
+                     options={"maxiter": 2000}).x.reshape(Z.shape[1], n_heads)
+
+        coef = W[:-1] / scale[:, None]
+        intercept = W[-1] - (mean / scale) @ W[:-1]
+        return cls(feature_names, coef, intercept, PROJECTED_STATS, quantiles)
+
+    def save(self, path: str):
+        """Write the model as JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({
+                "feature_names": self.feature_names,
+                "stats": self.stats,
+                "quantiles": self.quantiles,
+                "coef": self.coef.tolist(),
+                "intercept": self.intercept.tolist(),
+            }, f)
+
+    @classmethod
+    def load(cls, path: str) -> "PlayerProjectionModel":
+        """Read a model written by save()"""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data["feature_names"], np.array(data["coef"]), np.array(data["intercept"]),
+                   data["stats"], data["quantiles"])
+
+
+def projection_confidence(projection: Dict[str, Dict[str, float]]) -> float:
+    """
+    Confidence in [0, 1] from how narrow the P10-P90 intervals are
+
+    Each stat scores 1 - width / (width + point + 1); the +1 keeps low-volume
+    stats like blocks from dominating. The result is the mean over stats.
+    """
+    scores = [
+        1 - (p["p90"] - p["p10"]) / (p["p90"] - p["p10"] + p["point"] + 1)
+        for p in projection.values()
+    ]
+    return float(min(max(sum(scores) / len(scores), 0.0), 1.0))
+
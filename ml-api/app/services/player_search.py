@@ -0,0 +1,139 @@
+from typing import Dict, Any, List, Optional
+from bisect import bisect_left
+from collections import Counter
+import re
+import unicodedata
+
+
+# Ranking tiers, lower is better
+EXACT_MATCH = 0
+NAME_PREFIX = 1
+TOKEN_PREFIX = 2
+FUZZY_MATCH = 3
+
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, and collapse whitespace"""
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_NON_ALNUM.sub("", ascii_name.lower()).split())
+
+
+def _trigrams(normalized: str) -> List[str]:
+    padded = f"  {normalized} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class PlayerSearchIndex:
+    """
+    In-memory player name index for autocomplete and typo-tolerant search
+
+    Prefix lookups use a sorted array of normalized names (plus every
+    trailing token, so "james" finds LeBron James) searched with bisect.
+    Fuzzy lookups use a trigram inverted index scored by Dice similarity.
+    """
+
+    def __init__(self, player_list: List[Dict[str, Any]], fuzzy_threshold: float = 0.35):
+        self.players = player_list
+        self.fuzzy_threshold = fuzzy_threshold
+        self._names = [normalize_name(p["full_name"]) for p in player_list]
+
+        keyed = []
+        for idx, name in enumerate(self._names):
+            tokens = name.split()
+            for start in range(len(tokens)):
+                keyed.append((" ".join(tokens[start:]), idx))
+        keyed.sort()
+        self._keys = [key for key, _ in keyed]
+        self._key_players = [idx for _, idx in keyed]
+
+        self._trigram_index: Dict[str, List[int]] = {}
+        self._trigram_counts = []
+        for idx, name in enumerate(self._names):
+            grams = set(_trigrams(name))
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._trigram_index.setdefault(gram, []).append(idx)
+
+    def _prefix_matches(self, query: str) -> Dict[int, int]:
+        """Return player index -> tier for every name or token starting with query"""
+        matches: Dict[int, int] = {}
+        pos = bisect_left(self._keys, query)
+        while pos < len(self._keys) and self._keys[pos].startswith(query):
+            idx = self._key_players[pos]
+            name = self._names[idx]
+            if name == query:
+                tier = EXACT_MATCH
+            elif name.startswith(query):
+                tier = NAME_PREFIX
+            else:
+                tier = TOKEN_PREFIX
+            matches[idx] = min(tier, matches.get(idx, tier))
+            pos += 1
+        return matches
+
+    def _fuzzy_matches(self, query: str) -> Dict[int, float]:
+        """Return player index -> Dice similarity for names above the threshold"""
+        grams = set(_trigrams(query))
+        if not grams:
+            return {}
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._trigram_index.get(gram, ()))
+        scores = {}
+        for idx, count in shared.items():
+            score = 2 * count / (len(grams) + self._trigram_counts[idx])
+            if score >= self.fuzzy_threshold:
+                scores[idx] = score
+        return scores
+
+    def search(self, query: str, limit: int = 25, active_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search for players by full or partial name
+
+        Args:
+            query: Player name fragment as typed by the user
+            limit: Maximum number of results to return
+            active_only: Only return currently active players
+
+        Returns:
+            Ranked list of player records (exact, prefix, last-name prefix,
+            then fuzzy matches; active players first within each tier)
+        """
+        normalized = normalize_name(query)
+        if not normalized or limit <= 0:
+            return []
+
+        def eligible(idx: int) -> bool:
+            return not active_only or self.players[idx]["is_active"]
+
+        ranked = {idx: (tier, 0.0) for idx, tier in self._prefix_matches(normalized).items()
+                  if eligible(idx)}
+        # Fill with fuzzy matches only when the filtered prefix matches fall short
+        if len(ranked) < limit:
+            for idx, score in self._fuzzy_matches(normalized).items():
+                if idx not in ranked and eligible(idx):
+                    ranked[idx] = (FUZZY_MATCH, -score)
+
+        candidates = list(ranked)
+        candidates.sort(key=lambda idx: (
+            ranked[idx][0],
+            ranked[idx][1],
+            not self.players[idx]["is_active"],
+            self._names[idx]
+        ))
+        return [self.players[idx] for idx in candidates[:limit]]
+
+
+_player_search_index: Optional[PlayerSearchIndex] = None
+
+
+def get_player_search_index() -> PlayerSearchIndex:
+    """Build the player search index on first use and return the shared instance"""
+    global _player_search_index
+    if _player_search_index is None:
+        from nba_api.stats.static import players
+        _player_search_index = PlayerSearchIndex(players.get_players())
+    return _player_search_index
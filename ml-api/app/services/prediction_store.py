@@ -0,0 +1,327 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from datetime import date, datetime, time as day_start, timedelta
+import asyncio
+import logging
+import time
+
+from app.services.availability import AvailabilityIndex, full_strength_availability, get_availability
+from app.services.data_fetcher import UpstreamUnavailableError, current_game_date, fetch_game_data, load_game_data, season_for_date
+from app.services.elo import EloRatings, elo_ratings_as_of, get_elo_ratings, team_position
+from app.services.feature_engineering import prepare_game_features
+from app.services.metrics import observe_stage, record_fallback
+from app.services.model_loder import ModelLoader
+from app.services.schedule import ScheduleTable, get_schedule_table
+from app.services.scheduler import get_scheduler
+from app.services.team_ratings import TeamRatings, get_team_ratings, team_ratings_as_of
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Days of the schedule, starting today, whose predictions are materialized
+MATERIALIZE_DAYS = 2
+# Past days whose replayed feature inputs are kept (they never change)
+HISTORICAL_INPUTS_SIZE = 32
+
+
+async def shared_instance(getter: Callable[..., Any], *args) -> Any:
+    """
+    A process-wide snapshot (ratings, schedule table, availability) for a request
+
+    The getters fetch from stats.nba.com when a refresh is due, so they are
+    never called on the event loop. While the scheduler runs its jobs own
+    the refreshes, and the cached instance is used as it is; one never
+    built, or any instance with the scheduler off, goes through the
+    refreshing getter in a worker thread.
+
+    Args:
+        getter: get_elo_ratings, get_team_ratings, get_schedule_table or
+            get_availability
+        *args: Arguments of the getter (the season of a schedule table)
+    """
+    cached = getter(*args, refresh=False)
+    if cached is None or not get_scheduler().running:
+        cached = await asyncio.to_thread(getter, *args)
+    return cached
+
+
+def _refreshed_inputs(season: str) -> Tuple[EloRatings, TeamRatings, ScheduleTable, AvailabilityIndex]:
+    return get_elo_ratings(), get_team_ratings(), get_schedule_table(season), get_availability()
+
+
+async def feature_inputs(season: str) -> Tuple[EloRatings, TeamRatings, ScheduleTable, AvailabilityIndex]:
+    """
+    Elo ratings, team ratings, a season's schedule table and availability
+
+    Read as shared_instance reads one of them, with a single worker thread
+    hop when any needs the refreshing getters.
+    """
+    inputs = (get_elo_ratings(refresh=False), get_team_ratings(refresh=False),
+              get_schedule_table(season, refresh=False), get_availability(refresh=False))
+    if any(value is None for value in inputs) or not get_scheduler().running:
+        inputs = await asyncio.to_thread(_refreshed_inputs, season)
+    return inputs
+
+
+# Feature inputs of past days, least recently built first
+_historical_inputs: Dict[date, Tuple[EloRatings, TeamRatings, ScheduleTable, AvailabilityIndex]] = {}
+
+
+def historical_feature_inputs(day: date) -> Tuple[EloRatings, TeamRatings, ScheduleTable, AvailabilityIndex]:
+    """
+    Feature inputs as they stood on the morning of a past day
+
+    Elo and team ratings are replayed from the game logs up to the day, as
+    training/update_model.build_game_rows does, so a past game_date sees
+    no games played on or after it; every team is at full strength, as
+    status reports only describe today. Fetches game logs, so it runs in a
+    worker thread. Inputs are kept once their ratings hold games (a failed
+    fetch is retried on the next request).
+
+    Args:
+        day: Day of the game, before today's slate date
+    """
+    cached = _historical_inputs.get(day)
+    if cached is not None:
+        return cached
+    inputs = (elo_ratings_as_of(day), team_ratings_as_of(day),
+              get_schedule_table(season_for_date(day)), full_strength_availability())
+    if inputs[0].games_applied and inputs[1].games_applied:
+        if len(_historical_inputs) >= HISTORICAL_INPUTS_SIZE:
+            del _historical_inputs[next(iter(_historical_inputs))]
+        _historical_inputs[day] = inputs
+    return inputs
+
+
+def feature_snapshot_version(
+    ratings: EloRatings,
+    team_ratings: TeamRatings,
+    schedule: ScheduleTable,
+    availability: AvailabilityIndex
+) -> Tuple:
+    """
+    Version of every input a game prediction depends on
+
+    Changes when games are applied to the Elo or team ratings (which is
+    also when team game logs gain a game), when the schedule table is
+    rebuilt, when the availability index is rebuilt or gets new status
+    reports, and when a model file is reloaded. The schedule table and
+    availability index are compared by identity: both are replaced, never
+    updated in place, when they change.
+    """
+    return (
+        ratings.season, ratings.games_applied,
+        team_ratings.season, team_ratings.games_applied,
+        schedule, availability, availability.version,
+        ModelLoader().loaded_versions(),
+    )
+
+
+def game_feature_row(
+    home_team_id: int,
+    away_team_id: int,
+    game_date: datetime,
+    home_data: Any,
+    away_data: Any,
+    ratings: EloRatings,
+    team_ratings: TeamRatings,
+    schedule: ScheduleTable,
+    availability: AvailabilityIndex
+) -> "pd.DataFrame":
+    """
+    Model input for one game from its teams' forms and the shared ratings
+
+    The prediction route and materialize_predictions both build features
+    here, so a stored prediction is exactly what the route would compute.
+    """
+    # Remove the impact of players reported out
+    home_data = availability.adjust_team_form(home_data, home_team_id)
+    away_data = availability.adjust_team_form(away_data, away_team_id)
+    return prepare_game_features(
+        home_data, away_data,
+        ratings.features(home_team_id, away_team_id),
+        schedule.features(home_team_id, away_team_id, game_date),
+        team_ratings.features(home_team_id, away_team_id))
+
+
+async def compute_home_win_probability(
+    home_team_id: int,
+    away_team_id: int,
+    game_date: datetime,
+    ratings: EloRatings,
+    team_ratings: TeamRatings,
+    schedule: ScheduleTable,
+    availability: AvailabilityIndex
+) -> float:
+    """
+    On-demand prediction for a game not served from the prediction store
+
+    Used by /predict/game and for the live win probability prior, so both
+    give the same answer for a game. Falls back to the Elo ratings when
+    the team game logs cannot be fetched.
+    """
+    with observe_stage("upstream_fetch"):
+        try:
+            home_data = await fetch_game_data(home_team_id, game_date)
+            away_data = await fetch_game_data(away_team_id, game_date)
+        except UpstreamUnavailableError as e:
+            logger.warning(f"Falling back to Elo ratings: {e}")
+            record_fallback("elo")
+            home_data = away_data = None
+
+    if home_data is None:
+        # Ratings are in memory, so this answer needs no upstream data
+        with observe_stage("model_inference"):
+            return ratings.win_probability(home_team_id, away_team_id)
+
+    with observe_stage("feature_engineering"):
+        features = game_feature_row(home_team_id, away_team_id, game_date, home_data, away_data,
+                                    ratings, team_ratings, schedule, availability)
+
+    loader = ModelLoader()
+    model = loader.get_game_prediction_model()
+    calibrator = loader.get_game_calibrator()
+    with observe_stage("model_inference"):
+        home_win_probability = float(model.predict_proba(features)[0][1])
+        if calibrator is not None:
+            home_win_probability = float(calibrator.transform(home_win_probability))
+    return home_win_probability
+
+
+class PredictionStore:
+    """
+    Home win probabilities of scheduled games, computed ahead of requests
+
+    Entries are keyed by (home position, away position, day) and carry the
+    feature snapshot version they were computed from; a lookup only hits
+    when the caller's current version is the same, so any change to the
+    inputs makes the route compute on demand until the entry is refreshed.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[int, int, date], Tuple[float, Tuple]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(home_team_id: int, away_team_id: int, game_date: date) -> Tuple[int, int, date]:
+        if isinstance(game_date, datetime):
+            game_date = game_date.date()
+        return team_position(home_team_id), team_position(away_team_id), game_date
+
+    def get(self, home_team_id: int, away_team_id: int, game_date: date, version: Tuple) -> Optional[float]:
+        """Stored home win probability, or None if missing or computed from other inputs"""
+        entry = self._entries.get(self._key(home_team_id, away_team_id, game_date))
+        if entry is None or entry[1] != version:
+            return None
+        return entry[0]
+
+    def put(self, home_team_id: int, away_team_id: int, game_date: date, probability: float, version: Tuple):
+        self._entries[self._key(home_team_id, away_team_id, game_date)] = (probability, version)
+
+    def prune(self, before: date) -> int:
+        """Drop entries for days before a date; returns how many were dropped"""
+        stale = [key for key in self._entries if key[2] < before]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+
+_store: Optional[PredictionStore] = None
+
+
+def get_prediction_store() -> PredictionStore:
+    """Return the process-wide prediction store"""
+    global _store
+    if _store is None:
+        _store = PredictionStore()
+    return _store
+
+
+def _score_games(games: List[Tuple]) -> Tuple[List[Tuple], List[float]]:
+    """
+    Fetch team forms, build features and score games (blocking; run in a worker thread)
+
+    Args:
+        games: (home, away, day, version, inputs) per game, where inputs are
+            the feature_inputs the version was taken from
+
+    Returns:
+        (home, away, day, version) of the games scored and their home win
+        probabilities; games whose team logs cannot be fetched are left out
+    """
+    import pandas as pd
+
+    rows, scored = [], []
+    for home, away, day, version, (ratings, team_ratings, schedule, availability) in games:
+        game_date = datetime.combine(day, day_start())
+        try:
+            home_data = load_game_data(home, game_date)
+            away_data = load_game_data(away, game_date)
+        except UpstreamUnavailableError:
+            continue
+        rows.append(game_feature_row(home, away, game_date, home_data, away_data,
+                                     ratings, team_ratings, schedule, availability))
+        scored.append((home, away, day, version))
+    if not rows:
+        return [], []
+
+    loader = ModelLoader()
+    probabilities = loader.get_game_prediction_model().predict_proba(pd.concat(rows, ignore_index=True))[:, 1]
+    calibrator = loader.get_game_calibrator()
+    if calibrator is not None:
+        probabilities = calibrator.transform(probabilities)
+    return scored, [float(p) for p in probabilities]
+
+
+async def materialize_predictions(today: Optional[date] = None, days: int = MATERIALIZE_DAYS) -> Dict[str, Any]:
+    """
+    Compute and store predictions for every upcoming scheduled game
+
+    Games whose stored entry already matches the current feature snapshot
+    are skipped, so running this after every refresh only recomputes what
+    changed. The remaining games' features are built one by one (team game
+    logs come from the shared cache) and scored in a single model call,
+    all in one worker thread; only the store updates run on the event
+    loop. Games whose team logs cannot be fetched are left to the route's
+    Elo fallback.
+
+    Args:
+        today: First day to materialize (defaults to today's slate date)
+        days: Number of days from today
+
+    Returns:
+        Counts of scheduled, already current, computed and unavailable games
+    """
+    start = time.perf_counter()
+    today = today or current_game_date()
+    store = get_prediction_store()
+    store.prune(today)
+
+    pending = []
+    scheduled = current = 0
+    for offset in range(days):
+        day = today + timedelta(days=offset)
+        inputs = await feature_inputs(season_for_date(day))
+        ratings, team_ratings, schedule, availability = inputs
+        version = feature_snapshot_version(ratings, team_ratings, schedule, availability)
+        for game in schedule.games_on(day).itertuples(index=False):
+            scheduled += 1
+            # Entries are keyed by team position, so requests sending the API's
+            # 1-30 numbers find these; logs are fetched by the NBA IDs
+            home, away = int(game.home_team_id), int(game.away_team_id)
+            if store.get(home, away, day, version) is not None:
+                current += 1
+                continue
+            pending.append((home, away, day, version, inputs))
+
+    scored, probabilities = await asyncio.to_thread(_score_games, pending) if pending else ([], [])
+    for (home, away, day, version), probability in zip(scored, probabilities):
+        store.put(home, away, day, probability, version)
+    if scored:
+        logger.info(f"Materialized {len(scored)} game predictions in "
+                    f"{(time.perf_counter() - start) * 1000:.1f} ms")
+    return {"scheduled": scheduled, "current": current, "computed": len(scored),
+            "unavailable": len(pending) - len(scored)}
@@ -0,0 +1,109 @@
+from typing import Dict, Any, List
+from collections import Counter
+import os
+import sys
+import threading
+import time
+
+# Only one profile may run per worker at a time
+_profile_lock = threading.Lock()
+
+# Leaf frames of threads that are parked waiting for work
+IDLE_LEAVES = frozenset({
+    "threading.py:wait",
+    "selectors.py:select",
+    "queue.py:get",
+    "thread.py:_worker",
+})
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running"""
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def _collapse(frame) -> str:
+    """Render a thread's stack root-first as "a;b;c" """
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(seconds: float, interval: float = 0.005, include_idle: bool = False) -> Counter:
+    """
+    Statistically sample the stacks of every other thread in this process
+
+    The calling thread does the sampling and is excluded from the result.
+    Nothing is installed in the interpreter (no sys.setprofile or trace
+    hook), so there is no overhead outside of an active profile.
+
+    Args:
+        seconds: How long to sample for
+        interval: Delay between samples in seconds
+        include_idle: Keep samples of threads parked waiting for work
+
+    Returns:
+        Counter mapping collapsed stacks to sample counts
+    """
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running in this worker")
+
+    try:
+        own_thread = threading.get_ident()
+        stacks: Counter = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                if not include_idle and _frame_label(frame) in IDLE_LEAVES:
+                    continue
+                stacks[_collapse(frame)] += 1
+            time.sleep(interval)
+        return stacks
+    finally:
+        _profile_lock.release()
+
+
+def to_collapsed(stacks: Counter) -> str:
+    """Format samples as collapsed stacks (flamegraph.pl / speedscope input)"""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def top_functions(stacks: Counter, limit: int = 25) -> List[Dict[str, Any]]:
+    """
+    Summarize samples per function
+
+    Args:
+        stacks: Output of sample_stacks
+        limit: Number of functions to return
+
+    Returns:
+        Functions ordered by self samples, with self and total (inclusive)
+        sample counts and percentages
+    """
+    total_samples = sum(stacks.values()) or 1
+    self_counts: Counter = Counter()
+    total_counts: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        self_counts[frames[-1]] += count
+        for label in set(frames):
+            total_counts[label] += count
+
+    return [
+        {
+            "function": label,
+            "self_samples": count,
+            "self_pct": round(100 * count / total_samples, 2),
+            "total_samples": total_counts[label],
+            "total_pct": round(100 * total_counts[label] / total_samples, 2),
+        }
+        for label, count in self_counts.most_common(limit)
+    ]
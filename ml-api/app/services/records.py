@@ -0,0 +1,118 @@
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class _FormRecord:
+    """
+    Compact, slotted aggregate record with lazy access to its raw game rows
+
+    The feature builders only read a handful of averages, so the fetchers
+    return these instead of a dict carrying every game log row. The rows
+    stay in the fetched frame and are converted to dicts only when `games`
+    is read. Mapping-style access (record["avg_points"], record.get(...))
+    is supported so callers written against the old dicts keep working.
+    """
+    __slots__ = ("_game_log", "_games")
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, game_log: Optional["pd.DataFrame"] = None):
+        self._game_log = game_log
+        self._games: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def games(self) -> List[Dict[str, Any]]:
+        """Raw game log rows the aggregates were computed from (built on first access)"""
+        if self._games is None:
+            self._games = [] if self._game_log is None else self._game_log.to_dict('records')
+        return self._games
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self.FIELDS or name == "games":
+            return getattr(self, name)
+        return default
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self.FIELDS or name == "games":
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Aggregates as a plain dict (without the raw games)"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({values})"
+
+
+class TeamForm(_FormRecord):
+    """Recent-form aggregates for one team, as returned by fetch_game_data"""
+    __slots__ = ("team_id", "avg_points", "avg_points_allowed", "win_percentage",
+                 "home_win_percentage", "away_win_percentage", "last_5_record", "rest_days")
+    FIELDS = __slots__
+
+    def __init__(
+        self,
+        team_id: int,
+        avg_points: float = 0.0,
+        avg_points_allowed: float = 0.0,
+        win_percentage: float = 0.0,
+        home_win_percentage: float = 0.0,
+        away_win_percentage: float = 0.0,
+        last_5_record: str = "0-0",
+        rest_days: int = 0,
+        game_log: Optional["pd.DataFrame"] = None
+    ):
+        super().__init__(game_log)
+        self.team_id = team_id
+        self.avg_points = avg_points
+        self.avg_points_allowed = avg_points_allowed
+        self.win_percentage = win_percentage
+        self.home_win_percentage = home_win_percentage
+        self.away_win_percentage = away_win_percentage
+        self.last_5_record = last_5_record
+        self.rest_days = rest_days
+
+
+class PlayerForm(_FormRecord):
+    """Recent per-game averages for one player, as returned by fetch_player_stats"""
+    __slots__ = ("player_id", "avg_points", "avg_rebounds", "avg_assists", "avg_steals",
+                 "avg_blocks", "fg_percentage", "three_pt_percentage", "ft_percentage",
+                 "minutes_per_game", "games_played", "avg_fga", "avg_fta", "avg_turnovers")
+    FIELDS = __slots__
+
+    def __init__(
+        self,
+        player_id: int,
+        avg_points: float = 0.0,
+        avg_rebounds: float = 0.0,
+        avg_assists: float = 0.0,
+        avg_steals: float = 0.0,
+        avg_blocks: float = 0.0,
+        fg_percentage: float = 0.0,
+        three_pt_percentage: float = 0.0,
+        ft_percentage: float = 0.0,
+        minutes_per_game: float = 0.0,
+        games_played: int = 0,
+        avg_fga: float = 0.0,
+        avg_fta: float = 0.0,
+        avg_turnovers: float = 0.0,
+        game_log: Optional["pd.DataFrame"] = None
+    ):
+        super().__init__(game_log)
+        self.player_id = player_id
+        self.avg_points = avg_points
+        self.avg_rebounds = avg_rebounds
+        self.avg_assists = avg_assists
+        self.avg_steals = avg_steals
+        self.avg_blocks = avg_blocks
+        self.fg_percentage = fg_percentage
+        self.three_pt_percentage = three_pt_percentage
+        self.ft_percentage = ft_percentage
+        self.minutes_per_game = minutes_per_game
+        self.games_played = games_played
+        self.avg_fga = avg_fga
+        self.avg_fta = avg_fta
+        self.avg_turnovers = avg_turnovers
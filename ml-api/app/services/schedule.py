@@ -0,0 +1,308 @@
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+from datetime import date, datetime
+import logging
+import os
+import time
+
+import numpy as np
+
+from app.services.data_fetcher import season_for_date
+from app.services.data_source import fetch_frames
+from app.services.elo import team_position
+from app.services.standings import TEAM_INDEX
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Home arena of every franchise: latitude, longitude and UTC offset in
+# standard time (the few weeks of daylight saving time shift every arena
+# but Phoenix equally, so shifts between arenas barely change)
+ARENAS = {
+    "ATL": (33.757, -84.396, -5), "BOS": (42.366, -71.062, -5), "BKN": (40.683, -73.976, -5),
+    "CHA": (35.225, -80.839, -5), "CHI": (41.881, -87.674, -6), "CLE": (41.496, -81.688, -5),
+    "DAL": (32.790, -96.810, -6), "DEN": (39.749, -105.008, -7), "DET": (42.341, -83.055, -5),
+    "GSW": (37.768, -122.388, -8), "HOU": (29.751, -95.362, -6), "IND": (39.764, -86.156, -5),
+    "LAC": (33.945, -118.343, -8), "LAL": (34.043, -118.267, -8), "MEM": (35.138, -90.051, -6),
+    "MIA": (25.781, -80.188, -5), "MIL": (43.045, -87.917, -6), "MIN": (44.979, -93.276, -6),
+    "NOP": (29.949, -90.082, -6), "NYK": (40.751, -73.993, -5), "OKC": (35.463, -97.515, -6),
+    "ORL": (28.539, -81.384, -5), "PHI": (39.901, -75.172, -5), "PHX": (33.446, -112.071, -7),
+    "POR": (45.532, -122.667, -8), "SAC": (38.580, -121.500, -8), "SAS": (29.427, -98.438, -6),
+    "TOR": (43.643, -79.379, -5), "UTA": (40.768, -111.901, -7), "WAS": (38.898, -77.021, -5),
+}
+
+# Games counted by the recent_games feature: those in this many days before the game
+GAMES_WINDOW_DAYS = 7
+
+# Per-team schedule features, in table column order
+SCHEDULE_FEATURES = ("back_to_back", "recent_games", "travel_km", "tz_shift")
+
+# Schedule features of two rested teams playing at home
+NEUTRAL_SCHEDULE_FEATURES = {
+    f"{side}_{name}": 0.0 for side in ("home", "away") for name in SCHEDULE_FEATURES}
+
+# Seconds before a season's schedule is fetched and indexed again
+SCHEDULE_REFRESH_INTERVAL = float(os.getenv("SCHEDULE_REFRESH_INTERVAL", "21600"))
+# Seconds before a failed fetch is retried while the previous table is kept
+SCHEDULE_RETRY_INTERVAL = float(os.getenv("SCHEDULE_RETRY_INTERVAL", "300"))
+
+EARTH_RADIUS_KM = 6371.0
+
+# Team position * _KEY_STRIDE + day number orders rows by team, then date
+_KEY_STRIDE = 1 << 32
+
+
+def _arena_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """Great-circle distances (km) between arenas and their UTC offsets, by team position"""
+    arenas = np.zeros((len(TEAM_INDEX), 3))
+    for team in TEAM_INDEX.values():
+        arenas[team["index"]] = ARENAS[team["abbreviation"]]
+    lat, lon = np.radians(arenas[:, 0]), np.radians(arenas[:, 1])
+    a = np.sin((lat[:, None] - lat[None, :]) / 2) ** 2 + \
+        np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin((lon[:, None] - lon[None, :]) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a)), arenas[:, 2]
+
+
+# Built once at import; 30 x 30 lookups replace per-game trigonometry
+ARENA_DISTANCES_KM, ARENA_UTC_OFFSETS = _arena_tables()
+
+
+def _day_number(game_date: date) -> int:
+    """Days since 1970-01-01 of a date or datetime"""
+    if isinstance(game_date, datetime):
+        game_date = game_date.date()
+    return game_date.toordinal() - 719163
+
+
+class ScheduleTable:
+    """
+    Schedule features of every team-game in a season, precomputed
+
+    Rows are the two team-games of each scheduled game, ordered by team
+    and date and keyed by (team position, day number). Each row holds:
+
+    - back_to_back: 1 if the team played the day before
+    - recent_games: games the team played in the GAMES_WINDOW_DAYS days before
+    - travel_km: distance from the previous game's arena (from home for a
+      team's first game)
+    - tz_shift: hours the clock moved since the previous game, positive
+      when travelling east
+
+    Games are placed in the home team's arena. Building a season is a few
+    sorted-array passes; afterwards a scheduled game's features are one
+    dictionary lookup, and an unscheduled matchup (e.g. a what-if request)
+    is computed from the team's neighbouring games by binary search.
+
+    Args:
+        games: Rows with game_date, home_team_id and away_team_id (see
+            games_from_league_schedule or elo.games_from_league_log)
+    """
+
+    def __init__(self, games: "pd.DataFrame"):
+        self.games = games
+        home = np.array([team_position(t) for t in games["home_team_id"]], dtype=np.int64)
+        away = np.array([team_position(t) for t in games["away_team_id"]], dtype=np.int64)
+        days = np.array([_day_number(d) for d in games["game_date"]], dtype=np.int64)
+
+        positions = np.concatenate([home, away])
+        keys = positions * _KEY_STRIDE + np.concatenate([days, days])
+        order = np.argsort(keys, kind="mergesort")
+        self.keys = keys[order]
+        self.arenas = np.concatenate([home, home])[order]
+        self.values = self._compute(self.keys, self.arenas)
+        self._rows = {int(key): row for row, key in enumerate(self.keys)}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _compute(self, keys: np.ndarray, arenas: np.ndarray) -> np.ndarray:
+        """
+        Feature rows for team-games given as keys and arena positions
+
+        The table's own rows and ad hoc queries go through the same code:
+        each query is located among the table keys by binary search, and
+        the row just before it is that team's previous game.
+        """
+        positions = keys // _KEY_STRIDE
+        days = keys % _KEY_STRIDE
+        start = np.searchsorted(self.keys, keys, side="left")
+
+        if len(self.keys):
+            previous = np.maximum(start - 1, 0)
+            has_previous = (start > 0) & (self.keys[previous] // _KEY_STRIDE == positions)
+            previous_day = np.where(has_previous, self.keys[previous] % _KEY_STRIDE, -1)
+            previous_arena = np.where(has_previous, self.arenas[previous], positions)
+        else:
+            has_previous = np.zeros(len(keys), dtype=bool)
+            previous_day, previous_arena = np.full(len(keys), -1), positions
+
+        window_start = np.searchsorted(self.keys, keys - GAMES_WINDOW_DAYS, side="left")
+        return np.column_stack([
+            (has_previous & (days - previous_day == 1)).astype(float),
+            (start - window_start).astype(float),
+            ARENA_DISTANCES_KM[previous_arena, arenas],
+            ARENA_UTC_OFFSETS[arenas] - ARENA_UTC_OFFSETS[previous_arena],
+        ])
+
+    def games_on(self, game_date: date) -> "pd.DataFrame":
+        """Scheduled games on a day, in the games frame's columns"""
+        return self.games[self.games["game_date"] == game_date]
+
+    def lookup(self, team_id: int, game_date: date) -> Optional[np.ndarray]:
+        """Precomputed features of a team's scheduled game on a date, or None"""
+        row = self._rows.get(team_position(team_id) * _KEY_STRIDE + _day_number(game_date))
+        return None if row is None else self.values[row]
+
+    def features(self, home_team_id: int, away_team_id: int, game_date: date) -> Dict[str, float]:
+        """
+        Schedule features for prepare_game_features
+
+        Args:
+            home_team_id: Home team (NBA ID or 1-30)
+            away_team_id: Away team
+            game_date: Day of the game
+
+        Returns:
+            home_/away_ prefixed SCHEDULE_FEATURES
+        """
+        day = _day_number(game_date)
+        arena = team_position(home_team_id)
+        features = {}
+        for side, team_id in (("home", home_team_id), ("away", away_team_id)):
+            key = team_position(team_id) * _KEY_STRIDE + day
+            row = self._rows.get(key)
+            # Only trust the scheduled row if the game is in this arena
+            if row is not None and self.arenas[row] == arena:
+                values = self.values[row]
+            else:
+                values = self._compute(np.array([key]), np.array([arena]))[0]
+            features.update({f"{side}_{name}": float(value) for name, value in zip(SCHEDULE_FEATURES, values)})
+        return features
+
+    def game_columns(self, games: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Schedule features of many games at once, as prepare_game_features columns
+
+        Args:
+            games: Rows with game_date, home_team_id and away_team_id
+
+        Returns:
+            One row per game (same order) with home_/away_ prefixed features
+        """
+        import pandas as pd
+
+        home = np.array([team_position(t) for t in games["home_team_id"]], dtype=np.int64)
+        away = np.array([team_position(t) for t in games["away_team_id"]], dtype=np.int64)
+        days = np.array([_day_number(d) for d in games["game_date"]], dtype=np.int64)
+        columns = {}
+        for side, positions in (("home", home), ("away", away)):
+            values = self._compute(positions * _KEY_STRIDE + days, home)
+            columns.update({f"{side}_{name}": values[:, i] for i, name in enumerate(SCHEDULE_FEATURES)})
+        return pd.DataFrame(columns, index=games.index)
+
+
+def games_from_league_schedule(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Regular-season games from ScheduleLeagueV2 SeasonGames rows
+
+    Includes games not yet played; playoff placeholders without both teams
+    are dropped.
+
+    Args:
+        df: SeasonGames rows
+
+    Returns:
+        DataFrame with game_id, game_date, home_team_id and away_team_id, oldest first
+    """
+    import pandas as pd
+
+    columns = ["game_id", "game_date", "home_team_id", "away_team_id"]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    games = df[df["gameId"].astype(str).str.startswith("002")
+               & (df["homeTeam_teamId"] > 0) & (df["awayTeam_teamId"] > 0)]
+    games = pd.DataFrame({
+        "game_id": games["gameId"].astype(str),
+        "game_date": pd.to_datetime(games["gameDateEst"].str[:10]).dt.date,
+        "home_team_id": games["homeTeam_teamId"].astype(int),
+        "away_team_id": games["awayTeam_teamId"].astype(int),
+    })
+    return games.sort_values(["game_date", "game_id"], kind="mergesort")[columns].reset_index(drop=True)
+
+
+def fetch_season_schedule(season: str) -> "pd.DataFrame":
+    """
+    Every regular-season game of a season, played or not
+
+    Falls back to the games already played (LeagueGameLog) when the
+    schedule endpoint is unavailable.
+    """
+    try:
+        return games_from_league_schedule(fetch_frames("ScheduleLeagueV2", season=season)[0])
+    except Exception as e:
+        logger.warning(f"Could not fetch the {season} schedule, using played games: {e}")
+    from app.services.elo import fetch_season_games
+    return fetch_season_games(season)
+
+
+# Schedule tables shared by every request in this process, with the time
+# (time.monotonic) they are due to be rebuilt
+_tables: Dict[str, Tuple[ScheduleTable, float]] = {}
+
+
+def refresh_schedule_table(season: str) -> ScheduleTable:
+    """
+    Fetch and index a season's schedule now, replacing this process's table
+
+    If the schedule cannot be fetched, the table already built (if any) is
+    kept and the fetch is retried after SCHEDULE_RETRY_INTERVAL seconds;
+    only a season never built gets an empty table, where every game is
+    computed from no previous games.
+
+    Args:
+        season: Season string
+    """
+    import pandas as pd
+
+    start = time.perf_counter()
+    try:
+        games = fetch_season_schedule(season)
+    except Exception as e:
+        cached = _tables.get(season)
+        if cached is not None:
+            logger.warning(f"Could not fetch {season} games for schedule features, "
+                           f"keeping the previous table: {e}")
+            _tables[season] = (cached[0], time.monotonic() + SCHEDULE_RETRY_INTERVAL)
+            return cached[0]
+        logger.warning(f"Could not fetch {season} games for schedule features: {e}")
+        table = ScheduleTable(pd.DataFrame(columns=["game_date", "home_team_id", "away_team_id"]))
+        _tables[season] = (table, time.monotonic() + SCHEDULE_RETRY_INTERVAL)
+        return table
+    table = ScheduleTable(games)
+    logger.info(f"Indexed {len(table)} {season} team-games in "
+                f"{(time.perf_counter() - start) * 1000:.1f} ms")
+    _tables[season] = (table, time.monotonic() + SCHEDULE_REFRESH_INTERVAL)
+    return table
+
+
+def get_schedule_table(season: Optional[str] = None, refresh: bool = True) -> Optional[ScheduleTable]:
+    """
+    Precomputed schedule features of a season for this process
+
+    Built on first use and rebuilt at most every SCHEDULE_REFRESH_INTERVAL
+    seconds (postponed games move), or SCHEDULE_RETRY_INTERVAL seconds
+    after a failed fetch.
+
+    Args:
+        season: Season string (defaults to the current season)
+        refresh: False to return the table as it is without fetching
+            anything (None when never built), as the request path does
+    """
+    season = season or season_for_date(datetime.now().date())
+    cached = _tables.get(season)
+    if not refresh:
+        return cached[0] if cached is not None else None
+    if cached is None or time.monotonic() >= cached[1]:
+        return refresh_schedule_table(season)
+    return cached[0]
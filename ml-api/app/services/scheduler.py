@@ -0,0 +1,318 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+from datetime import datetime, timedelta
+import asyncio
+import inspect
+import logging
+import os
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# Time zone cron expressions are evaluated in; NBA slates follow US Eastern time
+SCHEDULER_TIMEZONE = os.getenv("SCHEDULER_TIMEZONE", "America/New_York")
+# Jobs running at once across the whole scheduler
+SCHEDULER_MAX_CONCURRENT = int(os.getenv("SCHEDULER_MAX_CONCURRENT", "2"))
+
+_CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+}
+# (low, high) of minute, hour, day of month, month, day of week (0 = Sunday)
+_CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+
+def scheduler_timezone():
+    """SCHEDULER_TIMEZONE as a tzinfo, UTC if the zone database lacks it"""
+    from datetime import timezone
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+    try:
+        return ZoneInfo(SCHEDULER_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Unknown time zone {SCHEDULER_TIMEZONE}, scheduling in UTC")
+        return timezone.utc
+
+
+class CronSchedule:
+    """
+    Five-field cron expression: minute, hour, day of month, month, day of week
+
+    Fields accept *, numbers, ranges (1-5), lists (1,15) and steps (*/15,
+    0-12/2); @hourly, @daily and @weekly are accepted as shorthands. As in
+    cron, a day matches if either day field matches when both are restricted.
+
+    Args:
+        expression: Cron expression, e.g. "30 4 * * *" for 04:30 daily
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = _CRON_ALIASES.get(expression, expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse(field, low, high) for field, (low, high) in zip(fields, _CRON_FIELDS))
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> Set[int]:
+        values = set()
+        for part in field.split(","):
+            spec, _, step = part.partition("/")
+            if spec == "*":
+                start, end = low, high
+            elif "-" in spec:
+                start, end = (int(v) for v in spec.split("-"))
+            else:
+                start = end = int(spec)
+                if step:
+                    end = high
+            if not low <= start <= end <= high:
+                raise ValueError(f"Cron field {field!r} outside {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.isoweekday() % 7) in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        First matching minute strictly after a moment
+
+        Walks month, day, hour and minute fields coarsest first, so a
+        nightly job is found in a few steps rather than minute by minute.
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1,
+                                              day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
+
+
+class Job:
+    """
+    A named callable run on a cron schedule, with its run history
+
+    Args:
+        name: Unique job name
+        schedule: Cron expression
+        func: Async callable, or plain callable run in a worker thread
+        max_instances: Runs of this job allowed at once; a due run beyond
+            the limit is skipped rather than queued
+        jitter: Up to this many seconds of random delay per run, so
+            workers and jobs due at the same minute don't fire together
+        timeout: Seconds before a run is cancelled (None for no limit).
+            A plain callable's thread cannot be stopped: its run is
+            recorded as timed out but keeps its slot, and counts against
+            max_instances, until the thread returns
+    """
+
+    def __init__(
+        self,
+        name: str,
+        schedule: str,
+        func: Callable[[], Union[Any, Awaitable[Any]]],
+        max_instances: int = 1,
+        jitter: float = 0.0,
+        timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.schedule = CronSchedule(schedule)
+        self.func = func
+        self.max_instances = max_instances
+        self.jitter = jitter
+        self.timeout = timeout
+        self.running = 0
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.next_run: Optional[datetime] = None
+        self.last_started: Optional[datetime] = None
+        self.last_finished: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_status: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_result: Any = None
+
+    def status(self) -> Dict[str, Any]:
+        """Schedule, last run time, duration and outcome"""
+        def iso(moment):
+            return moment.isoformat() if moment else None
+
+        return {
+            "name": self.name,
+            "schedule": self.schedule.expression,
+            "running": self.running,
+            "max_instances": self.max_instances,
+            "next_run": iso(self.next_run),
+            "last_started": iso(self.last_started),
+            "last_finished": iso(self.last_finished),
+            "last_duration_seconds": self.last_duration,
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "last_result": self.last_result,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+        }
+
+
+class JobScheduler:
+    """
+    In-process async scheduler for periodic maintenance jobs
+
+    Each job has its own task that sleeps until its next cron time (plus
+    jitter) and then starts a run, so a slow job never delays another
+    job's schedule. Runs are limited per job (max_instances) and across
+    the scheduler (max_concurrent); plain functions run in a worker thread
+    so they never block request handling. A timeout cancels an async job,
+    but cannot stop a thread: a timed-out plain function keeps counting
+    against both limits until it returns.
+
+    Args:
+        max_concurrent: Runs allowed at once across all jobs
+        timezone: tzinfo cron expressions are evaluated in
+    """
+
+    def __init__(self, max_concurrent: int = SCHEDULER_MAX_CONCURRENT, timezone: Any = None):
+        self.max_concurrent = max_concurrent
+        self.timezone = timezone or scheduler_timezone()
+        self.jobs: Dict[str, Job] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: List[asyncio.Task] = []
+        self._runs: Set[asyncio.Task] = set()
+
+    def add_job(self, name: str, schedule: str, func: Callable, **options) -> Job:
+        """Register a job (see Job for options); jobs added after start() run from the next start()"""
+        if name in self.jobs:
+            raise ValueError(f"Job {name} is already registered")
+        job = Job(name, schedule, func, **options)
+        self.jobs[name] = job
+        return job
+
+    @property
+    def running(self) -> bool:
+        """Whether start() has been called (and stop() has not)"""
+        return bool(self._tasks)
+
+    def now(self) -> datetime:
+        return datetime.now(self.timezone)
+
+    def start(self):
+        """Start one scheduling task per job on the running event loop"""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._schedule(job), name=f"job:{job.name}")
+                       for job in self.jobs.values()]
+        logger.info(f"Scheduler started with {len(self._tasks)} jobs")
+
+    async def stop(self):
+        """Cancel scheduling tasks and any runs in progress"""
+        tasks = self._tasks + list(self._runs)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._runs.clear()
+        self._slots = None
+
+    async def _schedule(self, job: Job):
+        while True:
+            job.next_run = job.schedule.next_after(self.now())
+            # Timestamps, not datetime subtraction, so DST changes don't shift the wait
+            delay = job.next_run.timestamp() - time.time() + random.uniform(0, job.jitter)
+            await asyncio.sleep(max(delay, 0))
+            self.trigger(job.name)
+
+    def trigger(self, name: str) -> bool:
+        """
+        Start a run of a job now, unless it is at its concurrency limit
+
+        Returns:
+            True if a run was started, False if it was skipped
+        """
+        job = self.jobs[name]
+        if job.running >= job.max_instances:
+            job.skipped += 1
+            job.last_status = "skipped"
+            logger.warning(f"Job {name} skipped: {job.running} run(s) still in progress")
+            return False
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+        job.running += 1
+        task = asyncio.create_task(self._run(job))
+        self._runs.add(task)
+        task.add_done_callback(self._runs.discard)
+        return True
+
+    async def _run(self, job: Job):
+        try:
+            async with self._slots:
+                job.last_started = self.now()
+                start = time.perf_counter()
+                try:
+                    job.last_result = await self._call(job)
+                    job.last_status, job.last_error = "ok", None
+                except asyncio.CancelledError:
+                    job.last_status = "cancelled"
+                    raise
+                except asyncio.TimeoutError:
+                    job.failures += 1
+                    job.last_status, job.last_error = "timed_out", f"No result after {job.timeout}s"
+                except Exception as e:
+                    job.failures += 1
+                    job.last_status, job.last_error = "error", f"{type(e).__name__}: {e}"
+                    logger.error(f"Job {job.name} failed: {e}")
+                finally:
+                    job.runs += 1
+                    job.last_duration = time.perf_counter() - start
+                    job.last_finished = self.now()
+                    logger.info(f"Job {job.name} {job.last_status} in {job.last_duration:.2f}s")
+        finally:
+            job.running -= 1
+
+    async def _call(self, job: Job) -> Any:
+        if inspect.iscoroutinefunction(job.func):
+            return await asyncio.wait_for(job.func(), job.timeout)
+        thread = asyncio.ensure_future(asyncio.to_thread(job.func))
+        try:
+            return await asyncio.wait_for(asyncio.shield(thread), job.timeout)
+        except asyncio.TimeoutError:
+            # The thread runs on regardless; hold the run's slots until it returns
+            job.last_status = "timed_out"
+            logger.error(f"Job {job.name} timed out after {job.timeout}s, waiting for its thread")
+            await asyncio.gather(thread, return_exceptions=True)
+            raise
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Status of every job"""
+        return [job.status() for job in self.jobs.values()]
+
+
+_scheduler: Optional[JobScheduler] = None
+
+
+def get_scheduler() -> JobScheduler:
+    """Return the process-wide job scheduler"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler()
+    return _scheduler
@@ -0,0 +1,134 @@
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from functools import lru_cache
+import importlib.util
+
+import orjson
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+ARROW = "application/vnd.apache.arrow.stream"
+
+# Media types clients may ask for, mapped to the format they select
+_MEDIA_TYPES = {
+    JSON: JSON,
+    "application/*": JSON,
+    "*/*": JSON,
+    MSGPACK: MSGPACK,
+    "application/x-msgpack": MSGPACK,
+    ARROW: ARROW,
+}
+
+# Binary formats are optional dependencies
+_OPTIONAL_MODULES = {MSGPACK: "msgpack", ARROW: "pyarrow"}
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+@lru_cache(maxsize=1)
+def available_formats() -> List[str]:
+    """Response formats usable in this environment, JSON first"""
+    return [JSON] + [
+        media_type for media_type, module in _OPTIONAL_MODULES.items()
+        if importlib.util.find_spec(module) is not None
+    ]
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """
+    Pick the response format from an Accept header
+
+    Media ranges are tried in order of their q value. A missing header
+    means JSON.
+
+    Args:
+        accept: Value of the Accept header
+
+    Returns:
+        JSON, MSGPACK or ARROW
+
+    Raises:
+        HTTPException: 406 if none of the accepted types can be produced
+    """
+    if not accept:
+        return JSON
+
+    ranges = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            ranges.append((-quality, position, media_type.lower()))
+
+    formats = available_formats()
+    for _, _, media_type in sorted(ranges):
+        selected = _MEDIA_TYPES.get(media_type)
+        if selected in formats:
+            return selected
+
+    raise HTTPException(
+        status_code=status.HTTP_406_NOT_ACCEPTABLE,
+        detail=f"Supported response formats: {', '.join(formats)}"
+    )
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _arrow_stream(rows: List[Dict[str, Any]]) -> bytes:
+    import pyarrow as pa
+
+    table = pa.Table.from_pylist(rows)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_response(
+    payload: Any,
+    media_type: str = JSON,
+    rows: Optional[List[Dict[str, Any]]] = None
+) -> Response:
+    """
+    Serialize a payload without FastAPI's jsonable_encoder pass
+
+    JSON is written by orjson, which handles datetimes and numpy values
+    natively. MessagePack encodes the same structure in binary. Arrow is
+    tabular, so it encodes `rows` (or the payload as a single row) as an
+    IPC stream.
+
+    Args:
+        payload: Dict, list or pydantic model to return
+        media_type: Format from negotiate_media_type
+        rows: Records to send when Arrow is requested
+
+    Returns:
+        Response with the encoded body
+    """
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump()
+
+    if media_type == MSGPACK:
+        import msgpack
+        body = msgpack.packb(payload, default=_msgpack_default)
+    elif media_type == ARROW:
+        body = _arrow_stream(rows if rows is not None else [payload])
+    else:
+        body = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+    return Response(body, media_type=media_type)
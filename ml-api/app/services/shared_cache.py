@@ -0,0 +1,126 @@
+from typing import Any, Optional
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class UnsafeCachePathError(RuntimeError):
+    """Raised when the cache file could be written by another user"""
+
+
+def _check_private(path: str):
+    """
+    Refuse paths another local user could have planted or could write to
+
+    Values are unpickled on read, so whoever can write the file can run
+    code in the API. The file and its directory must belong to this user
+    and must not be group- or world-writable.
+    """
+    if not hasattr(os, "getuid"):
+        return
+    for target in (os.path.dirname(os.path.abspath(path)), path):
+        try:
+            st = os.stat(target)
+        except FileNotFoundError:
+            continue
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            raise UnsafeCachePathError(
+                f"{target} must be owned by uid {os.getuid()} and not group/world-writable")
+
+
+class SharedCache:
+    """
+    Key/value cache in a local SQLite file shared by every worker process
+
+    SQLite in WAL mode lets any number of readers proceed while one worker
+    writes, so a response fetched by one worker is served to all of them.
+    Each process (and thread) opens its own connection, because SQLite
+    connections must not cross a fork. Values are pickled, so the file must
+    live in a directory only this user can write (see _check_private).
+
+    Args:
+        path: SQLite database file
+        default_ttl: Seconds an entry stays valid when set() gets no ttl
+    """
+
+    def __init__(self, path: str, default_ttl: float = 3600.0):
+        self.path = path
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        _check_private(path)
+        if not os.path.exists(path):
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value for ttl seconds (default_ttl if not given)"""
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        self._connect().execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), expires_at)
+        )
+
+    def delete(self, key: str):
+        self._connect().execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed"""
+        cursor = self._connect().execute(
+            "DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+        return cursor.rowcount
+
+
+_shared_cache: Optional[SharedCache] = None
+_shared_cache_disabled = False
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """
+    Return the shared cache configured by SHARED_CACHE_PATH, or None if disabled
+
+    An unsafe path (see _check_private) disables the cache with an error
+    rather than reading a file someone else could have written.
+    """
+    global _shared_cache, _shared_cache_disabled
+    if _shared_cache is None and not _shared_cache_disabled:
+        path = os.getenv("SHARED_CACHE_PATH")
+        if not path:
+            return None
+        try:
+            _shared_cache = SharedCache(path)
+        except UnsafeCachePathError as e:
+            logger.error(f"Shared cache disabled: {e}")
+            _shared_cache_disabled = True
+            return None
+        logger.info(f"Using shared cache at {path}")
+    return _shared_cache
@@ -0,0 +1,167 @@
+from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from nba_api.stats.static import teams
+
+from app.services.metrics import record_cache_lookup
+
+
+# Conference and division for every franchise, keyed by abbreviation
+TEAM_DIVISIONS = {
+    "BOS": ("East", "Atlantic"), "BKN": ("East", "Atlantic"), "NYK": ("East", "Atlantic"),
+    "PHI": ("East", "Atlantic"), "TOR": ("East", "Atlantic"),
+    "CHI": ("East", "Central"), "CLE": ("East", "Central"), "DET": ("East", "Central"),
+    "IND": ("East", "Central"), "MIL": ("East", "Central"),
+    "ATL": ("East", "Southeast"), "CHA": ("East", "Southeast"), "MIA": ("East", "Southeast"),
+    "ORL": ("East", "Southeast"), "WAS": ("East", "Southeast"),
+    "DEN": ("West", "Northwest"), "MIN": ("West", "Northwest"), "OKC": ("West", "Northwest"),
+    "POR": ("West", "Northwest"), "UTA": ("West", "Northwest"),
+    "GSW": ("West", "Pacific"), "LAC": ("West", "Pacific"), "LAL": ("West", "Pacific"),
+    "PHX": ("West", "Pacific"), "SAC": ("West", "Pacific"),
+    "DAL": ("West", "Southwest"), "HOU": ("West", "Southwest"), "MEM": ("West", "Southwest"),
+    "NOP": ("West", "Southwest"), "SAS": ("West", "Southwest"),
+}
+
+LOGO_URL = "https://cdn.nba.com/logos/nba/{team_id}/global/L/logo.svg"
+
+
+def _build_team_index() -> Dict[int, Dict[str, Any]]:
+    """
+    Build the static team metadata index from nba_api's bundled team list
+
+    Returns:
+        Dictionary mapping NBA team ID to conference, division, abbreviation,
+        logo URL and a dense 0-29 position
+    """
+    index = {}
+    for position, team in enumerate(sorted(teams.get_teams(), key=lambda t: t["id"])):
+        conference, division = TEAM_DIVISIONS[team["abbreviation"]]
+        index[team["id"]] = {
+            "team_id": team["id"],
+            "index": position,
+            "name": team["full_name"],
+            "abbreviation": team["abbreviation"],
+            "conference": conference,
+            "division": division,
+            "logo": LOGO_URL.format(team_id=team["id"]),
+        }
+    return index
+
+
+# Built once at import; team metadata never changes during a season
+TEAM_INDEX = _build_team_index()
+
+# NBA team ID of each dense 0-29 position
+_POSITION_TEAM_IDS = {team["index"]: team_id for team_id, team in TEAM_INDEX.items()}
+
+# Computed standings keyed by (season, data_version)
+_standings_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=1)
+def _team_metadata():
+    """TEAM_INDEX as a DataFrame for merging; built on first use so pandas loads lazily"""
+    import pandas as pd
+    return pd.DataFrame.from_dict(TEAM_INDEX, orient="index")[
+        ["abbreviation", "conference", "division", "logo"]]
+
+
+def get_team_info(team_id: int) -> Dict[str, Any]:
+    """Look up static metadata for a team, or an empty dict if unknown"""
+    return TEAM_INDEX.get(int(team_id), {})
+
+
+def nba_team_id(team_id: int) -> int:
+    """
+    NBA team ID (1610612737...) of a team
+
+    Accepts NBA team IDs and the API's 1-30 team numbers (position + 1 in
+    TEAM_INDEX), so upstream endpoints and caches always see the NBA ID.
+    """
+    team_id = int(team_id)
+    if team_id in TEAM_INDEX:
+        return team_id
+    if team_id - 1 in _POSITION_TEAM_IDS:
+        return _POSITION_TEAM_IDS[team_id - 1]
+    raise KeyError(f"Unknown team {team_id}")
+
+
+def standings_data_version(standings_data: List[Dict[str, Any]]) -> int:
+    """
+    Identify a standings snapshot by the total number of games played
+
+    The total only changes when a game goes final, so two snapshots with
+    the same value produce the same table.
+    """
+    return int(sum(team.get("W", 0) + team.get("L", 0) for team in standings_data))
+
+
+def compute_standings(standings_data: List[Dict[str, Any]], season: str) -> Dict[str, Any]:
+    """
+    Compute conference and division standings, memoized per season and data version
+
+    Teams are ordered by win percentage, then wins, then point differential,
+    then name. Conference rank, division rank and games back are derived in
+    a single sort over the whole league.
+
+    Args:
+        standings_data: Team rows from LeagueDashTeamStats
+        season: Season string (e.g. "2025-26")
+
+    Returns:
+        Dictionary with "eastern" and "western" team lists and the season
+    """
+    if not standings_data:
+        return {"eastern": [], "western": [], "season": season}
+
+    key = (season, standings_data_version(standings_data))
+    cached = _standings_cache.get(key)
+    record_cache_lookup("standings", cached is not None)
+    if cached is not None:
+        return cached
+
+    import pandas as pd
+    df = pd.DataFrame(standings_data)
+    if "PLUS_MINUS" not in df.columns:
+        df["PLUS_MINUS"] = 0
+    df = df[["TEAM_ID", "TEAM_NAME", "W", "L", "W_PCT", "PLUS_MINUS"]].join(
+        _team_metadata(), on="TEAM_ID", how="inner")
+
+    df = df.sort_values(
+        ["W_PCT", "W", "PLUS_MINUS", "TEAM_NAME"],
+        ascending=[False, False, False, True],
+        kind="mergesort"
+    )
+    df["rank"] = df.groupby("conference").cumcount() + 1
+    df["division_rank"] = df.groupby("division").cumcount() + 1
+
+    leaders = df.groupby("conference")[["W", "L"]].transform("first")
+    df["games_back"] = ((leaders["W"] - df["W"]) + (df["L"] - leaders["L"])) / 2
+
+    table = pd.DataFrame({
+        "team": df["TEAM_NAME"],
+        "team_id": df["TEAM_ID"].astype(str),
+        "abbreviation": df["abbreviation"],
+        "conference": df["conference"],
+        "division": df["division"],
+        "wins": df["W"].astype(int),
+        "losses": df["L"].astype(int),
+        "win_pct": df["W_PCT"].round(3),
+        "record": df["W"].astype(str) + "-" + df["L"].astype(str),
+        "games_back": df["games_back"],
+        "logo": df["logo"],
+        "rank": df["rank"],
+        "division_rank": df["division_rank"],
+    })
+
+    result = {
+        "eastern": table[table["conference"] == "East"].to_dict("records"),
+        "western": table[table["conference"] == "West"].to_dict("records"),
+        "season": season
+    }
+
+    # Older snapshots of the same season will never be requested again
+    for stale_key in [k for k in _standings_cache if k[0] == season]:
+        del _standings_cache[stale_key]
+    _standings_cache[key] = result
+
+    return result
@@ -0,0 +1,252 @@
+from typing import Any, Dict, Iterable, Optional, Set
+from datetime import date, datetime
+import logging
+import os
+import time
+
+import numpy as np
+
+from app.services.data_fetcher import season_for_date
+from app.services.elo import fetch_season_games, team_position
+from app.services.standings import TEAM_INDEX
+
+logger = logging.getLogger(__name__)
+
+# Ridge penalty on every offensive and defensive rating, in games: a team's
+# ratings are shrunk towards average as if it had this many average games
+RATINGS_RIDGE = 4.0
+
+# Seconds between incremental refreshes of the shared ratings
+TEAM_RATINGS_REFRESH_INTERVAL = float(os.getenv("TEAM_RATINGS_REFRESH_INTERVAL", "3600"))
+
+_N_TEAMS = len(TEAM_INDEX)
+# Unknowns: league scoring average, home-court edge, 30 offenses, 30 defenses
+_MEAN, _HOME = 0, 1
+_OFFENSE, _DEFENSE = 2, 2 + _N_TEAMS
+_N_PARAMS = 2 + 2 * _N_TEAMS
+
+# Opponent-adjusted features of two average teams
+NEUTRAL_RATING_FEATURES = {
+    "home_adj_offense": 0.0,
+    "home_adj_defense": 0.0,
+    "away_adj_offense": 0.0,
+    "away_adj_defense": 0.0,
+    "adj_home_margin": 0.0,
+}
+
+
+def design_matrix(home: np.ndarray, away: np.ndarray):
+    """
+    Sparse rows of the scoring model for a batch of games
+
+    Each game gives two rows, one per team's score:
+    home points = mean + home edge + offense[home] - defense[away] and
+    away points = mean + offense[away] - defense[home].
+
+    Args:
+        home: Home team positions
+        away: Away team positions
+
+    Returns:
+        scipy.sparse CSR matrix of shape (2 * games, 62)
+    """
+    from scipy import sparse
+
+    n = len(home)
+    rows = np.repeat(np.arange(2 * n), np.tile([4, 3], n))
+    columns = np.column_stack([
+        np.full(n, _MEAN), np.full(n, _HOME), _OFFENSE + home, _DEFENSE + away,
+        np.full(n, _MEAN), _OFFENSE + away, _DEFENSE + home,
+    ]).ravel()
+    values = np.tile([1.0, 1.0, 1.0, -1.0, 1.0, 1.0, -1.0], n)
+    return sparse.csr_matrix((values, (rows, columns)), shape=(2 * n, _N_PARAMS))
+
+
+class TeamRatings:
+    """
+    Opponent-adjusted offensive and defensive ratings (ridge-regularized SRS)
+
+    Every game's two scores are modelled as league average plus home edge
+    plus the scoring team's offense minus the other team's defense, and all
+    ratings are fitted at once by ridge least squares. Only the normal
+    equations (a 62 x 62 matrix and a 62-vector) are kept: new games are
+    added to them from a sparse design matrix, and the small system is
+    re-solved the next time a rating is read, so an update never revisits
+    earlier games. Ratings are points per game against an average
+    opponent; defense is positive when a team allows fewer points. A new
+    season starts from scratch.
+
+    Args:
+        ridge: Penalty on the team ratings, in games (see RATINGS_RIDGE)
+    """
+
+    def __init__(self, ridge: float = RATINGS_RIDGE):
+        self.ridge = ridge
+        self.season: Optional[str] = None
+        self.last_game_date: Optional[date] = None
+        self.games_applied = 0
+        self._reset()
+
+    def _reset(self):
+        self._gram = np.zeros((_N_PARAMS, _N_PARAMS))
+        self._moments = np.zeros(_N_PARAMS)
+        self._solution = np.zeros(_N_PARAMS)
+        self._stale = False
+        self._applied: Set[str] = set()
+        self.games_applied = 0
+
+    def add_games(self, home_team_ids, away_team_ids, home_points, away_points):
+        """
+        Add a batch of finished games to the normal equations
+
+        Args:
+            home_team_ids: Home teams (NBA IDs or 1-30)
+            away_team_ids: Away teams
+            home_points: Home final scores
+            away_points: Away final scores
+        """
+        home = np.array([team_position(t) for t in home_team_ids], dtype=int)
+        away = np.array([team_position(t) for t in away_team_ids], dtype=int)
+        if not len(home):
+            return
+        X = design_matrix(home, away)
+        y = np.column_stack([home_points, away_points]).astype(float).ravel()
+        self._gram += (X.T @ X).toarray()
+        self._moments += X.T @ y
+        self.games_applied += len(home)
+        self._stale = True
+
+    def apply_games(self, games: Iterable[Any]) -> int:
+        """
+        Add games in order, skipping ones already applied
+
+        Args:
+            games: Rows with game_id, game_date, home_team_id, away_team_id,
+                home_points and away_points, oldest first (see games_from_league_log)
+
+        Returns:
+            Number of new games applied
+        """
+        batch = []
+        for game in games:
+            season = season_for_date(game.game_date)
+            if self.season is None or season > self.season:
+                # Earlier-season games in this batch are superseded too
+                batch = []
+                self._reset()
+                self.season = season
+            elif season < self.season or game.game_id in self._applied:
+                continue
+            self._applied.add(game.game_id)
+            if self.last_game_date is None or game.game_date > self.last_game_date:
+                self.last_game_date = game.game_date
+            batch.append((game.home_team_id, game.away_team_id, game.home_points, game.away_points))
+        if batch:
+            self.add_games(*zip(*batch))
+        return len(batch)
+
+    def solve(self) -> np.ndarray:
+        """
+        Ratings from the games added so far (cached until new games arrive)
+
+        Returns:
+            [mean, home edge, 30 offenses, 30 defenses]
+        """
+        if self._stale:
+            penalty = np.full(_N_PARAMS, self.ridge)
+            penalty[[_MEAN, _HOME]] = 1e-9
+            solution = np.linalg.solve(self._gram + np.diag(penalty), self._moments)
+            # Ratings are relative to an average team; the mean absorbs the shift
+            offense, defense = solution[_OFFENSE:_DEFENSE].mean(), solution[_DEFENSE:].mean()
+            solution[_OFFENSE:_DEFENSE] -= offense
+            solution[_DEFENSE:] -= defense
+            solution[_MEAN] += offense - defense
+            self._solution = solution
+            self._stale = False
+        return self._solution
+
+    def offense(self, team_id: int) -> float:
+        """Points a team scores above average against an average defense"""
+        return float(self.solve()[_OFFENSE + team_position(team_id)])
+
+    def defense(self, team_id: int) -> float:
+        """Points a team holds an average offense below average"""
+        return float(self.solve()[_DEFENSE + team_position(team_id)])
+
+    def features(self, home_team_id: int, away_team_id: int) -> Dict[str, float]:
+        """Rating features for prepare_game_features"""
+        solution = self.solve()
+        home, away = team_position(home_team_id), team_position(away_team_id)
+        home_offense, home_defense = solution[_OFFENSE + home], solution[_DEFENSE + home]
+        away_offense, away_defense = solution[_OFFENSE + away], solution[_DEFENSE + away]
+        return {
+            "home_adj_offense": float(home_offense),
+            "home_adj_defense": float(home_defense),
+            "away_adj_offense": float(away_offense),
+            "away_adj_defense": float(away_defense),
+            "adj_home_margin": float(solution[_HOME] + home_offense + home_defense
+                                     - away_offense - away_defense),
+        }
+
+
+# Ratings shared by every request in this process
+_ratings: Optional[TeamRatings] = None
+_last_refresh = 0.0
+
+
+def refresh_team_ratings(ratings: TeamRatings, today: Optional[date] = None) -> int:
+    """
+    Add current-season games finished since the ratings were last updated
+
+    Args:
+        ratings: Ratings to update in place
+        today: Reference date (defaults to today)
+
+    Returns:
+        Number of games added, 0 if the game log could not be fetched
+    """
+    today = today or datetime.now().date()
+    season = season_for_date(today)
+    try:
+        games = fetch_season_games(season)
+    except Exception as e:
+        logger.warning(f"Could not fetch {season} games for team ratings: {e}")
+        return 0
+    return ratings.apply_games(games[games["game_date"] < today].itertuples(index=False))
+
+
+def team_ratings_as_of(day: date) -> TeamRatings:
+    """Opponent-adjusted ratings from the season's games before a past day, solved"""
+    ratings = TeamRatings()
+    refresh_team_ratings(ratings, today=day)
+    ratings.solve()
+    return ratings
+
+
+def get_team_ratings(refresh: bool = True) -> Optional[TeamRatings]:
+    """
+    Current opponent-adjusted ratings for this process
+
+    Built from the season's game log on first use and refreshed
+    incrementally at most every TEAM_RATINGS_REFRESH_INTERVAL seconds. If
+    the game log is unreachable the ratings stay where they are (average
+    when never built).
+
+    Args:
+        refresh: False to return the ratings as they are without fetching
+            anything (None when never built), as the request path does
+    """
+    global _ratings, _last_refresh
+    if not refresh:
+        return _ratings
+    now = time.monotonic()
+    if _ratings is None or now - _last_refresh >= TEAM_RATINGS_REFRESH_INTERVAL:
+        ratings = _ratings or TeamRatings()
+        start = time.perf_counter()
+        applied = refresh_team_ratings(ratings)
+        if applied:
+            ratings.solve()
+            logger.info(f"Added {applied} games to team ratings in "
+                        f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        _ratings, _last_refresh = ratings, now
+    return _ratings
@@ -0,0 +1,129 @@
+"""
+API Endpoint Benchmarks
+
+Drives the FastAPI app in-process through httpx's ASGI transport at
+several concurrency levels and records throughput and latency percentiles
+per endpoint.
+"""
+
+import asyncio
+import os
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from app.main import app
+from app.services.data_fetcher import fetch_game_data, season_for_date
+from app.services.elo import team_position
+from app.services.model_loder import ModelLoader
+from app.services.prediction_store import (
+    feature_inputs,
+    feature_snapshot_version,
+    game_feature_row,
+    get_prediction_store,
+    materialize_predictions,
+)
+from app.services.schedule import get_schedule_table
+from benchmarks.harness import summarize_latencies
+
+# (name, method, path, json body)
+ENDPOINTS: List[Tuple[str, str, str, Any]] = [
+    ("predict_game", "POST", "/api/v1/predict/game",
+     {"home_team_id": 2, "away_team_id": 20, "game_date": "2026-01-15T19:30:00"}),
+    ("predict_player", "POST", "/api/v1/predict/player",
+     {"player_id": 2544, "opponent_team_id": 5, "game_date": "2026-01-15T19:30:00"}),
+    ("standings", "GET", "/api/v1/standings", None),
+    ("games_recent", "GET", "/api/v1/games/recent?start_date=2025-12-01&end_date=2025-12-03", None),
+    ("player_search", "GET", "/api/v1/players/search/lebr", None),
+    ("teams", "GET", "/api/v1/teams", None),
+]
+
+CONCURRENCY_LEVELS = (1, 4, 16)
+
+# A fixture slate day whose predictions are materialized before measuring
+SCHEDULED_DAY = date(2025, 12, 10)
+
+
+async def _check_materialized(home_team_id: int, away_team_id: int):
+    """Raise unless the stored prediction of a game is the one built from its NBA-ID game logs"""
+    game_date = datetime.combine(SCHEDULED_DAY, datetime.min.time())
+    ratings, team_ratings, schedule, availability = await feature_inputs(season_for_date(SCHEDULED_DAY))
+    features = game_feature_row(
+        home_team_id, away_team_id, game_date,
+        await fetch_game_data(home_team_id, game_date), await fetch_game_data(away_team_id, game_date),
+        ratings, team_ratings, schedule, availability)
+    loader = ModelLoader()
+    expected = float(loader.get_game_prediction_model().predict_proba(features)[0][1])
+    calibrator = loader.get_game_calibrator()
+    if calibrator is not None:
+        expected = float(calibrator.transform(expected))
+    # Looked up with the 1-30 numbers a request sends
+    stored = get_prediction_store().get(
+        team_position(home_team_id) + 1, team_position(away_team_id) + 1, SCHEDULED_DAY,
+        feature_snapshot_version(ratings, team_ratings, schedule, availability))
+    if stored is None or abs(stored - expected) > 1e-6:
+        raise RuntimeError(f"Materialized prediction {stored} for {home_team_id} vs {away_team_id} "
+                           f"differs from {expected} computed from their game logs")
+
+
+async def _scheduled_game_endpoint() -> Tuple[str, str, str, Any]:
+    """Materialize SCHEDULED_DAY, check one of its games and return a request for it"""
+    await materialize_predictions(today=SCHEDULED_DAY, days=1)
+    game = get_schedule_table("2025-26").games_on(SCHEDULED_DAY).iloc[0]
+    await _check_materialized(int(game.home_team_id), int(game.away_team_id))
+    return ("predict_game_scheduled", "POST", "/api/v1/predict/game",
+            {"home_team_id": team_position(game.home_team_id) + 1,
+             "away_team_id": team_position(game.away_team_id) + 1,
+             "game_date": f"{SCHEDULED_DAY.isoformat()}T19:30:00"})
+
+
+async def _run_endpoint(client: httpx.AsyncClient, method: str, path: str, body: Any,
+                        requests: int, concurrency: int) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one_request():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise RuntimeError(f"{method} {path} returned {response.status_code}: {response.text}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(requests)))
+    return summarize_latencies(latencies, time.perf_counter() - start)
+
+
+async def _run_all(requests: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    # Background jobs would run against the wall clock mid-measurement
+    os.environ.setdefault("SCHEDULER_ENABLED", "false")
+    # Fixtures are the 2025-26 season: serve its games as upcoming, not past
+    os.environ.setdefault("SLATE_DATE", SCHEDULED_DAY.isoformat())
+    async with app.router.lifespan_context(app):
+        endpoints = ENDPOINTS + [await _scheduled_game_endpoint()]
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name, method, path, body in endpoints:
+                # Warm caches and lazy loaders outside the measurement
+                await _run_endpoint(client, method, path, body, 5, 1)
+                for concurrency in CONCURRENCY_LEVELS:
+                    results[f"api.{name}.c{concurrency}"] = await _run_endpoint(
+                        client, method, path, body, requests, concurrency)
+    return results
+
+
+def run(requests: int = 200) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark every endpoint at every concurrency level
+
+    Args:
+        requests: Requests per endpoint per concurrency level
+
+    Returns:
+        Results keyed by "api.<endpoint>.c<concurrency>"
+    """
+    return asyncio.run(_run_all(requests))
@@ -0,0 +1,127 @@
+"""
+Pipeline Microbenchmarks
+
+Times the individual stages behind /predict/game and /predict/player:
+game log aggregation in fetch_game_data and fetch_player_stats (also
+for a mid-season date, which slices the games before it from the log),
+prepare_game_features, Elo rating updates and lookups, opponent-adjusted
+ratings (solving a full season of about 1,230 games, adding one day's
+games and re-solving, and lookups), player availability (re-applying a
+league-wide injury report and adjusting a team's form), and model inference
+(including all quantile projections for one player and for a 500-player
+batch, and probability calibration for one game and for 10,000). The fetch
+benchmarks also record the peak memory allocated per call.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from app.services.availability import AvailabilityIndex, build_player_impacts
+from app.services.data_fetcher import fetch_game_data, fetch_player_stats
+from app.services.elo import EloRatings, games_from_league_log
+from app.services.feature_engineering import prepare_game_features, prepare_player_features
+from app.services.model_loder import ModelLoader
+from app.services.team_ratings import TeamRatings
+from benchmarks import fixtures
+from benchmarks.harness import peak_allocation_kib, time_calls
+
+HOME_TEAM_ID = 1610612738
+AWAY_TEAM_ID = 1610612752
+PLAYER_ID = 2544
+GAME_DATE = datetime(2026, 1, 15, 19, 30)
+# Mid-season, with later games in the fixture logs
+HISTORICAL_DATE = datetime(2025, 11, 20, 19, 30)
+
+
+def run(iterations: int = 500) -> Dict[str, Dict[str, float]]:
+    """
+    Run every microbenchmark
+
+    Args:
+        iterations: Calls per benchmark
+
+    Returns:
+        Results keyed by "micro.<name>"
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        home_data = loop.run_until_complete(fetch_game_data(HOME_TEAM_ID, GAME_DATE))
+        away_data = loop.run_until_complete(fetch_game_data(AWAY_TEAM_ID, GAME_DATE))
+        ratings = EloRatings()
+        elo = ratings.features(HOME_TEAM_ID, AWAY_TEAM_ID)
+        features = prepare_game_features(home_data, away_data, elo)
+        model = ModelLoader().get_game_prediction_model()
+        calibrator = ModelLoader().get_game_calibrator()
+        probabilities = np.linspace(0.0, 1.0, 10000)
+        projection_model = ModelLoader().get_player_projection_model()
+        player_features = prepare_player_features(
+            loop.run_until_complete(fetch_player_stats(PLAYER_ID, GAME_DATE)), 5)
+        batch_features = pd.concat([player_features] * 500, ignore_index=True)
+        season_games = list(games_from_league_log(
+            fixtures.league_game_log("2025-26", 205)).itertuples(index=False))
+        team_ratings = TeamRatings()
+        team_ratings.apply_games(season_games)
+        last_day = [(g.home_team_id, g.away_team_id, g.home_points, g.away_points)
+                    for g in season_games if g.game_date == season_games[-1].game_date]
+        availability = AvailabilityIndex(build_player_impacts("2025-26"))
+        # About one player in twelve listed, as on a typical injury report
+        reports = [{"player_id": int(player_id), "status": "out"}
+                   for player_id in availability.player_ids[::12]]
+        availability.apply_statuses(reports)
+
+        def fetch_game():
+            return loop.run_until_complete(fetch_game_data(HOME_TEAM_ID, GAME_DATE))
+
+        def fetch_game_historical():
+            return loop.run_until_complete(fetch_game_data(HOME_TEAM_ID, HISTORICAL_DATE))
+
+        def fetch_player():
+            return loop.run_until_complete(fetch_player_stats(PLAYER_ID, GAME_DATE))
+
+        def solve_season():
+            ratings = TeamRatings()
+            ratings.apply_games(season_games)
+            return ratings.solve()
+
+        def add_day():
+            team_ratings.add_games(*zip(*last_day))
+            return team_ratings.solve()
+
+        results = {
+            "micro.fetch_game_data": time_calls(fetch_game, iterations),
+            "micro.fetch_game_data_historical": time_calls(fetch_game_historical, iterations),
+            "micro.fetch_player_stats": time_calls(fetch_player, iterations),
+            "micro.prepare_game_features": time_calls(
+                lambda: prepare_game_features(home_data, away_data, elo), iterations),
+            "micro.elo_update": time_calls(
+                lambda: ratings.update(HOME_TEAM_ID, AWAY_TEAM_ID, 112, 104, GAME_DATE.date()), iterations),
+            "micro.elo_features": time_calls(
+                lambda: ratings.features(HOME_TEAM_ID, AWAY_TEAM_ID), iterations),
+            "micro.team_ratings_season": time_calls(solve_season, max(10, iterations // 10)),
+            "micro.team_ratings_add_day": time_calls(add_day, iterations),
+            "micro.team_ratings_features": time_calls(
+                lambda: team_ratings.features(HOME_TEAM_ID, AWAY_TEAM_ID), iterations),
+            "micro.availability_apply": time_calls(
+                lambda: availability.apply_statuses(reports), iterations),
+            "micro.availability_adjust_team": time_calls(
+                lambda: availability.adjust_team_form(home_data, HOME_TEAM_ID), iterations),
+            "micro.model_inference": time_calls(
+                lambda: model.predict_proba(features), iterations),
+            "micro.calibration": time_calls(
+                lambda: float(calibrator.transform(0.62)), iterations),
+            "micro.calibration_batch10000": time_calls(
+                lambda: calibrator.transform(probabilities), iterations),
+            "micro.player_projection": time_calls(
+                lambda: projection_model.project(player_features), iterations),
+            "micro.player_projection_batch500": time_calls(
+                lambda: projection_model.predict(batch_features), iterations),
+        }
+        results["micro.fetch_game_data"]["alloc_kib"] = peak_allocation_kib(fetch_game)
+        results["micro.fetch_player_stats"]["alloc_kib"] = peak_allocation_kib(fetch_player)
+        return results
+    finally:
+        loop.close()
@@ -0,0 +1,73 @@
+"""
+Player Search Benchmark
+
+Compares queries per second of the in-memory PlayerSearchIndex against
+nba_api's regex scan (players.find_players_by_full_name), replaying the
+keystroke-by-keystroke queries the frontend search box sends.
+
+Usage (from ml-api/):
+    python -m benchmarks.bench_player_search
+"""
+
+import random
+import time
+from typing import Callable, List
+
+from nba_api.stats.static import players
+
+from app.services.player_search import PlayerSearchIndex
+
+
+def build_queries(n_names: int = 200, seed: int = 42) -> List[str]:
+    """
+    Build a realistic query workload
+
+    For a sample of player names, emit every prefix of length >= 2 (as typed
+    into an autocomplete box) plus one misspelling of the full name.
+    """
+    rng = random.Random(seed)
+    names = [p["full_name"] for p in rng.sample(players.get_players(), n_names)]
+    queries = []
+    for name in names:
+        queries.extend(name[:i] for i in range(2, len(name) + 1))
+        chars = list(name)
+        pos = rng.randrange(1, len(chars))
+        chars[pos - 1], chars[pos] = chars[pos], chars[pos - 1]
+        queries.append("".join(chars))
+    return queries
+
+
+def measure_qps(search: Callable[[str], List], queries: List[str]) -> float:
+    """Run every query once and return queries per second"""
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    elapsed = time.perf_counter() - start
+    return len(queries) / elapsed
+
+
+def main():
+    """
+    Run the benchmark and print a comparison
+    """
+    print("Player Search Benchmark")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    index = PlayerSearchIndex(players.get_players())
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Index build time: {build_ms:.1f} ms ({len(index.players)} players)")
+
+    queries = build_queries()
+    print(f"Queries: {len(queries)}")
+
+    regex_qps = measure_qps(players.find_players_by_full_name, queries)
+    index_qps = measure_qps(lambda q: index.search(q, limit=25), queries)
+
+    print(f"\nRegex scan:   {regex_qps:>10.0f} queries/sec")
+    print(f"Search index: {index_qps:>10.0f} queries/sec")
+    print(f"Speedup:      {index_qps / regex_qps:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Multi-Worker Scaling Benchmark
+
+Records fixture responses for the data endpoints, then starts gunicorn
+(gunicorn.conf.py) with 1..N workers in replay mode and load-tests it over
+real sockets. Reports throughput per worker count, with and without the
+shared cross-process cache, so the gain from extra cores and from sharing
+upstream responses between workers can be read off directly.
+
+Usage (from ml-api/):
+    python -m benchmarks.bench_scaling --max-workers 4 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+
+from app.main import app
+from app.services.data_source import RecordingSource, set_data_source
+from benchmarks.fixtures import FixtureSource
+from benchmarks.harness import environment, summarize_latencies, write_results
+
+# Endpoints that only need nba_api data (no trained model artifacts)
+PATHS: List[str] = [
+    "/api/v1/standings",
+    "/api/v1/games/recent?start_date=2025-12-01&end_date=2025-12-03",
+    "/api/v1/players/search/lebr",
+    "/api/v1/teams",
+]
+
+
+def record_fixtures(directory: str):
+    """Save fixture responses for every benchmarked path in replay format"""
+    set_data_source(RecordingSource(FixtureSource(), directory))
+
+    async def record():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in PATHS:
+                response = await client.get(path)
+                response.raise_for_status()
+
+    asyncio.run(record())
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_until_ready(base_url: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+async def _load(base_url: str, requests: int, concurrency: int) -> Dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        async def one_request(i: int):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(PATHS[i % len(PATHS)])
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one_request(i) for i in range(requests)))
+        return summarize_latencies(latencies, time.perf_counter() - start)
+
+
+def run_workers(workers: int, fixture_dir: str, shared_cache: bool, latency_ms: float,
+                requests: int, concurrency: int) -> Dict[str, float]:
+    """
+    Start gunicorn with the given worker count and load-test it
+
+    Args:
+        workers: Number of gunicorn workers
+        fixture_dir: Directory written by record_fixtures
+        shared_cache: Enable the SQLite cache shared between workers
+        latency_ms: Artificial upstream latency per nba_api request
+        requests: Total requests, spread round-robin over PATHS
+        concurrency: Requests in flight at once
+
+    Returns:
+        Throughput and latency summary
+    """
+    port = _free_port()
+    run_dir = tempfile.mkdtemp(prefix="nba-scaling-")
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "WEB_CONCURRENCY": str(workers),
+        "NBA_DATA_MODE": "replay",
+        "NBA_FIXTURE_DIR": fixture_dir,
+        "NBA_REPLAY_LATENCY_MS": str(latency_ms),
+        "SHARED_CACHE_PATH": os.path.join(run_dir, "cache.sqlite") if shared_cache else "",
+        "PROMETHEUS_MULTIPROC_DIR": os.path.join(run_dir, "metrics"),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "--log-level", "warning",
+         "app.main:app"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        _wait_until_ready(base_url)
+        return asyncio.run(_load(base_url, requests, concurrency))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    """
+    Measure throughput scaling from 1 to N workers
+    """
+    parser = argparse.ArgumentParser(description="Benchmark multi-worker throughput scaling")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--requests", type=int, default=400, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Artificial upstream latency")
+    parser.add_argument("--output", default="scaling_results.json")
+    args = parser.parse_args()
+
+    fixture_dir = tempfile.mkdtemp(prefix="nba-fixtures-")
+    print(f"Recording fixtures to {fixture_dir}...")
+    record_fixtures(fixture_dir)
+
+    results = {}
+    print(f"\n{'workers':>8}{'shared cache':>14}{'throughput/s':>14}{'p50 ms':>10}{'p95 ms':>10}")
+    for workers in range(1, args.max_workers + 1):
+        for shared_cache in (False, True):
+            result = run_workers(workers, fixture_dir, shared_cache, args.latency_ms,
+                                 args.requests, args.concurrency)
+            results[f"scaling.w{workers}.{'shared' if shared_cache else 'local'}"] = result
+            print(f"{workers:>8}{'yes' if shared_cache else 'no':>14}{result['throughput']:>14.1f}"
+                  f"{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}")
+
+    write_results({"environment": {**environment(), "cpu_count": os.cpu_count()},
+                   "benchmarks": results}, args.output)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
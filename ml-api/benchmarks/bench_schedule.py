@@ -0,0 +1,46 @@
+"""
+Schedule Feature Benchmarks
+
+Times building the precomputed schedule table for a full regular season
+(about 1,230 games), the whole-season column pass the backtest uses, and
+serving-time lookups of schedule features for a scheduled game and for an
+unscheduled (what-if) matchup.
+"""
+
+from datetime import date
+from typing import Dict
+
+from app.services.elo import games_from_league_log
+from app.services.schedule import ScheduleTable
+from benchmarks import fixtures
+from benchmarks.harness import time_calls
+
+SEASON = "2025-26"
+# Fixture days that add up to a full 82-game regular season
+SEASON_DAYS = 205
+
+
+def run(iterations: int = 500) -> Dict[str, Dict[str, float]]:
+    """
+    Run every schedule benchmark
+
+    Args:
+        iterations: Calls per lookup benchmark; whole-season ones use fewer
+
+    Returns:
+        Results keyed by "schedule.<name>"
+    """
+    games = games_from_league_log(fixtures.league_game_log(SEASON, SEASON_DAYS))
+    table = ScheduleTable(games)
+    game = games.iloc[len(games) // 2]
+    scheduled = (game.home_team_id, game.away_team_id, game.game_date)
+    # Teams swapped, so the game is not in the table
+    what_if = (game.away_team_id, game.home_team_id, date(2026, 1, 15))
+    season_calls = max(10, iterations // 10)
+
+    return {
+        "schedule.build_season": time_calls(lambda: ScheduleTable(games), season_calls),
+        "schedule.season_columns": time_calls(lambda: table.game_columns(games), season_calls),
+        "schedule.lookup": time_calls(lambda: table.features(*scheduled), iterations),
+        "schedule.what_if": time_calls(lambda: table.features(*what_if), iterations),
+    }
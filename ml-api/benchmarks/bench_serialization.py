@@ -0,0 +1,65 @@
+"""
+Response Serialization Benchmarks
+
+Times encoding a /games/recent style payload at several sizes with
+FastAPI's default path (jsonable_encoder + JSONResponse) and with each
+format of encode_response (orjson JSON, and MessagePack / Arrow when
+installed), and records the encoded size.
+"""
+
+from typing import Any, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.services.serialization import ARROW, JSON, MSGPACK, available_formats, encode_response
+from benchmarks.harness import time_calls
+
+SIZES = (1, 10, 100, 1000, 10000)
+
+_FORMAT_NAMES = {JSON: "orjson", MSGPACK: "msgpack", ARROW: "arrow"}
+
+
+def game_rows(n: int) -> List[Dict[str, Any]]:
+    """n game results in the shape returned by get_games_between"""
+    return [
+        {
+            "date": "Dec 01, 2025",
+            "home_team": {"name": "Boston Celtics", "id": str(1610612738), "score": 100 + i % 40},
+            "away_team": {"name": "New York Knicks", "id": str(1610612752), "score": 95 + i % 35},
+            "status": "Final",
+        }
+        for i in range(n)
+    ]
+
+
+def run(iterations: int = 500) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark every format at every payload size
+
+    Args:
+        iterations: Calls per benchmark at one row; larger payloads use fewer
+
+    Returns:
+        Results keyed by "serialization.<format>.n<rows>", each with the
+        encoded size in bytes
+    """
+    results = {}
+    for size in SIZES:
+        rows = game_rows(size)
+        payload = {"games": rows, "count": size}
+        calls = max(10, min(iterations, 20000 // size))
+
+        def fastapi_default():
+            return JSONResponse(jsonable_encoder(payload)).body
+
+        encoders = {"fastapi_default": fastapi_default}
+        for media_type in available_formats():
+            encoders[_FORMAT_NAMES[media_type]] = (
+                lambda media_type=media_type: encode_response(payload, media_type, rows=rows).body)
+
+        for name, encode in encoders.items():
+            result = time_calls(encode, calls)
+            result["bytes"] = len(encode())
+            results[f"serialization.{name}.n{size}"] = result
+    return results
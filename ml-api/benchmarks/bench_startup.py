@@ -0,0 +1,151 @@
+"""
+Startup Benchmarks
+
+Measures cold-start cost in fresh interpreters: importing app.main, and
+the explicit warm_up() phase that loads heavy dependencies and models and
+builds the shared ratings, schedule and availability (from fixture data,
+so the timing doesn't depend on stats.nba.com).
+import_report() parses `python -X importtime` output so the modules
+responsible for a slow import can be read off, and check_lazy_imports()
+fails when a heavy dependency is imported eagerly again.
+
+Usage (from ml-api/):
+    python -m benchmarks.bench_startup
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+from benchmarks.harness import summarize_latencies
+
+# Must only load on first use or in warm_up(), never when importing app.main
+HEAVY_MODULES = (
+    "pandas",
+    "scipy",
+    "sklearn",
+    "xgboost",
+    "nba_api.stats.endpoints",
+    "nba_api.live.nba.endpoints",
+)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_APP = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - start)"
+)
+# Heavy imports are timed before the fixture source (whose module imports
+# pandas) is installed; warm_up() then prints the seconds of its other steps
+_WARM_UP = (
+    "import importlib, json, time, app.main; start = time.perf_counter(); "
+    "[importlib.import_module(module) for module in app.main.WARM_UP_MODULES]; "
+    "imports = time.perf_counter() - start; "
+    "from benchmarks import fixtures; fixtures.install_fixtures(); "
+    "print(json.dumps({'imports': imports, **app.main.warm_up()}))"
+)
+# warm_up() steps that build shared state from upstream data
+DATA_STEPS = ("elo ratings", "schedule table", "team ratings", "player availability")
+
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    # WARM_UP=false so nothing beyond the import itself is measured
+    env = {**os.environ, "WARM_UP": "false"}
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=APP_DIR, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def import_report(module: str = "app.main") -> Dict[str, Dict[str, float]]:
+    """
+    Import a module in a fresh interpreter with -X importtime
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Every imported module mapped to its self and cumulative import time in ms
+    """
+    result = _python(f"import {module}", "-X", "importtime")
+    report = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        report[name.strip()] = {
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        }
+    return report
+
+
+def check_lazy_imports(report: Dict[str, Dict[str, float]]) -> List[str]:
+    """Names of heavy modules (or their submodules) that were imported eagerly"""
+    return sorted(
+        name for name in report
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    )
+
+
+def _time_in_subprocess(code: str, runs: int) -> Dict[str, float]:
+    latencies = [float(_python(code).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+    return summarize_latencies(latencies, sum(latencies))
+
+
+def run(runs: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Time the app import and warm-up, each in fresh interpreters
+
+    Warm-up is also split into loading imports and models (warm_up_models)
+    and building the shared state from fixture data (warm_up_data).
+
+    Args:
+        runs: Fresh interpreters per measurement
+
+    Returns:
+        Results keyed by "startup.<name>"
+    """
+    steps = [json.loads(_python(_WARM_UP).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+
+    def phase(included) -> Dict[str, float]:
+        latencies = [sum(seconds for step, seconds in run_steps.items() if included(step))
+                     for run_steps in steps]
+        return summarize_latencies(latencies, sum(latencies))
+
+    return {
+        "startup.import_app": _time_in_subprocess(_IMPORT_APP, runs),
+        "startup.warm_up": phase(lambda step: True),
+        "startup.warm_up_models": phase(lambda step: step not in DATA_STEPS),
+        "startup.warm_up_data": phase(lambda step: step in DATA_STEPS),
+    }
+
+
+def print_report(report: Dict[str, Dict[str, float]], limit: int = 15):
+    """Print the modules with the largest cumulative import time"""
+    print(f"{'module':<50}{'cumulative ms':>15}{'self ms':>10}")
+    ranked = sorted(report.items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)
+    for name, times in ranked[:limit]:
+        print(f"{name:<50}{times['cumulative_ms']:>15.1f}{times['self_ms']:>10.1f}")
+
+
+def main():
+    """
+    Print the import-time report and fail if heavy modules load eagerly
+    """
+    report = import_report()
+    print_report(report)
+
+    print()
+    for name, result in run().items():
+        print(f"{name:<24} p50 {result['p50_ms']:>9.1f} ms")
+
+    eager = check_lazy_imports(report)
+    if eager:
+        print(f"\nHeavy modules imported by app.main: {', '.join(eager)}")
+        sys.exit(1)
+    print("\nNo heavy modules imported by app.main")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Benchmark Fixtures
+
+A deterministic data source standing in for the nba_api endpoints used by
+data_fetcher, plus small fitted models, so the API can be benchmarked in-process without
+network access. Every frame follows the column layout of the real endpoint
+and is generated from a seed derived from the request parameters, so the
+same request always returns the same data. Frames are generated once and
+copied per request, so benchmarks measure the app rather than the fixtures.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from app.services.calibration import ProbabilityCalibrator
+from app.services.data_source import FixtureNotFoundError, ReplaySource, set_data_source
+from app.services.feature_engineering import prepare_game_features, prepare_player_features
+from app.services.model_loder import ModelLoader
+from app.services.player_projection import PROJECTED_STATS, PlayerProjectionModel
+from app.services.records import PlayerForm
+from app.services.standings import TEAM_INDEX
+
+SEASON_START = datetime(2025, 10, 21)
+TEAM_IDS = sorted(TEAM_INDEX)
+
+
+def _rng(*params: Any) -> np.random.Generator:
+    return np.random.default_rng(zlib.crc32(repr(params).encode()))
+
+
+def _box_score_columns(rng: np.random.Generator, n: int, scale: float) -> Dict[str, np.ndarray]:
+    """Shooting and counting stats for n games at the given volume scale"""
+    fga = rng.poisson(88 * scale, n)
+    fgm = rng.binomial(fga, 0.47)
+    fg3a = rng.poisson(35 * scale, n)
+    fg3m = rng.binomial(fg3a, 0.36)
+    fta = rng.poisson(22 * scale, n)
+    ftm = rng.binomial(fta, 0.78)
+    oreb = rng.poisson(10 * scale, n)
+    dreb = rng.poisson(34 * scale, n)
+    return {
+        'FGM': fgm, 'FGA': fga, 'FG_PCT': np.round(fgm / np.maximum(fga, 1), 3),
+        'FG3M': fg3m, 'FG3A': fg3a, 'FG3_PCT': np.round(fg3m / np.maximum(fg3a, 1), 3),
+        'FTM': ftm, 'FTA': fta, 'FT_PCT': np.round(ftm / np.maximum(fta, 1), 3),
+        'OREB': oreb, 'DREB': dreb, 'REB': oreb + dreb,
+        'AST': rng.poisson(26 * scale, n), 'STL': rng.poisson(8 * scale, n),
+        'BLK': rng.poisson(5 * scale, n), 'TOV': rng.poisson(14 * scale, n),
+        'PF': rng.poisson(19 * scale, n), 'PTS': 2 * fgm + fg3m + ftm,
+    }
+
+
+def _schedule(rng: np.random.Generator, n_games: int) -> List[datetime]:
+    """Most recent game first, like the real game log endpoints"""
+    gaps = rng.choice([1, 2, 2, 3], n_games)
+    dates = [SEASON_START + timedelta(days=int(d)) for d in np.cumsum(gaps)]
+    return dates[::-1]
+
+
+@lru_cache(maxsize=None)
+def team_game_log(team_id: int, season: str, n_games: int = 40) -> pd.DataFrame:
+    rng = _rng('TeamGameLog', team_id, season)
+    abbreviation = TEAM_INDEX.get(team_id, {}).get('abbreviation', 'UNK')
+    opponents = rng.choice(TEAM_IDS, n_games)
+    home = rng.random(n_games) < 0.5
+    wins = rng.random(n_games) < 0.5
+    stats = _box_score_columns(rng, n_games, 1.0)
+    return pd.DataFrame({
+        'Team_ID': team_id,
+        'Game_ID': [f"00225{team_id % 1000:03d}{i:02d}" for i in range(n_games)],
+        'GAME_DATE': [d.strftime('%b %d, %Y').upper() for d in _schedule(rng, n_games)],
+        'MATCHUP': [
+            f"{abbreviation} {'vs.' if h else '@'} {TEAM_INDEX[o]['abbreviation']}"
+            for h, o in zip(home, opponents)
+        ],
+        'WL': np.where(wins, 'W', 'L'),
+        'W': np.cumsum(wins[::-1])[::-1], 'L': np.cumsum(~wins[::-1])[::-1],
+        'W_PCT': np.round(wins.mean(), 3), 'MIN': 240,
+        **stats,
+    })
+
+
+@lru_cache(maxsize=None)
+def player_game_log(player_id: int, season: str, n_games: int = 40) -> pd.DataFrame:
+    rng = _rng('PlayerGameLog', player_id, season)
+    scale = rng.uniform(0.05, 0.3)
+    stats = _box_score_columns(rng, n_games, scale)
+    return pd.DataFrame({
+        'SEASON_ID': f"2{season[:4]}", 'Player_ID': player_id,
+        'Game_ID': [f"00225{player_id % 1000:03d}{i:02d}" for i in range(n_games)],
+        'GAME_DATE': [d.strftime('%b %d, %Y').upper() for d in _schedule(rng, n_games)],
+        'MATCHUP': 'BOS vs. NYK', 'WL': rng.choice(['W', 'L'], n_games),
+        'MIN': rng.integers(10, 40, n_games), **stats,
+        'PLUS_MINUS': rng.integers(-20, 20, n_games), 'VIDEO_AVAILABLE': 1,
+    })
+
+
+@lru_cache(maxsize=None)
+def league_game_log(season: str, n_days: int = 85) -> pd.DataFrame:
+    """Every team's rows for a season of games between teams of fixed strength"""
+    rng = _rng('LeagueGameLog', season)
+    strength = dict(zip(TEAM_IDS, rng.normal(0, 5, len(TEAM_IDS))))
+    start = SEASON_START.replace(year=int(season[:4]))
+    rows = []
+    for day in range(n_days):
+        game_date = (start + timedelta(days=day)).strftime('%Y-%m-%d')
+        matchups = rng.permutation(TEAM_IDS)[:2 * int(rng.integers(3, 10))].reshape(-1, 2)
+        for home, away in matchups:
+            margin = strength[home] - strength[away] + 3 + rng.normal(0, 12)
+            points = {home: int(round(112 + margin / 2)), away: int(round(112 - margin / 2))}
+            game_id = f"002{season[2:4]}{len(rows) // 2:05d}"
+            for team, opponent, sep in ((home, away, 'vs.'), (away, home, '@')):
+                rows.append({
+                    'SEASON_ID': f"2{season[:4]}", 'TEAM_ID': team,
+                    'TEAM_ABBREVIATION': TEAM_INDEX[team]['abbreviation'],
+                    'GAME_ID': game_id, 'GAME_DATE': game_date,
+                    'MATCHUP': f"{TEAM_INDEX[team]['abbreviation']} {sep} {TEAM_INDEX[opponent]['abbreviation']}",
+                    'WL': 'W' if points[team] > points[opponent] else 'L', 'MIN': 240,
+                    'PTS': points[team], 'PLUS_MINUS': points[team] - points[opponent],
+                })
+    return pd.DataFrame(rows)
+
+
+@lru_cache(maxsize=None)
+def league_schedule(season: str, n_days: int = 85) -> pd.DataFrame:
+    """ScheduleLeagueV2 SeasonGames rows for the games of league_game_log"""
+    log = league_game_log(season, n_days)
+    home = log[log['MATCHUP'].str.contains('vs.', regex=False)]
+    away = log[~log['MATCHUP'].str.contains('vs.', regex=False)].set_index('GAME_ID')
+    return pd.DataFrame({
+        'leagueId': '00', 'seasonYear': season, 'gameId': home['GAME_ID'].to_numpy(),
+        'gameDateEst': (home['GAME_DATE'] + 'T00:00:00Z').to_numpy(),
+        'homeTeam_teamId': home['TEAM_ID'].to_numpy(),
+        'awayTeam_teamId': away.loc[home['GAME_ID'], 'TEAM_ID'].to_numpy(),
+    })
+
+
+@lru_cache(maxsize=None)
+def league_team_stats(season: str) -> pd.DataFrame:
+    rng = _rng('LeagueDashTeamStats', season)
+    wins = rng.integers(5, 35, len(TEAM_IDS))
+    losses = 40 - wins
+    return pd.DataFrame({
+        'TEAM_ID': TEAM_IDS,
+        'TEAM_NAME': [TEAM_INDEX[t]['name'] for t in TEAM_IDS],
+        'GP': 40, 'W': wins, 'L': losses, 'W_PCT': np.round(wins / 40, 3),
+        'PLUS_MINUS': rng.integers(-300, 300, len(TEAM_IDS)),
+    })
+
+
+@lru_cache(maxsize=None)
+def league_player_stats(season: str, players_per_team: int = 15) -> pd.DataFrame:
+    """LeagueDashPlayerStats PerGame rows: a rotation of players for every team"""
+    rng = _rng('LeagueDashPlayerStats', season)
+    n = len(TEAM_IDS) * players_per_team
+    minutes = np.tile(np.linspace(36, 4, players_per_team), len(TEAM_IDS)) * rng.uniform(0.8, 1.1, n)
+    player_ids = 1630000 + np.arange(n)
+    # A known player for benchmarks that look one up
+    player_ids[TEAM_IDS.index(1610612747) * players_per_team] = 2544
+    return pd.DataFrame({
+        'PLAYER_ID': player_ids, 'PLAYER_NAME': [f"Player {p}" for p in player_ids],
+        'TEAM_ID': np.repeat(TEAM_IDS, players_per_team),
+        'TEAM_ABBREVIATION': np.repeat([TEAM_INDEX[t]['abbreviation'] for t in TEAM_IDS], players_per_team),
+        'GP': rng.integers(20, 40, n), 'MIN': np.round(minutes, 1),
+        'PTS': np.round(minutes * rng.uniform(0.3, 0.8, n), 1),
+        'REB': np.round(minutes * rng.uniform(0.1, 0.3, n), 1),
+        'AST': np.round(minutes * rng.uniform(0.05, 0.25, n), 1),
+        'PLUS_MINUS': np.round(rng.normal(0, 4, n), 1),
+    })
+
+
+@lru_cache(maxsize=None)
+def scoreboard(game_date: str) -> List[pd.DataFrame]:
+    rng = _rng('ScoreboardV2', game_date)
+    n_games = int(rng.integers(4, 12))
+    matchups = rng.permutation(TEAM_IDS)[:2 * n_games].reshape(n_games, 2)
+    game_ids = [f"00225{i:05d}" for i in range(n_games)]
+    header = pd.DataFrame({
+        'GAME_ID': game_ids, 'GAME_STATUS_ID': 3, 'GAME_STATUS_TEXT': 'Final',
+        'HOME_TEAM_ID': matchups[:, 0], 'VISITOR_TEAM_ID': matchups[:, 1],
+    })
+    # LineScore lists the visitor first
+    line_score = pd.DataFrame({
+        'GAME_ID': np.repeat(game_ids, 2),
+        'TEAM_ID': matchups[:, ::-1].ravel(),
+        'TEAM_NAME': [TEAM_INDEX[t]['name'] for t in matchups[:, ::-1].ravel()],
+        'PTS': rng.integers(95, 135, 2 * n_games),
+    })
+    return [header, line_score]
+
+
+def player_stats_from_log(df: pd.DataFrame, games_back: int = 10) -> PlayerForm:
+    """Recent averages in the form returned by fetch_player_stats"""
+    recent = df.head(games_back)
+    return PlayerForm(
+        player_id=int(df['Player_ID'].iat[0]),
+        avg_points=recent['PTS'].mean(), avg_rebounds=recent['REB'].mean(),
+        avg_assists=recent['AST'].mean(), avg_steals=recent['STL'].mean(),
+        avg_blocks=recent['BLK'].mean(), fg_percentage=recent['FG_PCT'].mean(),
+        three_pt_percentage=recent['FG3_PCT'].mean(), ft_percentage=recent['FT_PCT'].mean(),
+        minutes_per_game=recent['MIN'].mean(), games_played=len(df),
+        avg_fga=recent['FGA'].mean(), avg_fta=recent['FTA'].mean(),
+        avg_turnovers=recent['TOV'].mean(),
+    )
+
+
+class FixtureSource:
+    """
+    Data source serving generated frames, pluggable via set_data_source
+
+    Requests flow through data_fetcher exactly as in production; only the
+    source of the frames differs.
+    """
+
+    def fetch(self, endpoint: str, **params) -> List[pd.DataFrame]:
+        if endpoint == "TeamGameLog":
+            frames = [team_game_log(params["team_id"], params["season"])]
+        elif endpoint == "PlayerGameLog":
+            frames = [player_game_log(params["player_id"], params["season"])]
+        elif endpoint == "LeagueGameLog":
+            frames = [league_game_log(params["season"])]
+        elif endpoint == "ScheduleLeagueV2":
+            frames = [league_schedule(params["season"])]
+        elif endpoint == "LeagueDashTeamStats":
+            frames = [league_team_stats(params["season"])]
+        elif endpoint == "LeagueDashPlayerStats":
+            frames = [league_player_stats(params["season"])]
+        elif endpoint == "ScoreboardV2":
+            frames = scoreboard(params["game_date"])
+        else:
+            raise FixtureNotFoundError(f"No fixture generator for {endpoint}")
+        return [frame.copy() for frame in frames]
+
+    def fetch_dict(self, endpoint: str, **params) -> Dict[str, Any]:
+        raise FixtureNotFoundError(f"No fixture generator for {endpoint}")
+
+
+def install_fixtures(replay_dir: Optional[str] = None, latency_ms: float = 0.0):
+    """
+    Point the app's data source at fixture data
+
+    Args:
+        replay_dir: Serve recordings from this directory (see NBA_DATA_MODE=record)
+            instead of generated frames
+        latency_ms: Artificial upstream latency per request in replay mode
+    """
+    if replay_dir:
+        set_data_source(ReplaySource(replay_dir, latency_ms=latency_ms))
+    else:
+        set_data_source(FixtureSource())
+
+
+def install_models(n_rows: int = 2000):
+    """
+    Fit small models on synthetic features and load them into ModelLoader
+
+    The repository does not ship trained model artifacts, so benchmarks use
+    models of realistic size fitted to random data.
+    """
+    import xgboost as xgb
+
+    rng = np.random.default_rng(0)
+    game_columns = prepare_game_features({}, {}).columns
+    X_game = pd.DataFrame(rng.normal(size=(n_rows, len(game_columns))), columns=game_columns)
+    y_game = (X_game['point_differential'] + rng.normal(size=n_rows) > 0).astype(int)
+    game_model = xgb.XGBClassifier(n_estimators=200, max_depth=6, n_jobs=1)
+    game_model.fit(X_game, y_game)
+    # Calibrated on fresh rows, as training/calibrate_model.py does on holdout games
+    X_holdout = pd.DataFrame(rng.normal(size=(n_rows, len(game_columns))), columns=game_columns)
+    y_holdout = (X_holdout['point_differential'] + rng.normal(size=n_rows) > 0).astype(int)
+    game_calibrator = ProbabilityCalibrator.fit_isotonic(
+        game_model.predict_proba(X_holdout)[:, 1], y_holdout)
+
+    # Player features at realistic scale, taken from fixture game logs
+    player_rows = [
+        prepare_player_features(player_stats_from_log(player_game_log(pid, "2025-26")), int(opp))
+        for pid, opp in zip(range(1, 301), rng.integers(1, 31, 300))
+    ]
+    X_player = pd.concat(player_rows, ignore_index=True)
+    averages = X_player[['avg_points', 'avg_rebounds', 'avg_assists', 'avg_steals', 'avg_blocks']]
+    y_player = np.maximum(averages.to_numpy() + rng.normal(scale=0.5, size=averages.shape), 0)
+    player_model = xgb.XGBRegressor(n_estimators=200, max_depth=4, tree_method="hist",
+                                    multi_strategy="multi_output_tree", n_jobs=1)
+    player_model.fit(X_player, y_player)
+    projection_model = PlayerProjectionModel.fit(
+        X_player, pd.DataFrame(y_player, columns=list(PROJECTED_STATS)))
+
+    ModelLoader._game_prediction_model = game_model
+    ModelLoader._game_calibrator = game_calibrator
+    ModelLoader._player_stats_model = player_model
+    ModelLoader._player_projection_model = projection_model
@@ -0,0 +1,106 @@
+"""
+Benchmark Harness
+
+Shared timing, statistics and baseline comparison helpers.
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+
+def summarize_latencies(latencies: List[float], wall_seconds: float) -> Dict[str, float]:
+    """
+    Summarize per-call latencies
+
+    Args:
+        latencies: Latency of each call in seconds
+        wall_seconds: Wall-clock time for the whole run
+
+    Returns:
+        Throughput (calls/sec) and mean/p50/p95/p99 latency in milliseconds
+    """
+    values = np.asarray(latencies) * 1000
+    return {
+        "calls": len(values),
+        "throughput": round(len(values) / wall_seconds, 2),
+        "mean_ms": round(float(values.mean()), 4),
+        "p50_ms": round(float(np.percentile(values, 50)), 4),
+        "p95_ms": round(float(np.percentile(values, 95)), 4),
+        "p99_ms": round(float(np.percentile(values, 99)), 4),
+    }
+
+
+def time_calls(fn: Callable[[], Any], iterations: int, warmup: int = 5) -> Dict[str, float]:
+    """Call fn repeatedly and summarize its latency"""
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - call_start)
+    return summarize_latencies(latencies, time.perf_counter() - start)
+
+
+def peak_allocation_kib(fn: Callable[[], Any], warmup: int = 5) -> float:
+    """Peak memory allocated by one call of fn, in KiB (measured with tracemalloc)"""
+    for _ in range(warmup):
+        fn()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        return round((tracemalloc.get_traced_memory()[1] - baseline) / 1024, 2)
+    finally:
+        tracemalloc.stop()
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine the results were produced on"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def write_results(results: Dict[str, Any], path: str):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.10) -> List[str]:
+    """
+    Compare two result files benchmark by benchmark
+
+    A benchmark regresses when its p50 latency grows, or its throughput
+    drops, by more than the tolerance.
+
+    Args:
+        current: Results of this run
+        baseline: Stored baseline results
+        tolerance: Allowed relative change (0.10 = 10%)
+
+    Returns:
+        One line per regression
+    """
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if base is None:
+            continue
+        p50_change = result["p50_ms"] / base["p50_ms"] - 1 if base["p50_ms"] else 0
+        throughput_change = result["throughput"] / base["throughput"] - 1 if base["throughput"] else 0
+        if p50_change > tolerance or throughput_change < -tolerance:
+            regressions.append(
+                f"{name}: p50 {base['p50_ms']:.3f} -> {result['p50_ms']:.3f} ms ({p50_change:+.1%}), "
+                f"throughput {base['throughput']:.1f} -> {result['throughput']:.1f}/s ({throughput_change:+.1%})"
+            )
+    return regressions
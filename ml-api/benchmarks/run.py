@@ -0,0 +1,96 @@
+"""
+Prediction API Benchmark Suite
+
+Runs the API and pipeline benchmarks against fixture data (no network),
+writes the results as JSON and optionally compares them with a stored
+baseline. The startup group also fails if importing app.main pulls in a
+heavy dependency that should load lazily. Pass --replay to use responses recorded with NBA_DATA_MODE=record
+instead of generated fixtures.
+
+Usage (from ml-api/):
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --output results.json --baseline benchmarks/baseline.json
+
+Exits with status 1 if any benchmark regressed beyond the tolerance or a
+heavy module is imported eagerly.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from benchmarks import bench_api, bench_micro, bench_schedule, bench_serialization, bench_startup, fixtures
+from benchmarks.harness import compare_results, environment, write_results
+
+
+def main():
+    """
+    Run the benchmark suite
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the prediction API")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write results")
+    parser.add_argument("--baseline", help="Baseline results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and concurrency level")
+    parser.add_argument("--iterations", type=int, default=500, help="Calls per microbenchmark")
+    parser.add_argument("--only", choices=["api", "micro", "schedule", "serialization", "startup"], help="Run one group of benchmarks")
+    parser.add_argument("--replay", help="Replay recorded nba_api responses from this directory")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Artificial upstream latency in replay mode")
+    args = parser.parse_args()
+
+    fixtures.install_fixtures(args.replay, args.latency_ms)
+    fixtures.install_models()
+
+    benchmarks = {}
+    eager_imports = []
+    if args.only in (None, "startup"):
+        print("Running startup benchmarks...")
+        report = bench_startup.import_report()
+        bench_startup.print_report(report)
+        eager_imports = bench_startup.check_lazy_imports(report)
+        benchmarks.update(bench_startup.run())
+    if args.only in (None, "micro"):
+        print("Running microbenchmarks...")
+        benchmarks.update(bench_micro.run(args.iterations))
+    if args.only in (None, "serialization"):
+        print("Running serialization benchmarks...")
+        benchmarks.update(bench_serialization.run(args.iterations))
+    if args.only in (None, "schedule"):
+        print("Running schedule benchmarks...")
+        benchmarks.update(bench_schedule.run(args.iterations))
+    if args.only in (None, "api"):
+        print("Running API benchmarks...")
+        benchmarks.update(bench_api.run(args.requests))
+
+    results = {
+        "created": datetime.utcnow().isoformat(),
+        "environment": environment(),
+        "benchmarks": benchmarks,
+    }
+    write_results(results, args.output)
+
+    print(f"\n{'benchmark':<36}{'throughput/s':>14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, result in benchmarks.items():
+        print(f"{name:<36}{result['throughput']:>14.1f}{result['p50_ms']:>10.3f}"
+              f"{result['p95_ms']:>10.3f}{result['p99_ms']:>10.3f}")
+    print(f"\nResults written to {args.output}")
+
+    if eager_imports:
+        print(f"\nHeavy modules imported by app.main: {', '.join(eager_imports)}")
+        sys.exit(1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Gunicorn configuration for production deployments
+
+Runs N uvicorn workers (WEB_CONCURRENCY, default one per CPU core). The app
+is preloaded in the master so models load once and are shared copy-on-write
+by the workers; nba_api responses are shared between workers through the
+SQLite cache at SHARED_CACHE_PATH, and Prometheus metrics are aggregated
+across workers through PROMETHEUS_MULTIPROC_DIR.
+
+Usage (from ml-api/):
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+
+def _private_dir() -> str:
+    """Per-user 0700 directory for runtime files; /tmp itself is writable by everyone"""
+    suffix = os.getuid() if hasattr(os, "getuid") else os.getenv("USERNAME", "user")
+    path = os.path.join(tempfile.gettempdir(), f"nba-api-{suffix}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+# Both must be set before the app (and prometheus_client) is imported
+if not os.getenv("SHARED_CACHE_PATH") or not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    runtime_dir = _private_dir()
+    os.environ.setdefault("SHARED_CACHE_PATH", os.path.join(runtime_dir, "cache.sqlite"))
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(runtime_dir, "metrics"))
+
+
+def on_starting(server):
+    # Stale metric files from a previous run would be aggregated into /metrics
+    metrics_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def when_ready(server):
+    from app.main import warm_up
+    warm_up()
+    server.log.info("Models and search index loaded; forking workers")
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,349 @@
+"""
+Game Model Backtest
+
+This module measures how the game model would have done over past seasons
+without calling /predict/game game by game. For every season it builds the
+features each game would have had on its date - recent form from each
+team's previous games, Elo ratings from all earlier games, opponent-adjusted
+ratings from the season's earlier days and schedule features from the
+season's fixture list, exactly as the API and update_model.py compute
+them - as whole-season column operations, scores the season in one batch,
+and reports accuracy, log loss, Brier score and calibration next to the
+plain Elo prediction.
+
+Seasons are independent, so they are built and scored in parallel worker
+processes. With --walk-forward a fresh model is trained for each season on
+all earlier seasons; otherwise the served model is scored as it is (only
+meaningful for seasons it was not trained on).
+
+Game logs come from a CSV of LeagueGameLog rows (with SEASON_ID), or are
+fetched through the configured nba_api data source, one request per season
+(NBA_DATA_MODE=replay works offline).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.calibration import ProbabilityCalibrator, brier_score, expected_calibration_error, reliability_curve  # noqa: E402
+from app.services.data_fetcher import season_for_date  # noqa: E402
+from app.services.data_source import fetch_frames  # noqa: E402
+from app.services.elo import EloRatings, games_from_league_log  # noqa: E402
+from app.services.feature_engineering import prepare_game_features  # noqa: E402
+from app.services.schedule import ScheduleTable  # noqa: E402
+from app.services.team_ratings import NEUTRAL_RATING_FEATURES, TeamRatings  # noqa: E402
+from update_model import DEFAULT_MODEL, load_current_model  # noqa: E402
+
+GAME_FEATURES = list(prepare_game_features({}, {}).columns)
+
+# Same parameters as train_model.train_game_prediction_model
+WALK_FORWARD_PARAMS = {
+    "objective": "binary:logistic",
+    "max_depth": 6,
+    "learning_rate": 0.1,
+    "n_estimators": 200,
+    "subsample": 0.8,
+    "colsample_bytree": 0.8,
+    "random_state": 42,
+    "tree_method": "hist",
+    "n_jobs": 1,
+}
+
+
+def previous_season(season: str) -> str:
+    """Season before the given one, e.g. 2024-25 for 2025-26"""
+    start = int(season[:4]) - 1
+    return f"{start}-{str(start + 1)[-2:]}"
+
+
+def fetch_season_log(season: str) -> pd.DataFrame:
+    """LeagueGameLog team rows of one regular season"""
+    return fetch_frames("LeagueGameLog", season=season, season_type_all_star="Regular Season")[0]
+
+
+def team_form_columns(log: pd.DataFrame, games_back: int = 10) -> pd.DataFrame:
+    """
+    As-of-date recent form for every team-game row, as whole-column operations
+
+    Each row gets the aggregates team_form_from_log would compute from that
+    team's previous `games_back` games: windowed sums are differences of
+    per-team cumulative sums, so there is no loop over games.
+
+    Args:
+        log: LeagueGameLog rows for one season
+        games_back: Window length, as in fetch_game_data
+
+    Returns:
+        One row per team-game with GAME_ID, TEAM_ID, home and the TeamForm
+        fields used by prepare_game_features
+    """
+    df = log.assign(DATE=pd.to_datetime(log["GAME_DATE"], format="mixed"))
+    df = df.sort_values(["TEAM_ID", "DATE"], kind="mergesort").reset_index(drop=True)
+    home = df["MATCHUP"].str.contains("vs.", regex=False).to_numpy()
+    won = (df["WL"] == "W").to_numpy(dtype=float)
+    values = pd.DataFrame({
+        "points": df["PTS"].to_numpy(dtype=float),
+        # The API only has opponent points when the log carries OPP_PTS
+        "allowed": df["OPP_PTS"].to_numpy(dtype=float) if "OPP_PTS" in df.columns else 0.0,
+        "won": won,
+        "home": home.astype(float),
+        "home_won": won * home,
+        "away": (~home).astype(float),
+        "away_won": won * ~home,
+        "TEAM_ID": df["TEAM_ID"].to_numpy(),
+    })
+
+    by_team = values.groupby("TEAM_ID", sort=False)
+    before = by_team.cumsum() - values.drop(columns="TEAM_ID")
+    window = before - before.groupby(values["TEAM_ID"], sort=False).shift(games_back).fillna(0.0)
+    count = window["home"] + window["away"]
+
+    def ratio(numerator, denominator):
+        return np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1), 0.0)
+
+    last_date = df.groupby("TEAM_ID", sort=False)["DATE"].shift(1)
+    return pd.DataFrame({
+        "GAME_ID": df["GAME_ID"].to_numpy(),
+        "TEAM_ID": df["TEAM_ID"].to_numpy(),
+        "DATE": df["DATE"].to_numpy(),
+        "home": home,
+        "avg_points": ratio(window["points"], count),
+        "avg_points_allowed": ratio(window["allowed"], count),
+        "win_percentage": ratio(window["won"], count),
+        "home_win_percentage": ratio(window["home_won"], window["home"]),
+        "away_win_percentage": ratio(window["away_won"], window["away"]),
+        "rest_days": (df["DATE"] - last_date).dt.days.fillna(0).astype(int).to_numpy(),
+    })
+
+
+def season_features(season: str, log: Optional[pd.DataFrame] = None,
+                    previous_log: Optional[pd.DataFrame] = None) -> Dict[str, object]:
+    """
+    Leakage-free features and outcomes for every game of a season
+
+    Elo ratings are replayed from the previous season (so the between-season
+    regression applies) and read before each game is applied; adjusted
+    ratings start from scratch each season, as served.
+
+    Args:
+        season: Season string
+        log: LeagueGameLog rows of the season (fetched when omitted)
+        previous_log: Rows of the season before (fetched when omitted)
+
+    Returns:
+        {"season", "X", "y", "dates", "elo"}; elo is the plain Elo home win
+        probability for each game
+    """
+    if log is None:
+        log = fetch_season_log(season)
+    if previous_log is None:
+        try:
+            previous_log = fetch_season_log(previous_season(season))
+        except Exception as e:
+            print(f"{season}: no previous season for Elo ({e}); starting from the mean")
+            previous_log = log.iloc[:0]
+
+    form = team_form_columns(log)
+    home = form[form["home"]].drop(columns=["home", "TEAM_ID"])
+    away = form[~form["home"]].drop(columns=["home", "DATE"])
+    games = home.merge(away, on="GAME_ID", suffixes=("_home", "_away"))
+
+    ratings = EloRatings()
+    ratings.apply_games(games_from_league_log(previous_log).itertuples(index=False))
+    results = games_from_league_log(log)
+    elo = np.empty((len(results), 3))
+    for i, game in enumerate(results.itertuples(index=False)):
+        features = ratings.features(game.home_team_id, game.away_team_id)
+        elo[i] = features["home_elo"], features["away_elo"], features["elo_home_win_prob"]
+        ratings.update(game.home_team_id, game.away_team_id, game.home_points,
+                       game.away_points, game.game_date, game.game_id)
+    results[["home_elo", "away_elo", "elo_home_win_prob"]] = elo
+
+    # Adjusted ratings move with every game, so a day's games only see earlier days
+    team_ratings = TeamRatings()
+    adjusted = np.empty((len(results), len(NEUTRAL_RATING_FEATURES)))
+    for _, rows in sorted(results.groupby("game_date").indices.items()):
+        day = results.iloc[rows]
+        adjusted[rows] = [list(team_ratings.features(home, away).values())
+                          for home, away in zip(day["home_team_id"], day["away_team_id"])]
+        team_ratings.apply_games(day.itertuples(index=False))
+    results[list(NEUTRAL_RATING_FEATURES)] = adjusted
+    schedule = ScheduleTable(results).game_columns(results)
+    results[list(schedule.columns)] = schedule
+    games = games.merge(results[["game_id", "home_points", "away_points", "home_elo", "away_elo",
+                                 "elo_home_win_prob", *schedule.columns, *NEUTRAL_RATING_FEATURES]],
+                        left_on="GAME_ID", right_on="game_id")
+    games = games.sort_values(["DATE", "GAME_ID"], kind="mergesort").reset_index(drop=True)
+
+    # Same formulas as prepare_game_features, one column at a time
+    h, a = "_home", "_away"
+    columns = {
+        "home_avg_points": games["avg_points" + h],
+        "home_avg_points_allowed": games["avg_points_allowed" + h],
+        "home_win_pct": games["win_percentage" + h],
+        "home_home_win_pct": games["home_win_percentage" + h],
+        "home_rest_days": games["rest_days" + h],
+        "away_avg_points": games["avg_points" + a],
+        "away_avg_points_allowed": games["avg_points_allowed" + a],
+        "away_win_pct": games["win_percentage" + a],
+        "away_away_win_pct": games["away_win_percentage" + a],
+        "away_rest_days": games["rest_days" + a],
+        "point_differential": games["avg_points" + h] - games["avg_points" + a],
+        "defensive_differential": games["avg_points_allowed" + a] - games["avg_points_allowed" + h],
+        "win_pct_differential": games["win_percentage" + h] - games["win_percentage" + a],
+        "rest_advantage": games["rest_days" + h] - games["rest_days" + a],
+        "home_offensive_rating": games["avg_points" + h] * 100 / np.maximum(games["avg_points_allowed" + h], 1),
+        "away_offensive_rating": games["avg_points" + a] * 100 / np.maximum(games["avg_points_allowed" + a], 1),
+        "home_elo": games["home_elo"],
+        "away_elo": games["away_elo"],
+        "elo_home_win_prob": games["elo_home_win_prob"],
+        **{name: games[name] for name in schedule.columns},
+        **{name: games[name] for name in NEUTRAL_RATING_FEATURES},
+    }
+    return {
+        "season": season,
+        "X": pd.DataFrame(columns)[GAME_FEATURES],
+        "y": (games["home_points"] > games["away_points"]).to_numpy(dtype=int),
+        "dates": games["DATE"],
+        "elo": games["elo_home_win_prob"].to_numpy(),
+    }
+
+
+def score(probabilities: np.ndarray, outcomes: np.ndarray, n_bins: int = 10) -> Dict[str, object]:
+    """Accuracy, log loss, Brier score, ECE and reliability curve of home win probabilities"""
+    p = np.clip(probabilities, 1e-15, 1 - 1e-15)
+    return {
+        "games": int(len(outcomes)),
+        "accuracy": float(np.mean((p > 0.5) == outcomes)),
+        "log_loss": float(-np.mean(outcomes * np.log(p) + (1 - outcomes) * np.log(1 - p))),
+        "brier": brier_score(p, outcomes),
+        "ece": expected_calibration_error(p, outcomes, n_bins),
+        "reliability": reliability_curve(p, outcomes, n_bins),
+    }
+
+
+def score_season(data: Dict[str, object], model_path: Optional[str], calibration_path: Optional[str],
+                 train: Optional[List[Dict[str, object]]] = None) -> Dict[str, object]:
+    """
+    Score one season in a single batch
+
+    Args:
+        data: season_features output
+        model_path: Served model to score (ignored when `train` is given)
+        calibration_path: Calibration table to apply to model probabilities
+        train: Earlier seasons' season_features to fit a fresh model on
+
+    Returns:
+        {"season", "model": score or None, "elo": score}
+    """
+    import xgboost as xgb
+
+    model = None
+    if train:
+        model = xgb.XGBClassifier(**WALK_FORWARD_PARAMS)
+        model.fit(pd.concat([t["X"] for t in train], ignore_index=True),
+                  np.concatenate([t["y"] for t in train]))
+    elif model_path:
+        model = load_current_model(model_path)
+
+    result = {"season": data["season"], "model": None, "elo": score(data["elo"], data["y"])}
+    if model is not None and len(data["y"]):
+        probabilities = model.predict_proba(data["X"])[:, 1]
+        if calibration_path:
+            probabilities = ProbabilityCalibrator.load(calibration_path).transform(probabilities)
+        result["model"] = score(probabilities, data["y"])
+    return result
+
+
+def _split_by_season(game_logs: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """CSV rows grouped by season string, from SEASON_ID like 22025"""
+    years = game_logs["SEASON_ID"].astype(str).str[-4:].astype(int)
+    return {f"{year}-{str(year + 1)[-2:]}": frame for year, frame in game_logs.groupby(years)}
+
+
+def main():
+    """
+    Backtest the game model season by season and print the report
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--from-season", help="First season (default: nine before --to-season)")
+    parser.add_argument("--to-season", help="Last season (default: the last completed one)")
+    parser.add_argument("--game-logs", help="CSV of LeagueGameLog rows instead of fetching them")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="Model to score")
+    parser.add_argument("--walk-forward", action="store_true",
+                        help="Train a fresh model per season on all earlier seasons instead")
+    parser.add_argument("--calibration", help="Calibration table to apply to model probabilities")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--report", help="Also write per-season results as JSON")
+    args = parser.parse_args()
+
+    print("Game Model Backtest")
+    print("=" * 50)
+    started = time.perf_counter()
+
+    to_season = args.to_season or previous_season(season_for_date(datetime.now().date()))
+    from_season = args.from_season or f"{int(to_season[:4]) - 9}-{str(int(to_season[:4]) - 8)[-2:]}"
+    seasons = [f"{year}-{str(year + 1)[-2:]}" for year in range(int(from_season[:4]), int(to_season[:4]) + 1)]
+
+    logs = {}
+    if args.game_logs:
+        logs = _split_by_season(pd.read_csv(args.game_logs, dtype={"GAME_ID": str}))
+        seasons = [season for season in seasons if season in logs]
+    empty = pd.DataFrame()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # Features: every season independently
+        futures = [
+            pool.submit(season_features, season, logs.get(season),
+                        logs.get(previous_season(season), empty) if args.game_logs else None)
+            for season in seasons
+        ]
+        features = [future.result() for future in futures]
+        print(f"Built features for {sum(len(f['y']) for f in features)} games in "
+              f"{len(seasons)} seasons ({time.perf_counter() - started:.1f}s with {args.workers} worker processes)")
+
+        # Scoring: each season in one batch, after training on earlier ones if walking forward
+        futures = [
+            pool.submit(score_season, data, None if args.walk_forward else args.model, args.calibration,
+                        features[:i] if args.walk_forward else None)
+            for i, data in enumerate(features)
+        ]
+        results = [future.result() for future in futures]
+
+    rows = []
+    for result in results:
+        for name in ("model", "elo"):
+            if result[name] is not None:
+                rows.append({"season": result["season"], "predictor": name,
+                             **{k: v for k, v in result[name].items() if k != "reliability"}})
+    if not rows:
+        print("No games to score")
+        return
+    report = pd.DataFrame(rows).set_index(["season", "predictor"])
+    print(f"\n{report.round(4).to_string()}")
+
+    totals = report.groupby(level="predictor").apply(
+        lambda r: pd.Series({"games": r["games"].sum(),
+                             **{m: np.average(r[m], weights=r["games"])
+                                for m in ("accuracy", "log_loss", "brier", "ece")}}))
+    print(f"\nAll seasons (game-weighted):\n{totals.round(4).to_string()}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nReport written to {args.report}")
+    print(f"\nFinished in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Game Model Calibration
+
+This module fits the calibration table applied to /predict/game win
+probabilities and reports how well calibrated the game model is.
+
+The served model scores a time-ordered holdout of games it was not trained
+on (pass a --since after its training data; nightly updates record theirs in
+xgboost_model.state.json). The earlier part of the holdout fits an isotonic
+or Platt map, and the later part compares raw and calibrated probabilities
+by Brier score, expected calibration error and reliability curve. The saved
+table is then refitted on the whole holdout.
+
+Game logs come from a CSV of TeamGameLog rows, or are fetched through the
+configured nba_api data source (NBA_DATA_MODE=replay works offline).
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.calibration import (  # noqa: E402
+    ProbabilityCalibrator,
+    brier_score,
+    expected_calibration_error,
+    reliability_curve,
+)
+from app.services.model_loder import model_file_version  # noqa: E402
+from update_model import DEFAULT_MODEL, build_game_rows, fetch_team_logs, load_current_model, training_seasons  # noqa: E402
+
+DEFAULT_OUTPUT = os.path.join(
+    os.path.dirname(__file__), "..", "app", "models", "game_calibration.json")
+
+# Isotonic needs enough games per step to be stable; below this use Platt
+MIN_ISOTONIC_GAMES = 500
+
+
+def fit_calibrator(probabilities: np.ndarray, outcomes: np.ndarray, method: str) -> ProbabilityCalibrator:
+    """Fit the requested method; "auto" picks isotonic only with enough games"""
+    if method == "auto":
+        method = "isotonic" if len(outcomes) >= MIN_ISOTONIC_GAMES else "platt"
+    if method == "isotonic":
+        return ProbabilityCalibrator.fit_isotonic(probabilities, outcomes)
+    return ProbabilityCalibrator.fit_platt(probabilities, outcomes)
+
+
+def calibration_report(probabilities: np.ndarray, outcomes: np.ndarray, n_bins: int = 10) -> dict:
+    """Brier score, expected calibration error and reliability curve"""
+    return {
+        "games": int(len(outcomes)),
+        "brier": brier_score(probabilities, outcomes),
+        "ece": expected_calibration_error(probabilities, outcomes, n_bins),
+        "reliability": reliability_curve(probabilities, outcomes, n_bins),
+    }
+
+
+def print_report(name: str, report: dict):
+    """Print one report as a reliability table"""
+    print(f"\n{name}: Brier {report['brier']:.4f}, ECE {report['ece']:.4f} ({report['games']} games)")
+    table = pd.DataFrame(report["reliability"])
+    if not table.empty:
+        print(table.round(3).to_string(index=False))
+
+
+def main():
+    """
+    Fit the game calibration table and print reliability reports
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--game-logs", help="CSV of TeamGameLog rows instead of fetching them")
+    parser.add_argument("--since", type=date.fromisoformat,
+                        help="Holdout starts after this date (default: 60 days before --until)")
+    parser.add_argument("--until", type=date.fromisoformat, help="Holdout end (default: yesterday)")
+    parser.add_argument("--method", choices=("auto", "isotonic", "platt"), default="auto")
+    parser.add_argument("--eval-fraction", type=float, default=0.3,
+                        help="Latest share of the holdout used only for evaluation")
+    parser.add_argument("--bins", type=int, default=10, help="Reliability curve bins")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--report", help="Also write the reports as JSON to this path")
+    parser.add_argument("--report-only", action="store_true", help="Evaluate without saving a table")
+    args = parser.parse_args()
+
+    print("Game Model Calibration")
+    print("=" * 50)
+
+    until = args.until or datetime.now().date() - timedelta(days=1)
+    since = args.since or until - timedelta(days=60)
+
+    model = load_current_model(args.model)
+    if model is None:
+        print(f"No usable game model at {args.model}; train or update one first")
+        return
+
+    if args.game_logs:
+        team_logs = pd.read_csv(args.game_logs)
+    else:
+        team_logs = fetch_team_logs(training_seasons(since, until))
+    X, y, dates = build_game_rows(team_logs, since, until)
+    if len(y) < 20:
+        print(f"Only {len(y)} games after {since} through {until}; need at least 20")
+        return
+
+    # Rows are in date order; the evaluation part is strictly later
+    probabilities = model.predict_proba(X)[:, 1]
+    split = int(len(y) * (1 - args.eval_fraction))
+    print(f"Holdout: {len(y)} games after {since} through {until}; "
+          f"fitting on {split}, evaluating on {len(y) - split} (from {dates.iloc[split]:%Y-%m-%d})")
+
+    calibrator = fit_calibrator(probabilities[:split], y[:split], args.method)
+    reports = {
+        "raw": calibration_report(probabilities[split:], y[split:], args.bins),
+        "calibrated": calibration_report(calibrator.transform(probabilities[split:]), y[split:], args.bins),
+    }
+    print(f"Method: {calibrator.method} ({len(calibrator.knots)} knots)")
+    print_report("Raw model", reports["raw"])
+    print_report("Calibrated", reports["calibrated"])
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"model": args.model, "since": since.isoformat(), "until": until.isoformat(),
+                       "method": calibrator.method, **reports}, f, indent=2)
+        print(f"\nReport written to {args.report}")
+
+    if args.report_only:
+        return
+    calibrator = fit_calibrator(probabilities, y, args.method)
+    # The table is only applied while this exact model file is served
+    calibrator.model_version = model_file_version(args.model)
+    calibrator.save(args.output)
+    print(f"\nCalibration table ({calibrator.method}, {len(calibrator.knots)} knots) "
+          f"fitted on all {len(y)} games saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
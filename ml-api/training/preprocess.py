@@ -128,6 +128,55 @@ def normalize_features(X_train: pd.DataFrame, X_test: pd.DataFrame) -> Tuple[pd.
     return X_train_scaled, X_test_scaled
 
 
+def create_player_features(game_logs: pd.DataFrame, lookback_games: int = 10) -> Dict[str, pd.DataFrame]:
+    """
+    Build (features, targets) pairs from player game logs without leakage
+
+    Each game becomes one row whose features are computed, exactly like
+    fetch_player_stats + prepare_player_features, from the player's
+    previous `lookback_games` games only.
+
+    Args:
+        game_logs: PlayerGameLog rows for any number of players
+        lookback_games: Games averaged into each feature row
+
+    Returns:
+        {"X": feature frame, "Y": target frame, "keys": Player_ID/Game_ID/GAME_DATE}
+    """
+    df = game_logs.copy()
+    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed")
+    df = df.sort_values(["Player_ID", "GAME_DATE"], kind="mergesort").reset_index(drop=True)
+
+    by_player = df.groupby("Player_ID", sort=False)
+    columns = {
+        "PTS": "avg_points", "REB": "avg_rebounds", "AST": "avg_assists",
+        "STL": "avg_steals", "BLK": "avg_blocks", "FG_PCT": "fg_percentage",
+        "FG3_PCT": "three_pt_percentage", "FT_PCT": "ft_percentage",
+        "MIN": "minutes_per_game", "FGA": "avg_fga", "FTA": "avg_fta", "TOV": "avg_turnovers",
+    }
+    # shift(1) so a game's own box score never feeds its features
+    rolling = by_player[list(columns)].transform(
+        lambda s: s.shift(1).rolling(lookback_games, min_periods=1).mean())
+    rolling.columns = list(columns.values())
+    rolling["games_played"] = by_player.cumcount()
+
+    # Same formulas as feature_engineering.calculate_true_shooting / calculate_usage_rate
+    attempts = rolling["avg_fga"] + 0.44 * rolling["avg_fta"]
+    rolling["true_shooting_pct"] = np.where(
+        attempts > 0, rolling["avg_points"] / (2 * attempts.where(attempts > 0, 1)), 0.0)
+    rolling["usage_rate"] = (attempts + rolling["avg_turnovers"]) / \
+        rolling["minutes_per_game"].clip(lower=1) * 100
+
+    valid = rolling["games_played"] > 0
+    targets = df[["PTS", "REB", "AST", "STL", "BLK"]].set_axis(
+        ["points", "rebounds", "assists", "steals", "blocks"], axis=1)
+    return {
+        "X": rolling[valid].reset_index(drop=True),
+        "Y": targets[valid].reset_index(drop=True),
+        "keys": df.loc[valid, ["Player_ID", "Game_ID", "GAME_DATE"]].reset_index(drop=True),
+    }
+
+
 if __name__ == "__main__":
     # Example usage
     print("Data preprocessing module loaded")
@@ -0,0 +1,143 @@
+"""
+In-Game Win Probability Replay
+
+This module validates the live win probability model by replaying archived
+play-by-play through LiveWinProbability as fast as possible, then scoring
+every intermediate probability against the final result.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.live_games import parse_game_clock  # noqa: E402
+from app.services.live_win_probability import LiveWinProbability, GAME_SECONDS  # noqa: E402
+
+# Column names used by nba_api's PlayByPlayV3 export
+PBP_V3_COLUMNS = {
+    'gameId': 'game_id',
+    'scoreHome': 'home_score',
+    'scoreAway': 'away_score',
+}
+
+
+def load_play_by_play(filepath: str) -> pd.DataFrame:
+    """
+    Load archived play-by-play events
+
+    The CSV needs game_id, period, clock (either "PT05M12.00S" strings or a
+    clock_seconds column), home_score and away_score. Optional columns are
+    possession (1 home, -1 away, 0 unknown) and prior (pre-game home win
+    probability). PlayByPlayV3 column names are accepted as well.
+
+    Args:
+        filepath: Path to the play-by-play CSV
+
+    Returns:
+        DataFrame of events in game order with scores forward-filled
+    """
+    df = pd.read_csv(filepath, dtype={'gameId': str, 'game_id': str})
+    df = df.rename(columns=PBP_V3_COLUMNS)
+
+    if 'clock_seconds' not in df.columns:
+        df['clock_seconds'] = df['clock'].map(parse_game_clock)
+    if 'possession' not in df.columns:
+        df['possession'] = 0
+
+    # V3 only fills the score on scoring plays
+    df[['home_score', 'away_score']] = df.groupby('game_id')[
+        ['home_score', 'away_score']].ffill().fillna(0)
+
+    return df.reset_index(drop=True)
+
+
+def replay(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Feed every event through the incremental model
+
+    Args:
+        df: Events from load_play_by_play
+
+    Returns:
+        The events with the home win probability after each one
+    """
+    model = LiveWinProbability()
+    priors = df.groupby('game_id')['prior'].first() if 'prior' in df.columns else {}
+    for game_id, prior in dict(priors).items():
+        model.register_game(game_id, prior)
+
+    game_ids = df['game_id'].to_numpy()
+    periods = df['period'].to_numpy()
+    clocks = df['clock_seconds'].to_numpy()
+    home_scores = df['home_score'].to_numpy()
+    away_scores = df['away_score'].to_numpy()
+    possession = df['possession'].to_numpy()
+
+    probabilities = np.empty(len(df))
+    for i in range(len(df)):
+        probabilities[i] = model.apply_event(
+            game_ids[i], home_scores[i], away_scores[i],
+            periods[i], clocks[i], possession[i])
+
+    result = df.copy()
+    result['home_win_probability'] = probabilities
+    return result
+
+
+def evaluate(replayed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score intermediate probabilities against each game's final result
+
+    Args:
+        replayed: Output of replay()
+
+    Returns:
+        Brier score and log loss per period
+    """
+    final = replayed.groupby('game_id').last()
+    home_won = (final['home_score'] > final['away_score']).astype(int)
+
+    scored = replayed.join(home_won.rename('home_won'), on='game_id')
+    p = scored['home_win_probability'].clip(1e-6, 1 - 1e-6)
+    y = scored['home_won']
+    scored['brier'] = (p - y) ** 2
+    scored['log_loss'] = -(y * np.log(p) + (1 - y) * np.log(1 - p))
+
+    return scored.groupby('period')[['brier', 'log_loss']].mean()
+
+
+def main():
+    """
+    Replay archived play-by-play and report speed and accuracy
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('filepath', help='Play-by-play CSV to replay')
+    args = parser.parse_args()
+
+    print("In-Game Win Probability Replay")
+    print("=" * 50)
+
+    df = load_play_by_play(args.filepath)
+    n_games = df['game_id'].nunique()
+    print(f"Loaded {len(df)} events from {n_games} games")
+
+    start = time.perf_counter()
+    replayed = replay(df)
+    elapsed = time.perf_counter() - start
+
+    game_seconds = n_games * GAME_SECONDS
+    print(f"\nReplay time: {elapsed:.3f}s ({len(df) / elapsed:,.0f} events/sec)")
+    print(f"Speed vs real time: {game_seconds / elapsed:,.0f}x")
+
+    print("\nAccuracy by period:")
+    print(evaluate(replayed).to_string())
+
+
+if __name__ == "__main__":
+    main()
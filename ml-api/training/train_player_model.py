@@ -0,0 +1,184 @@
+"""
+Player Stats Model Training
+
+This module trains the XGBoost model behind the point predictions of
+/predict/player. It uses the same leakage-free rows as the projection heads
+(features from each player's previous games only) plus the opponent, fits
+one multi-output regressor for points, rebounds, assists, steals and blocks
+with the histogram tree method, and exports it in xgboost's native JSON (or
+UBJSON) format instead of pickling the Python object.
+
+After saving, the artifact is loaded back the way the API loads it and the
+load time and prediction latency are reported.
+
+Game logs come from a CSV of PlayerGameLog rows, or are fetched through the
+configured nba_api data source (NBA_DATA_MODE=replay works offline).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.feature_engineering import prepare_player_features  # noqa: E402
+from app.services.player_projection import PROJECTED_STATS  # noqa: E402
+from app.services.standings import TEAM_INDEX  # noqa: E402
+from preprocess import create_player_features  # noqa: E402
+from train_player_projection import fetch_player_game_logs  # noqa: E402
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "app", "models")
+
+# Column order the API passes at request time
+PLAYER_FEATURES = list(prepare_player_features({}, 0).columns)
+
+# The API takes opponents as 1-30, in TEAM_INDEX order
+_TEAM_NUMBERS = {team["abbreviation"]: team["index"] + 1 for team in TEAM_INDEX.values()}
+
+
+def opponent_team_ids(game_logs: pd.DataFrame) -> pd.Series:
+    """
+    Opponent of each game as the API's 1-30 team number, parsed from MATCHUP
+
+    "BOS vs. NYK" and "BOS @ NYK" both name the opponent last. Unknown
+    abbreviations map to 0.
+    """
+    abbreviations = game_logs["MATCHUP"].str.split().str[-1]
+    return abbreviations.map(_TEAM_NUMBERS).fillna(0).astype(int)
+
+
+def build_training_set(game_logs: pd.DataFrame, lookback_games: int = 10):
+    """
+    Feature rows in prepare_player_features column order, with targets
+
+    Args:
+        game_logs: PlayerGameLog rows for any number of players
+        lookback_games: Games averaged into each feature row
+
+    Returns:
+        (X, Y, game dates)
+    """
+    data = create_player_features(game_logs, lookback_games)
+    opponents = game_logs.assign(opponent_team_id=opponent_team_ids(game_logs))[
+        ["Player_ID", "Game_ID", "opponent_team_id"]]
+    keys = data["keys"].merge(opponents, on=["Player_ID", "Game_ID"], how="left")
+    X = data["X"].assign(opponent_team_id=keys["opponent_team_id"].fillna(0).astype(int).to_numpy())
+    return X[PLAYER_FEATURES], data["Y"][list(PROJECTED_STATS)], keys["GAME_DATE"]
+
+
+def train_model(X: pd.DataFrame, Y: pd.DataFrame, n_estimators: int = 300) -> xgb.XGBRegressor:
+    """
+    Fit one multi-output regressor for all projected stats
+
+    Args:
+        X: Feature rows
+        Y: One target column per projected stat
+        n_estimators: Boosting rounds
+
+    Returns:
+        Fitted XGBRegressor
+    """
+    model = xgb.XGBRegressor(
+        n_estimators=n_estimators,
+        max_depth=4,
+        learning_rate=0.05,
+        subsample=0.8,
+        colsample_bytree=0.8,
+        tree_method="hist",
+        multi_strategy="multi_output_tree",
+        n_jobs=-1,
+        random_state=42,
+    )
+    model.fit(X, Y)
+    return model
+
+
+def measure_latency(path: str, X: pd.DataFrame, repeats: int = 200) -> dict:
+    """
+    Load a saved model like the API does and time it
+
+    Returns:
+        Load time, and median latency of single-row and full-batch predictions
+    """
+    start = time.perf_counter()
+    model = xgb.XGBRegressor()
+    model.load_model(path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    def median_ms(rows, n):
+        timings = []
+        for _ in range(n):
+            start = time.perf_counter()
+            model.predict(rows)
+            timings.append((time.perf_counter() - start) * 1000)
+        return float(np.median(timings))
+
+    return {
+        "load_ms": load_ms,
+        "predict_one_ms": median_ms(X.iloc[:1], repeats),
+        f"predict_{len(X)}_ms": median_ms(X, max(repeats // 20, 5)),
+    }
+
+
+def main():
+    """
+    Train the player stats model and export it in xgboost's native format
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--game-logs", help="CSV of PlayerGameLog rows")
+    parser.add_argument("--season", default="2025-26", help="Season to fetch when no CSV is given")
+    parser.add_argument("--max-players", type=int, default=200)
+    parser.add_argument("--lookback", type=int, default=10, help="Games averaged per feature row")
+    parser.add_argument("--test-fraction", type=float, default=0.2, help="Latest share of games held out")
+    parser.add_argument("--n-estimators", type=int, default=300)
+    parser.add_argument("--format", choices=("json", "ubj"), default="json",
+                        help="Native xgboost format; ubj is smaller and loads faster")
+    parser.add_argument("--output", help="Defaults to app/models/player_stats_model.<format>")
+    args = parser.parse_args()
+    output = args.output or os.path.join(MODELS_DIR, f"player_stats_model.{args.format}")
+
+    print("Player Stats Model Training")
+    print("=" * 50)
+
+    if args.game_logs:
+        game_logs = pd.read_csv(args.game_logs)
+    else:
+        game_logs = fetch_player_game_logs(args.season, args.max_players)
+    print(f"Loaded {len(game_logs)} games for {game_logs['Player_ID'].nunique()} players")
+
+    X, Y, dates = build_training_set(game_logs, args.lookback)
+    split_date = dates.quantile(1 - args.test_fraction)
+    train = (dates < split_date).to_numpy()
+    print(f"Training rows: {train.sum()}, held out: {(~train).sum()} (from {split_date:%Y-%m-%d})")
+
+    start = time.perf_counter()
+    model = train_model(X[train], Y[train], args.n_estimators)
+    print(f"Trained in {time.perf_counter() - start:.1f}s")
+
+    predicted = np.maximum(model.predict(X[~train]), 0)
+    baseline = X.loc[~train, ["avg_points", "avg_rebounds", "avg_assists", "avg_steals", "avg_blocks"]]
+    report = pd.DataFrame({
+        "model_mae": np.abs(Y[~train].to_numpy() - predicted).mean(axis=0),
+        "rolling_avg_mae": np.abs(Y[~train].to_numpy() - baseline.to_numpy()).mean(axis=0),
+    }, index=list(PROJECTED_STATS))
+    print("\nHeld-out accuracy:")
+    print(report.round(3).to_string())
+
+    # Refit on every game before exporting
+    model = train_model(X, Y, args.n_estimators)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    model.save_model(output)
+    print(f"\nModel saved to {output} ({os.path.getsize(output) / 1024:.0f} KiB)")
+
+    print("\nServing cost:")
+    for name, value in measure_latency(output, X[~train]).items():
+        print(f"  {name}: {value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Player Projection Model Training
+
+This module fits the P10/P50/P90 quantile heads behind /predict/player from
+player game logs. Every game becomes one training row whose features are
+built from the player's previous games only, the same way the API builds
+them at request time, and the last part of the season is held out to check
+interval coverage.
+
+Game logs come from a CSV of PlayerGameLog rows, or are fetched through the
+configured nba_api data source (NBA_DATA_MODE=replay works offline).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.data_source import fetch_frames  # noqa: E402
+from app.services.player_projection import PROJECTED_STATS, PlayerProjectionModel  # noqa: E402
+from preprocess import create_player_features  # noqa: E402
+
+DEFAULT_OUTPUT = os.path.join(
+    os.path.dirname(__file__), "..", "app", "models", "player_projection_model.json")
+
+
+def fetch_player_game_logs(season: str, max_players: int = 200) -> pd.DataFrame:
+    """
+    Fetch game logs for the season's highest-minute players
+
+    Args:
+        season: Season string, e.g. "2025-26"
+        max_players: Number of players to fetch, by total minutes
+
+    Returns:
+        Concatenated PlayerGameLog rows
+    """
+    players = fetch_frames("LeagueDashPlayerStats", season=season)[0]
+    player_ids = players.sort_values("MIN", ascending=False)["PLAYER_ID"].head(max_players)
+    logs = []
+    for player_id in player_ids:
+        try:
+            logs.append(fetch_frames(
+                "PlayerGameLog", player_id=int(player_id), season=season,
+                season_type_all_star="Regular Season")[0])
+        except Exception as e:
+            print(f"Skipping player {player_id}: {e}")
+    return pd.concat(logs, ignore_index=True)
+
+
+def pinball_loss(y: np.ndarray, prediction: np.ndarray, quantile: float) -> float:
+    """Mean quantile (pinball) loss"""
+    diff = y - prediction
+    return float(np.mean(np.maximum(quantile * diff, (quantile - 1) * diff)))
+
+
+def evaluate(model: PlayerProjectionModel, X: pd.DataFrame, Y: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score the heads on held-out games
+
+    Returns:
+        Per-stat pinball loss of each head, P10-P90 coverage (ideally 0.8)
+        and the median absolute error of the point projection
+    """
+    projected = model.predict(X)
+    rows = []
+    for s, stat in enumerate(model.stats):
+        y = Y[stat].to_numpy(dtype=float)
+        row = {"stat": stat}
+        for q, quantile in enumerate(model.quantiles):
+            row[f"pinball_q{int(quantile * 100)}"] = pinball_loss(y, projected[:, s, q], quantile)
+        row["coverage_p10_p90"] = float(np.mean((y >= projected[:, s, 0]) & (y <= projected[:, s, -1])))
+        row["point_mae"] = float(np.mean(np.abs(y - projected[:, s, model.point_index])))
+        rows.append(row)
+    return pd.DataFrame(rows).set_index("stat")
+
+
+def main():
+    """
+    Train the player projection heads and save them as JSON
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--game-logs", help="CSV of PlayerGameLog rows")
+    parser.add_argument("--season", default="2025-26", help="Season to fetch when no CSV is given")
+    parser.add_argument("--max-players", type=int, default=200)
+    parser.add_argument("--lookback", type=int, default=10, help="Games averaged per feature row")
+    parser.add_argument("--test-fraction", type=float, default=0.2, help="Latest share of games held out")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    print("Player Projection Model Training")
+    print("=" * 50)
+
+    if args.game_logs:
+        game_logs = pd.read_csv(args.game_logs)
+    else:
+        game_logs = fetch_player_game_logs(args.season, args.max_players)
+    print(f"Loaded {len(game_logs)} games for {game_logs['Player_ID'].nunique()} players")
+
+    data = create_player_features(game_logs, args.lookback)
+    split_date = data["keys"]["GAME_DATE"].quantile(1 - args.test_fraction)
+    train = (data["keys"]["GAME_DATE"] < split_date).to_numpy()
+    X, Y = data["X"], data["Y"]
+    print(f"Training rows: {train.sum()}, held out: {(~train).sum()} (from {split_date:%Y-%m-%d})")
+
+    start = time.perf_counter()
+    model = PlayerProjectionModel.fit(X[train], Y[train])
+    print(f"Fitted {len(PROJECTED_STATS) * len(model.quantiles)} heads in {time.perf_counter() - start:.1f}s")
+
+    print("\nHeld-out accuracy:")
+    print(evaluate(model, X[~train], Y[~train]).round(3).to_string())
+
+    model.save(args.output)
+    print(f"\nModel saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""
+Incremental Game Model Update
+
+This module continues boosting the served game model
+(app/models/xgboost_model.json) on games finished since the last update,
+instead of retraining on the whole history with train_model.py. It is meant
+to run nightly, e.g. from cron:
+
+    15 4 * * * cd /path/to/ml-api/training && python update_model.py
+
+Features for each new game are built from both teams' game logs strictly
+before the game date, with the same aggregation the API applies at request
+time, plus Elo and opponent-adjusted ratings replayed up to the day before
+and schedule features (back-to-backs, games in the last week, travel,
+time-zone shifts). The updated model is
+written next to the current one and renamed into place, so running API
+workers pick it up within MODEL_RELOAD_INTERVAL seconds without a restart.
+The last game date covered is kept in a state file beside the model.
+
+It only ever extends an existing model: with no usable model it exits
+with an error unless --bootstrap is given with enough games, and a model
+trained on other features has to be retrained with train_model.py.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.metrics import accuracy_score, log_loss
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.data_fetcher import season_for_date, team_form_from_log  # noqa: E402
+from app.services.data_source import fetch_frames  # noqa: E402
+from app.services.elo import EloRatings, games_from_league_log  # noqa: E402
+from app.services.feature_engineering import prepare_game_features  # noqa: E402
+from app.services.game_log_index import GameLogIndex  # noqa: E402
+from app.services.model_loder import model_file_version  # noqa: E402
+from app.services.schedule import ScheduleTable  # noqa: E402
+from app.services.team_ratings import TeamRatings  # noqa: E402
+from app.services.standings import TEAM_INDEX  # noqa: E402
+
+DEFAULT_MODEL = os.path.join(
+    os.path.dirname(__file__), "..", "app", "models", "xgboost_model.json")
+
+_TEAM_IDS = {team["abbreviation"]: team_id for team_id, team in TEAM_INDEX.items()}
+
+# Games a model started from scratch (--bootstrap) must be fitted on; one
+# night of games is nowhere near enough to replace the served model
+BOOTSTRAP_MIN_GAMES = 600
+
+
+def state_path(model_path: str) -> str:
+    """State file kept beside the model, e.g. xgboost_model.state.json"""
+    return os.path.splitext(model_path)[0] + ".state.json"
+
+
+def load_state(model_path: str) -> Dict[str, Any]:
+    """Read the update state, or an empty dict before the first update"""
+    try:
+        with open(state_path(model_path)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def training_seasons(since: date, until: date) -> List[str]:
+    """
+    Seasons of team logs needed for the games finished in (since, until]
+
+    Starts a season before the window: serving builds Elo ratings from the
+    previous season and carries them over, so the window's games must not
+    start from ELO_MEAN.
+    """
+    first = int(season_for_date(since + timedelta(days=1))[:4]) - 1
+    last = int(season_for_date(until)[:4])
+    return [f"{year}-{str(year + 1)[-2:]}" for year in range(first, last + 1)]
+
+
+def fetch_team_logs(seasons) -> pd.DataFrame:
+    """
+    Fetch every team's regular-season game log through the data source
+
+    Args:
+        seasons: Season strings, e.g. ["2025-26"]
+
+    Returns:
+        Concatenated TeamGameLog rows
+    """
+    logs = []
+    for season in seasons:
+        for team_id in TEAM_INDEX:
+            try:
+                logs.append(fetch_frames(
+                    "TeamGameLog", team_id=team_id, season=season,
+                    season_type_all_star="Regular Season")[0])
+            except Exception as e:
+                print(f"Skipping team {team_id} ({season}): {e}")
+    return pd.concat(logs, ignore_index=True)
+
+
+def games_from_team_logs(team_logs: pd.DataFrame) -> pd.DataFrame:
+    """Finished games (one row each, oldest first) from every team's TeamGameLog rows"""
+    return games_from_league_log(team_logs.rename(columns={"Team_ID": "TEAM_ID", "Game_ID": "GAME_ID"}))
+
+
+def build_game_rows(
+    team_logs: pd.DataFrame,
+    since: date,
+    until: date,
+    games_back: int = 10
+) -> Tuple[pd.DataFrame, np.ndarray, pd.Series]:
+    """
+    Point-in-time features and outcomes for games finished in (since, until]
+
+    Each game appears once, from the home team's row. Both teams' features,
+    including their Elo and adjusted ratings, use only games played before that
+    game's date;
+    schedule features come from the games in the logs (the schedule is known
+    in advance). Ratings are replayed from the first game in the logs, so
+    they should cover training_seasons(since, until): with the season before
+    the window, Elo starts the window where serving has it.
+
+    Args:
+        team_logs: TeamGameLog rows for every team
+        since: Last date already covered (exclusive)
+        until: Last date to include
+        games_back: Games aggregated per team, as in fetch_game_data
+
+    Returns:
+        (features, home-win labels, game dates)
+    """
+    logs = team_logs.assign(DATE=pd.to_datetime(team_logs["GAME_DATE"], format="mixed"))
+    logs = logs.sort_values(["Team_ID", "DATE"], ascending=[True, False], kind="mergesort")
+    by_team = {int(team_id): GameLogIndex(frame) for team_id, frame in logs.groupby("Team_ID", sort=False)}
+    no_games = GameLogIndex(logs.iloc[:0])
+
+    window = (logs["DATE"] > pd.Timestamp(since)) & (logs["DATE"] <= pd.Timestamp(until))
+    games = logs[window & logs["MATCHUP"].str.contains("vs.", regex=False)]
+    games = games.drop_duplicates("Game_ID").sort_values("DATE", kind="mergesort")
+
+    finished = games_from_team_logs(team_logs)
+    history = list(finished.itertuples(index=False))
+    # One table per season, as served by get_schedule_table
+    schedules = {season: ScheduleTable(frame) for season, frame in
+                 finished.groupby(finished["game_date"].map(season_for_date))}
+    ratings = EloRatings()
+    team_ratings = TeamRatings()
+    applied = 0
+
+    rows, labels = [], []
+    for game in games.itertuples():
+        away_id = _TEAM_IDS.get(game.MATCHUP.split()[-1])
+        if away_id is None:
+            continue
+        game_date = game.DATE.to_pydatetime()
+        start = applied
+        while applied < len(history) and history[applied].game_date < game_date.date():
+            applied += 1
+        ratings.apply_games(history[start:applied])
+        team_ratings.apply_games(history[start:applied])
+        forms = []
+        for team_id in (int(game.Team_ID), away_id):
+            recent_games = by_team.get(team_id, no_games).before(game_date, games_back)
+            forms.append(team_form_from_log(team_id, recent_games, game_date, games_back))
+        rows.append(prepare_game_features(*forms, ratings.features(int(game.Team_ID), away_id),
+                                          schedules[season_for_date(game_date)].features(
+                                              int(game.Team_ID), away_id, game_date),
+                                          team_ratings.features(int(game.Team_ID), away_id)))
+        labels.append(game.WL == "W")
+
+    if not rows:
+        return prepare_game_features({}, {}).iloc[:0], np.array([], dtype=int), games["DATE"].iloc[:0]
+    return pd.concat(rows, ignore_index=True), np.array(labels, dtype=int), games["DATE"]
+
+
+def load_current_model(model_path: str) -> Optional[xgb.XGBClassifier]:
+    """The served model, or None if there is no usable model file yet"""
+    if not os.path.exists(model_path) or os.path.getsize(model_path) == 0:
+        return None
+    model = xgb.XGBClassifier()
+    try:
+        model.load_model(model_path)
+    except (xgb.core.XGBoostError, ValueError) as e:
+        print(f"Could not load {model_path}: {e}")
+        return None
+    return model
+
+
+def continue_training(
+    current: Optional[xgb.XGBClassifier],
+    X: pd.DataFrame,
+    y: np.ndarray,
+    rounds: int = 20,
+    learning_rate: float = 0.05
+) -> xgb.XGBClassifier:
+    """
+    Add `rounds` trees fitted on the new games to the current model
+
+    The existing trees are kept as they are; the new ones correct the
+    current model's errors on recent games. A low learning rate keeps one
+    night of games from swinging the model. Without a current model a new
+    one is started from these games (main() only allows that with
+    --bootstrap and at least BOOTSTRAP_MIN_GAMES games).
+
+    Args:
+        current: Served model, or None
+        X: Features of the new games
+        y: Home-win labels
+        rounds: Trees to add
+        learning_rate: Shrinkage of the added trees
+
+    Returns:
+        Model with the added trees
+    """
+    model = xgb.XGBClassifier(
+        objective="binary:logistic",
+        n_estimators=rounds,
+        learning_rate=learning_rate,
+        max_depth=4,
+        subsample=0.8,
+        colsample_bytree=0.8,
+        tree_method="hist",
+        random_state=42,
+        eval_metric="logloss",
+    )
+    model.fit(X, y, xgb_model=current.get_booster() if current is not None else None)
+    return model
+
+
+def evaluate(model: xgb.XGBClassifier, X: pd.DataFrame, y: np.ndarray) -> Dict[str, float]:
+    """Log loss and accuracy of home-win probabilities"""
+    probability = model.predict_proba(X)[:, 1]
+    return {
+        "log_loss": float(log_loss(y, probability, labels=[0, 1])),
+        "accuracy": float(accuracy_score(y, probability > 0.5)),
+    }
+
+
+def publish(model: xgb.XGBClassifier, model_path: str, state: Dict[str, Any]):
+    """
+    Replace the served model and its state file atomically
+
+    Both are written to temporary files in the same directory and renamed,
+    so a worker never reads a partially written model.
+    """
+    root, extension = os.path.splitext(model_path)
+    staged = f"{root}.staged{extension}"
+    model.save_model(staged)
+    os.replace(staged, model_path)
+
+    staged_state = state_path(model_path) + ".staged"
+    with open(staged_state, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(staged_state, state_path(model_path))
+
+
+def main():
+    """
+    Add trees for newly finished games to the game model and publish it
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--game-logs", help="CSV of TeamGameLog rows instead of fetching them "
+                                            "(include the season before the window, for Elo)")
+    parser.add_argument("--since", type=date.fromisoformat,
+                        help="Last date already covered (default: from the state file)")
+    parser.add_argument("--until", type=date.fromisoformat,
+                        help="Last date to include (default: yesterday)")
+    parser.add_argument("--days", type=int, default=1,
+                        help="Days to cover when there is no state file and no --since")
+    parser.add_argument("--rounds", type=int, default=20, help="Trees to add")
+    parser.add_argument("--learning-rate", type=float, default=0.05)
+    parser.add_argument("--min-games", type=int, default=10,
+                        help="Wait for at least this many new games before updating")
+    parser.add_argument("--bootstrap", action="store_true",
+                        help="Start a new model when there is none to continue from "
+                             f"(needs at least {BOOTSTRAP_MIN_GAMES} games, e.g. --since the season start)")
+    parser.add_argument("--dry-run", action="store_true", help="Train and report without publishing")
+    args = parser.parse_args()
+
+    print("Incremental Game Model Update")
+    print("=" * 50)
+    started = time.perf_counter()
+
+    state = load_state(args.model)
+    until = args.until or datetime.now().date() - timedelta(days=1)
+    if args.since:
+        since = args.since
+    elif state.get("last_game_date"):
+        since = date.fromisoformat(state["last_game_date"])
+    else:
+        since = until - timedelta(days=args.days)
+    if since >= until:
+        print(f"Already up to date through {since}")
+        return
+
+    if args.game_logs:
+        team_logs = pd.read_csv(args.game_logs)
+    else:
+        team_logs = fetch_team_logs(training_seasons(since, until))
+    X, y, dates = build_game_rows(team_logs, since, until)
+    print(f"{len(y)} games finished after {since} through {until} "
+          f"({time.perf_counter() - started:.1f}s to build features)")
+
+    if len(y) < args.min_games or len(set(y)) < 2:
+        print(f"Waiting for more games (need {args.min_games} with both outcomes); state unchanged")
+        return
+
+    current = load_current_model(args.model)
+    if current is not None and current.get_booster().feature_names != list(X.columns):
+        # New trees cannot extend a model on other features, and one night of
+        # games is too little to replace it: the features changed, so retrain
+        print(f"The model at {args.model} was trained on different features than this version "
+              f"builds; run train_model.py to retrain it on the full history")
+        sys.exit(1)
+    if current is None:
+        if not args.bootstrap:
+            print(f"No usable model at {args.model} to continue from. Train one with train_model.py, "
+                  f"or pass --bootstrap with at least {BOOTSTRAP_MIN_GAMES} games")
+            sys.exit(1)
+        if len(y) < BOOTSTRAP_MIN_GAMES:
+            print(f"--bootstrap needs at least {BOOTSTRAP_MIN_GAMES} games, got {len(y)}; "
+                  f"widen the window with --since")
+            sys.exit(1)
+        print(f"No usable model to continue from; bootstrapping a new one from {len(y)} games")
+    else:
+        print(f"Current model {model_file_version(args.model)}: "
+              f"{current.get_booster().num_boosted_rounds()} trees")
+        # The new games are unseen by the current model: an honest staleness check
+        print(f"Current model on new games: {evaluate(current, X, y)}")
+
+    start = time.perf_counter()
+    model = continue_training(current, X, y, args.rounds, args.learning_rate)
+    print(f"Added {args.rounds} trees in {time.perf_counter() - start:.1f}s "
+          f"({model.get_booster().num_boosted_rounds()} total)")
+    print(f"Updated model on new games (in-sample): {evaluate(model, X, y)}")
+
+    if args.dry_run:
+        print("\nDry run: model not published")
+        return
+
+    last_game_date = dates.max().date()
+    publish(model, args.model, {
+        "last_game_date": last_game_date.isoformat(),
+        "games_added": int(state.get("games_added", 0)) + len(y),
+        "trees": model.get_booster().num_boosted_rounds(),
+        "updated_at": datetime.utcnow().isoformat(timespec="seconds"),
+    })
+    print(f"\nPublished {model_file_version(args.model)} to {args.model} "
+          f"(covers games through {last_game_date}) in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()